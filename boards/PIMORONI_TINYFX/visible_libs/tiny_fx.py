@@ -30,11 +30,12 @@ class TinyFX:
 
     OUTPUT_GAMMA = 2.8
     RGB_GAMMA = 2.2
+    RGB_BALANCE = (1.0, 1.0, 1.0)
 
     def __init__(self, init_i2c=True, init_wav=True, wav_root="/"):
         # Set up the mono and RGB LED outputs
         self.outputs = [PWMLED(out, gamma=self.OUTPUT_GAMMA) for out in self.OUT_PINS]
-        self.rgb = RGBLED(*self.RGB_PINS, invert=False, gamma=self.RGB_GAMMA)
+        self.rgb = RGBLED(*self.RGB_PINS, invert=False, gamma=self.RGB_GAMMA, balance=self.RGB_BALANCE)
 
         # Set up the i2c for Qw/st, if the user wants
         if init_i2c:
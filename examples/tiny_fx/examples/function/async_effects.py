@@ -0,0 +1,55 @@
+import asyncio
+
+from tiny_fx import TinyFX
+
+from picofx import ColourPlayer, MonoPlayer
+from picofx.colour import RainbowFX
+from picofx.mono import PulseWaveFX
+
+"""
+Play effects on TinyFX's outputs as asyncio tasks, leaving the
+board free to do other work, such as reading the Boot button,
+while the effects play.
+
+Press "Boot" to exit the program.
+"""
+
+# Constants
+FPS = 100               # How many times per second to update the effects
+CHECK_INTERVAL = 0.1    # How often to check the Boot button, in seconds
+
+# Variables
+tiny = TinyFX()                      # Create a new TinyFX object to interact with the board
+player = MonoPlayer(tiny.outputs)    # Create a new effect player to control TinyFX's mono outputs
+rgb_player = ColourPlayer(tiny.rgb)  # Create a new effect player to control TinyFX's rgb output
+
+
+# Create and set up the effects to play
+wave = PulseWaveFX(speed=1.0, length=6.0)
+player.effects = [wave(i) for i in range(6)]
+rgb_player.effects = RainbowFX(speed=0.2)
+
+# Have the RGB player run in sync with the Mono player
+player.pair(rgb_player)
+
+
+# Wait until the "Boot" button is pressed, giving the effects time to play between checks
+async def wait_for_boot():
+    while not tiny.boot_pressed():
+        await asyncio.sleep(CHECK_INTERVAL)
+    player.stop()
+
+
+async def main():
+    # Run the effects and the button check side by side, until both have finished
+    await asyncio.gather(player.run(FPS), wait_for_boot())
+
+
+# Wrap the code in a try block, to catch any exceptions (including KeyboardInterrupt)
+try:
+    asyncio.run(main())
+
+# Stop any running effects and turn off all the outputs
+finally:
+    player.stop()
+    tiny.shutdown()
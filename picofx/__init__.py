@@ -2,10 +2,18 @@
 #
 # SPDX-License-Identifier: MIT
 
+import time
+from array import array
+
 from machine import PWM, Pin, Timer
 
 PICOFX_VERSION = "1.1.1"
 
+# Cycling effects track their phase as an integer, where PHASE_ONE is one whole cycle
+PHASE_BITS = 16
+PHASE_ONE = 1 << PHASE_BITS
+PHASE_MASK = PHASE_ONE - 1
+
 
 def rgb_from_hsv(h, s, v):
     if s == 0.0:
@@ -30,16 +38,127 @@ def rgb_from_hsv(h, s, v):
             return v, p, q
 
 
+def _rgb_from_hsv_packed(h, s, v):
+    # The integer maths shared by rgb_from_hsv_int and rgb_from_hsv_into, returning the red, green, and blue
+    # packed into one int as 0xRRGGBB. This stays a small int on MicroPython, so unlike a tuple creates nothing.
+    # A saturation or value outside of 0 to 255 is clamped, so each component always fits in a byte
+    if s < 0:
+        s = 0
+    elif s > 255:
+        s = 255
+    if v < 0:
+        v = 0
+    elif v > 255:
+        v = 255
+
+    if s == 0:
+        return (v << 16) | (v << 8) | v
+
+    h6 = (h & PHASE_MASK) * 6
+    i = h6 >> PHASE_BITS
+    f = ((h6 & PHASE_MASK) + 128) >> 8   # Rounded, so 0 to 256
+
+    vs = v * s
+    p = v - ((vs + 127) // 255)
+    q = v - ((vs * f + 32640) // 65280)
+    t = v - ((vs * (256 - f) + 32640) // 65280)
+
+    if i == 0:
+        return (v << 16) | (t << 8) | p
+    elif i == 1:
+        return (q << 16) | (v << 8) | p
+    elif i == 2:
+        return (p << 16) | (v << 8) | t
+    elif i == 3:
+        return (p << 16) | (q << 8) | v
+    elif i == 4:
+        return (t << 16) | (p << 8) | v
+    return (v << 16) | (p << 8) | q
+
+
+def rgb_from_hsv_int(h, s, v):
+    # An integer only version of rgb_from_hsv, taking a 16-bit hue (that wraps, like a phase),
+    # and 8-bit saturation and value, and returning an 8-bit red, green, and blue
+    rgb = _rgb_from_hsv_packed(h, s, v)
+    return rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF
+
+
+def rgb_from_hsv_into(buffer, index, h, s, v):
+    # The same as rgb_from_hsv_int, but writing the red, green, and blue into
+    # the buffer from the given index, rather than returning a new tuple
+    rgb = _rgb_from_hsv_packed(h, s, v)
+    buffer[index] = rgb >> 16
+    buffer[index + 1] = (rgb >> 8) & 0xFF
+    buffer[index + 2] = rgb & 0xFF
+
+
 # A basic wrapper for PWM with regular on/off and toggle functions from Pin
 # Intended to be used for driving LEDs with brightness control & compatibility with Pin
 class PWMLED:
-    def __init__(self, pin, invert=False, gamma=1):
+    DEFAULT_RESOLUTION = 1024
+
+    __tables = {}
+
+    def __init__(self, pin, invert=False, gamma=1, resolution=DEFAULT_RESOLUTION):
         self.__gamma = gamma
+        self.__resolution = resolution
+        self.__table = None     # Built on the first brightness, as LEDs driven by duty alone never use it
         self.__led = PWM(Pin(pin), freq=1000, duty_u16=0, invert=invert)
+        self.__level = 0        # The level of the table last shown, or None once a raw duty has replaced it
+        self.__duty = 0         # The last duty written to the PWM, which starts at zero
+        self.__written = 0
+        self.__skipped = 0
+
+    @staticmethod
+    def gamma_table(gamma, resolution=DEFAULT_RESOLUTION):
+        # Tables are built once per gamma and resolution, and shared by every LED that uses them
+        key = (gamma, resolution)
+        table = PWMLED.__tables.get(key)
+        if table is None:
+            table = array("H")
+            for i in range(resolution + 1):
+                table.append(int(pow(i / resolution, gamma) * 65535 + 0.5))
+            PWMLED.__tables[key] = table
+        return table
+
+    @property
+    def gamma(self):
+        return self.__gamma
 
     def brightness(self, brightness):
-        self.__brightness = min(1.0, max(0.0, brightness))
-        self.__led.duty_u16(int(pow(self.__brightness, self.__gamma) * 65535 + 0.5))
+        level = int(brightness * self.__resolution + 0.5)
+        if level < 0:
+            level = 0
+        elif level > self.__resolution:
+            level = self.__resolution
+
+        table = self.__table
+        if table is None:
+            table = self.__table = PWMLED.gamma_table(self.__gamma, self.__resolution)
+
+        self.__level = level
+        self.__write(table[level])
+
+    def duty(self, duty):
+        # Write a raw 16-bit duty, for callers that have already done their own gamma correction
+        self.__level = None
+        self.__write(duty)
+
+    def __write(self, duty):
+        # Only cross into the PWM driver if the output would actually change
+        if duty == self.__duty:
+            self.__skipped += 1
+        else:
+            self.__led.duty_u16(duty)
+            self.__duty = duty
+            self.__written += 1
+
+    def write_stats(self, reset=False):
+        stats = (self.__written, self.__skipped)
+        if reset:
+            self.__written = 0
+            self.__skipped = 0
+        return stats
 
     def on(self):
         self.brightness(1)
@@ -48,25 +167,81 @@ class PWMLED:
         self.brightness(0)
 
     def toggle(self):
-        self.brightness(1 - self.__brightness)
+        level = self.__level
+        if level is None:
+            # A raw duty was written last, so find the level that gives it under this LED's gamma
+            level = int(pow(self.__duty / 65535, 1 / self.__gamma) * self.__resolution + 0.5)
+        self.brightness((self.__resolution - level) / self.__resolution)
+
+
+def _byte(value):
+    # Convert a colour component to a whole number from 0 to 255, for indexing into a table
+    if not isinstance(value, int):
+        value = int(value + 0.5)
+    if value < 0:
+        return 0
+    if value > 255:
+        return 255
+    return value
 
 
 class RGBLED:
-    def __init__(self, r, g, b, invert=True, gamma=1):
-        self.led_r = r if isinstance(r, PWMLED) else PWMLED(r, invert=invert, gamma=gamma)
-        self.led_g = g if isinstance(g, PWMLED) else PWMLED(g, invert=invert, gamma=gamma)
-        self.led_b = b if isinstance(b, PWMLED) else PWMLED(b, invert=invert, gamma=gamma)
+    __tables = {}
 
-    def __rgb(self, r, g, b):
-        self.led_r.brightness(r)
-        self.led_g.brightness(g)
-        self.led_b.brightness(b)
+    def __init__(self, r, g, b, invert=True, gamma=1, resolution=PWMLED.DEFAULT_RESOLUTION, balance=(1.0, 1.0, 1.0), scale=1.0):
+        self.led_r = r if isinstance(r, PWMLED) else PWMLED(r, invert=invert, gamma=gamma, resolution=resolution)
+        self.led_g = g if isinstance(g, PWMLED) else PWMLED(g, invert=invert, gamma=gamma, resolution=resolution)
+        self.led_b = b if isinstance(b, PWMLED) else PWMLED(b, invert=invert, gamma=gamma, resolution=resolution)
+        self.__gamma = gamma
+        self.__balance = balance
+        self.__scale = scale
+
+        # Any PWMLEDs that were given keep the gamma they were created with
+        self.__gammas = (self.led_r.gamma, self.led_g.gamma, self.led_b.gamma)
+        self.__build_tables()
+
+    @staticmethod
+    def channel_table(gamma, level=1.0):
+        # Tables map an 8-bit colour component straight to a 16-bit duty, with the gamma and the channel's
+        # level baked in. They are built once per gamma and level, and shared by every LED that uses them
+        key = (gamma, level)
+        table = RGBLED.__tables.get(key)
+        if table is None:
+            table = array("H")
+            for i in range(256):
+                table.append(min(int(pow(i / 255, gamma) * level * 65535 + 0.5), 65535))
+            RGBLED.__tables[key] = table
+        return table
+
+    def calibrate(self, gamma=None, balance=None, scale=None):
+        # Change any of the gamma, the white balance of each channel, or the overall scale, leaving the rest as they were
+        if gamma is not None:
+            self.__gamma = gamma
+            self.__gammas = (gamma, gamma, gamma)
+        if balance is not None:
+            self.__balance = balance
+        if scale is not None:
+            self.__scale = scale
+        self.__build_tables()
+
+    def calibration(self):
+        return self.__gamma, self.__balance, self.__scale
+
+    def __build_tables(self):
+        r, g, b = self.__balance
+        gamma_r, gamma_g, gamma_b = self.__gammas
+        self.__table_r = RGBLED.channel_table(gamma_r, r * self.__scale)
+        self.__table_g = RGBLED.channel_table(gamma_g, g * self.__scale)
+        self.__table_b = RGBLED.channel_table(gamma_b, b * self.__scale)
 
     def set_rgb(self, r, g, b):
-        self.__rgb(r / 255, g / 255, b / 255)
+        self.led_r.duty(self.__table_r[_byte(r)])
+        self.led_g.duty(self.__table_g[_byte(g)])
+        self.led_b.duty(self.__table_b[_byte(b)])
 
     def set_hsv(self, h, s, v):
-        self.__rgb(*rgb_from_hsv(h, s, v))
+        r, g, b = rgb_from_hsv(h, s, v)
+        self.set_rgb(r * 255, g * 255, b * 255)
 
 
 class Updateable:
@@ -81,25 +256,57 @@ class Updateable:
 
 
 class Cycling(Updateable):
+    # The phase is accumulated in thousandths, so that ticks in milliseconds advance it exactly. The speed
+    # is held to a further 16 bits below that, in a second accumulator whose overflow is carried into the
+    # first, so it is rounded to no more than 2^-33 of a cycle per second, even at very slow speeds. Both
+    # accumulators stay within MicroPython's small int range for ticks of up to 16 seconds, so ticking
+    # does not allocate
+    _WRAP = PHASE_ONE * 1000
+
     def __init__(self, speed):
         self.speed = speed
-        self.__offset_ms = 0
-        self.__offset = 0
+        self._accum = 0
+        self._fraction = 0
+        self._phase = 0
+
+    @property
+    def speed(self):
+        return self.__speed
+
+    @speed.setter
+    def speed(self, speed):
+        self.__speed = speed
+        # How far the phase moves per second, split into whole thousandths and the 16 bits below them
+        step = round(speed * (PHASE_ONE << 16))
+        self._step = step >> 16
+        self._step_fraction = step & 0xFFFF
+
+    @property
+    def offset(self):
+        # The phase as a fraction of a cycle, from 0.0 up to 1.0, as effects read it before the phase was an integer
+        return self._phase / PHASE_ONE
 
     def tick(self, delta_ms):
-        self.__offset_ms = (self.__offset_ms + int(delta_ms * self.speed)) % 1000
-        self.__offset = self.__offset_ms / 1000
+        fraction = self._fraction + delta_ms * self._step_fraction
+        self._fraction = fraction & 0xFFFF
+        self._accum = accum = (self._accum + delta_ms * self._step + (fraction >> 16)) % self._WRAP
+        self._phase = accum // 1000
+
+    def phase_after(self, delta_ms):
+        # The phase that ticking by the given time would give, without ticking. This is plain arithmetic,
+        # so on the host it also works for a NumPy array of times, giving the phase after each
+        fraction = self._fraction + delta_ms * self._step_fraction
+        return ((self._accum + delta_ms * self._step + (fraction >> 16)) % self._WRAP) // 1000
 
     def reset(self):
-        self.__offset_ms = 0
-        self.__offset = 0
+        self._accum = 0
+        self._fraction = 0
+        self._phase = 0
 
 
-class CyclingAction(Updateable):
+class CyclingAction(Cycling):
     def __init__(self, speed):
-        self.speed = speed
-        self.__offset_ms = 0
-        self.__offset = 0
+        super().__init__(speed)
 
     def next(self):
         pass
@@ -108,174 +315,1188 @@ class CyclingAction(Updateable):
         pass
 
     def tick(self, delta_ms):
-        self.__offset_ms += int(delta_ms * self.speed)
-        if self.__offset_ms >= 1000:
-            self.__offset_ms -= 1000
+        fraction = self._fraction + delta_ms * self._step_fraction
+        self._fraction = fraction & 0xFFFF
+        accum = self._accum + delta_ms * self._step + (fraction >> 16)
+        while accum >= self._WRAP:
+            accum -= self._WRAP
             self.next()
-        elif self.__offset_ms < 0:
-            self.__offset_ms += 1000
+
+        while accum < 0:
+            accum += self._WRAP
             self.prev()
 
-        self.__offset = self.__offset_ms / 1000
+        self._accum = accum
+        self._phase = accum // 1000
+
+
+class CyclingWave(Cycling):
+    def __init__(self, speed, length):
+        super().__init__(speed)
+        self.length = length
+
+    def __call__(self, pos):
+        return self, self.at, pos
+
+    def at(self, pos):
+        pass
+
+    def bind(self, positions):
+        # Precompute the phase of each position along the wave. The returned binding is what
+        # gets passed to render(), letting a player fill a whole range of outputs in one call
+        return [self.length, tuple(positions), self.__phases(positions)]
+
+    def __phases(self, positions):
+        return [int(pos * PHASE_ONE / self.length) for pos in positions]
+
+    def _bound_phases(self, binding):
+        # Only recalculate the phases if the wave's length was changed since they were bound
+        if binding[0] != self.length:
+            binding[0] = self.length
+            binding[2] = self.__phases(binding[1])
+        return binding[2]
+
+
+def _bind(effect, data):
+    # Bind any data to the effect up front, so the player's frame loop only makes zero-argument calls
+    if not data:
+        return effect
+
+    if len(data) == 1:
+        arg = data[0]
+
+        def fx():
+            return effect(arg)
+        return fx
+
+    def fx():
+        return effect(*data)
+    return fx
+
+
+def parse_entry(item):
+    # Split an item of a player's effect list into its effect function, the data to call it with, and the
+    # Updateable to tick for it, as (effect, data, updateable). Parts the item does not have are None, or ()
+    effect = None
+    data = ()
+    updateable = None
+
+    # Skip the item if it is none
+    if item is None:
+        pass
+
+    # Is the item on its own and callable?
+    elif callable(item):
+        # It must therefore be an effect function
+        effect = item
+
+        # Is the effect an Updateable class too?
+        if isinstance(item, Updateable):
+            updateable = item
+
+    # Is the item a tuple?
+    elif isinstance(item, tuple):
+        first, *rest = item
+
+        # Is the first element an Updateable class?
+        if isinstance(first, Updateable):
+            updateable = first
+
+            # Are there are other elements, and is the second element callable?
+            if rest and callable(rest[0]):
+                # Assume the effect function is the second element, and the first is its parent class. All elements that follow are data
+                effect = rest[0]
+                data = tuple(rest[1:])
+            else:
+                # The first element is both the effect function and Updateable class. All elements that follow are data
+                effect = first
+                data = tuple(rest)
+
+        # Is the first element only callable?
+        elif callable(first):
+            # It must therefore be an effect function. All elements that follow are data
+            effect = first
+            data = tuple(rest)
+
+    return effect, data, updateable
+
+
+class FrameStats:
+    # The upper bounds, in microseconds, of how far the time between frames can stray from
+    # the player's period for each bucket of the jitter histogram. A final bucket counts the rest
+    JITTER_BUCKETS = (250, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.overruns = 0
+        self.min_us = 0
+        self.max_us = 0
+        self.total_us = 0       # The time spent producing frames, split below into ticking and showing
+        self.tick_us = 0
+        self.show_us = 0
+        self.intervals = 0
+        self.interval_ms = 0    # The time between frames, kept in milliseconds so it is slow to overflow
+        self.jitter = [0] * (len(FrameStats.JITTER_BUCKETS) + 1)
+
+    def record(self, tick_us, show_us, period_us):
+        frame_us = tick_us + show_us
+        if self.frames == 0 or frame_us < self.min_us:
+            self.min_us = frame_us
+        if frame_us > self.max_us:
+            self.max_us = frame_us
+
+        self.frames += 1
+        self.total_us += frame_us
+        self.tick_us += tick_us
+        self.show_us += show_us
+
+        # A frame that takes longer than the period leaves no time for anything else, and delays the next
+        if frame_us > period_us:
+            self.overruns += 1
+
+    def record_interval(self, interval_us, delta_ms, period_us):
+        self.intervals += 1
+        self.interval_ms += delta_ms
+
+        jitter_us = abs(interval_us - period_us)
+        bucket = 0
+        for bound in FrameStats.JITTER_BUCKETS:
+            if jitter_us <= bound:
+                break
+            bucket += 1
+        self.jitter[bucket] += 1
+
+    def mean_us(self):
+        return self.total_us // self.frames if self.frames > 0 else 0
+
+    def fps(self):
+        # The rate frames were really produced at, rather than the rate that was asked for
+        return (self.intervals * 1000) / self.interval_ms if self.interval_ms > 0 else 0.0
+
+
+def _label(effect):
+    # A readable name for an effect, whether it is a class instance or a plain function
+    name = getattr(effect, "__name__", None)
+    return name if name is not None else type(effect).__name__
+
+
+class EffectProfiler:
+    def __init__(self, clock):
+        self.__clock = clock
+        self.__entries = []     # Lists of [name, calls, total_us], in the order they were added
 
     def reset(self):
-        self.__offset_ms = 0
-        self.__offset = 0
+        for entry in self.__entries:
+            entry[1] = 0
+            entry[2] = 0
+
+    def clear(self):
+        self.__entries = []
+
+    def timed(self, name, func):
+        # Wrap a function so that each call is counted and timed against the given name
+        clock = self.__clock
+        entry = [name, 0, 0]
+        self.__entries.append(entry)
+
+        def wrapper(*args):
+            start = clock.ticks_us()
+            result = func(*args)
+            entry[1] += 1
+            entry[2] += clock.ticks_diff(clock.ticks_us(), start)
+            return result
+        return wrapper
+
+    def report(self):
+        # Return (name, calls, total_us, mean_us) for everything timed, with the costliest first
+        rows = [(name, calls, total_us, total_us // calls if calls > 0 else 0) for name, calls, total_us in self.__entries]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def print_report(self):
+        print("{:<32} {:>8} {:>12} {:>8}".format("Name", "Calls", "Total (us)", "Mean"))
+        for name, calls, total_us, mean_us in self.report():
+            print("{:<32} {:>8} {:>12} {:>8}".format(name, calls, total_us, mean_us))
+
+
+class _FrameLED:
+    # Stands in for an LED, recording what it is set to in a frame. Used while a player renders on another thread,
+    # or when its frames are being captured, in which case what it is set to is also passed on to the real LED
+    def __init__(self, frame, index, led=None):
+        self.__frame = frame
+        self.__index = index
+        self.__led = led
+
+    def brightness(self, brightness):
+        self.__frame[self.__index] = brightness
+        if self.__led is not None:
+            self.__led.brightness(brightness)
+
+    def set_rgb(self, r, g, b):
+        frame = self.__frame
+        j = self.__index * 3
+        frame[j] = _byte(r)
+        frame[j + 1] = _byte(g)
+        frame[j + 2] = _byte(b)
+        if self.__led is not None:
+            self.__led.set_rgb(r, g, b)
+
+
+class _RenderThread:
+    # Renders a player's frames on a second thread, into a back frame that is copied to the front frame once finished.
+    # The player's timer asks for each frame, and latches the front frame to the outputs when a new one is ready
+    def __init__(self, render, back):
+        import _thread
+        self.back = back
+        self.front = back[:]
+        self.ready = False
+        self.error = None
+        self.running = True
+
+        self.go = _thread.allocate_lock()       # Released to ask for a frame
+        self.frame = _thread.allocate_lock()    # Held while the front frame is being copied to or latched
+        self.edit = _thread.allocate_lock()     # Held while the effects are being ticked and rendered
+        self.done = _thread.allocate_lock()     # Released when the thread finishes
+        self.go.acquire()
+        self.done.acquire()
+        _thread.start_new_thread(self.__loop, (render,))
+
+    def __loop(self, render):
+        try:
+            while True:
+                self.go.acquire()
+                if not self.running:
+                    break
+
+                with self.edit:
+                    render()
+
+                with self.frame:
+                    self.front[:] = self.back
+                    self.ready = True
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:  # noqa: BLE001 - handed to the player's timer, which raises it again on the first core
+            self.error = e
+        finally:
+            self.running = False
+            self.done.release()
+
+    def request(self):
+        # Only the timer releases this lock, so if it is unlocked a frame has already been asked for
+        if self.go.locked():
+            self.go.release()
+
+    def stop(self):
+        self.running = False
+        self.request()
+        self.done.acquire()
+
+
+class _Unlocked:
+    # Used in place of a lock when a player has no thread to coordinate with
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_UNLOCKED = _Unlocked()
 
 
 class EffectPlayer:
     DEFAULT_FPS = 100
 
-    def __init__(self, leds, num_leds=None):
+    # When governing its frame rate, the player reviews how long its frames take after this many frames.
+    # If they take more than HIGH_LOAD percent of the period the rate is lowered, and if they take less
+    # than LOW_LOAD percent it is raised back towards the rate it was started with
+    GOVERN_FRAMES = 25
+    HIGH_LOAD = 75
+    LOW_LOAD = 50
+
+    def __init__(self, leds, num_leds=None, clock=None):
         if num_leds is None:
-            self.__leds = leds if isinstance(leds, (tuple, list)) else [leds]
-            self.__num_leds = len(self.__leds)
+            self._leds = leds if isinstance(leds, (tuple, list)) else [leds]
+            self._num_leds = len(self._leds)
         else:
-            self.__leds = leds
-            self.__num_leds = num_leds
+            self._leds = leds
+            self._num_leds = num_leds
+
+        self.__effects = [None] * self._num_leds
+
+        # The compiled render plan. A list of (target, fx) pairs for only the occupied slots,
+        # where each fx is a zero-argument callable and each target is already resolved by the player
+        self._plan = []
+
+        # (target, rgb_into) pairs for the slots whose effect can write its colour straight into a buffer
+        self._intos = []
 
-        self.__effects = [None] * self.__num_leds
-        self.__data = [()] * self.__num_leds
-        self.__updateables = set()
+        # Runs of consecutive slots bound to the same wave effect, that are rendered in one call
+        self._batches = []
+        self._updateables = []
+        self._ticks = []            # The tick function of each updateable, in the same order
+        self.__effect_list = None   # What the effects were last set to, so the plan can be rebuilt
 
         self.__period = 1000
         self.__timer = Timer()
         self.__paired = None
         self.__running = False
 
-    def start(self, fps=DEFAULT_FPS, force=False):
+        # The clock to measure frame times with. Any object with ticks_us() and ticks_diff() will do
+        self.__clock = time if clock is None else clock
+        self.__last_us = 0
+        self.__carry_us = 0
+        self.__stats = None
+        self.__profiler = None
+
+        self.__fps = EffectPlayer.DEFAULT_FPS
+        self.__target_fps = EffectPlayer.DEFAULT_FPS
+        self.__min_fps = None       # The lowest rate the governor may drop to, or None if it is off
+        self.__rate_callback = None
+        self.__cost_us = 0          # A running average of how long each frame takes
+        self.__reviewed = 0         # Frames since the governor last reviewed the rate
+        self.__timed_by = None      # What is driving the frames, either the timer, the run() task, or a render thread
+
+        self.__show = self._show
+        self.__thread = None
+        self.__outputs = None       # The real LEDs, while a render thread has the player's LEDs recording into frames
+        self.__captured = None      # The frame that steps are recorded into, once one has been asked for
+        self.__capture_plan = None  # The (plan, intos, batches) that record into the frame as they show
+        self.__captured_for = None  # The plan the capture plan was compiled alongside, so it is rebuilt when that changes
+        self.__interval_us = None   # The measured time between frames, when a step is made by the player's own timing
+
+    def start(self, fps=DEFAULT_FPS, force=False, threaded=False):
+        if threaded and self.__paired is not None:
+            raise ValueError("a paired player cannot be rendered on a thread, so give it a thread of its own")
+
         if not self.is_running() or force:
             self.stop()
+            if threaded:
+                self.__start_thread()
+            self.__prepare(fps, self.__timer if self.__thread is None else self.__thread)
+            if self.__thread is not None:
+                # The timer only latches finished frames on this core, with the render thread doing the rest
+                self.__timer.init(mode=Timer.PERIODIC, period=self.__period, callback=self.__latch)
+            self.__running = True
 
-            self.__period = int(1000 / fps)
-            if self.__paired is not None:
-                self.__paired.__period = self.__period
+    def __start_thread(self):
+        back = self._new_frame()
+        if back is None:
+            raise ValueError("this player does not support rendering on a thread")
+
+        # Have the effects render into the back frame rather than to the real outputs
+        self.__outputs = self._leds
+        leds = self._frame_leds(back, None)
+        if leds is not None:
+            self._leds = leds
+            self.__rebuild()
+
+        self.__show = self._render
+        self.__thread = _RenderThread(self.__render_frame, back)
+
+    def __stop_thread(self):
+        thread = self.__thread
+        self.__thread = None
+        thread.stop()
+
+        self.__show = self._show
+        if self._leds is not self.__outputs:
+            self._leds = self.__outputs
+            self.__rebuild()
+        self.__outputs = None
+
+    def __rebuild(self):
+        if self.__effect_list is not None:
+            self.effects = self.__effect_list
+
+    def edit(self):
+        # Returns a lock to hold while changing effects from the main loop, so a render thread only ever
+        # sees the changes at the start of a frame. When not rendering on a thread, nothing is locked
+        return _UNLOCKED if self.__thread is None else self.__thread.edit
+
+    def __latch(self, _timer):
+        try:
+            thread = self.__thread
+            if thread.error is not None:
+                raise thread.error
+
+            if thread.ready:
+                with thread.frame:
+                    self._latch(thread.front, self.__outputs)
+                    thread.ready = False
 
+            thread.request()
+
+            # Pick up any change of rate from the governor, which runs on the render thread
+            if self.__latched_period != self.__period:
+                self.__latched_period = self.__period
+                self.__timer.init(mode=Timer.PERIODIC, period=self.__period, callback=self.__latch)
+        except BaseException as e:
+            self.stop()
+            raise e
+
+    async def run(self, fps=DEFAULT_FPS):
+        # Play the effects as an asyncio task rather than from a timer, sleeping between frames so that
+        # other tasks can run. Only imported when needed, as not every program uses asyncio
+        import asyncio
+        sleep_ms = getattr(asyncio, "sleep_ms", None)
+        if sleep_ms is None:
+            def sleep_ms(ms):
+                return asyncio.sleep(ms / 1000)
+
+        # A token for this task, so it knows to finish if the player is started again by other means
+        task = object()
+        self.stop()
+        self.__prepare(fps, task)
+        self.__running = True
+
+        clock = self.__clock
+        try:
+            # Run until stop() is called, or the task is cancelled
+            while self.__running and self.__timed_by is task:
+                start = clock.ticks_us()
+                self.__update(None)
+
+                # Sleep for what is left of the period, which is always given up to the other tasks
+                spent_ms = clock.ticks_diff(clock.ticks_us(), start) // 1000
+                await sleep_ms(max(self.__period - spent_ms, 0))
+        finally:
+            if self.__timed_by is task:
+                self.__running = False
+                self.__timed_by = None
+
+    def __prepare(self, fps, timed_by):
+        self.__timed_by = timed_by
+        self.__target_fps = fps
+        self.__cost_us = 0
+        self.__reviewed = 0
+        self.__last_us = self.__clock.ticks_us()
+        self.__carry_us = 0
+        self.__set_rate(fps)
+        self.__latched_period = self.__period
+
+    def __set_rate(self, fps):
+        self.__fps = fps
+        self.__period = int(1000 / fps)
+        if self.__paired is not None:
+            self.__paired.__fps = fps
+            self.__paired.__period = self.__period
+
+        # The run() task picks up the new period by itself
+        if self.__timed_by is self.__timer:
             self.__timer.init(mode=Timer.PERIODIC, period=self.__period, callback=self.__update)
-            self.__running = True
 
     def stop(self, reset_fx=False):
         self.__timer.deinit()
         self.__running = False
+        if self.__thread is not None:
+            self.__stop_thread()
         if reset_fx:
-            for ufx in self.__updateables:
+            for ufx in self._updateables:
                 ufx.reset()
 
     def is_running(self):
         return self.__running
 
-    def __show(self):
+    def fps(self):
+        return self.__fps
+
+    def govern(self, min_fps=None, callback=None):
+        # Let the player lower its frame rate, as far as min_fps, if its frames cannot keep up with the rate it
+        # was started at, and raise it again once they can. The callback is given the new rate on each change
+        self.__min_fps = min_fps
+        self.__rate_callback = callback
+        self.__cost_us = 0
+        self.__reviewed = 0
+
+    def _target(self, index):
+        # Resolve the output that the effect at the given index will be shown on
+        return self._leds[index]
+
+    def _renderer(self, _effect):
+        # Return the function the player can use to render many positions of the effect at once, if any
+        return None
+
+    def _batch(self, _start, _count, _render, _binding):
+        # Create the player's entry for rendering a run of slots in a single call
+        return None
+
+    def _into(self, _effect):
+        # Return the function the player can use to have the effect write its output into a buffer, if any
+        return None
+
+    def _show(self):
+        pass
+
+    def _render(self):
+        # Render a frame without showing it, for when rendering on a thread. Players that
+        # record into frames through stand-in LEDs can show as normal to do this
+        self._show()
+
+    def _new_frame(self):
+        # Return a frame to render into when rendering on a thread, or None if the player does not support it
+        return None
+
+    def _frame_leds(self, frame, leds):
+        # Return LEDs that record into the given frame, to replace the player's own, passing on to the given LEDs if any
+        return [_FrameLED(frame, i, None if leds is None else leds[i]) for i in range(self._num_leds)]
+
+    def _latch(self, frame, leds):
+        # Show a finished frame on the given LEDs
         pass
 
     def pair(self, player):
+        # A paired player would show its LEDs from the render thread, so pairing is not allowed while rendering on one
+        if self.__thread is not None and player is not None:
+            raise ValueError("cannot pair with a player that is rendering on a thread")
         self.__paired = player
 
-    def __update(self, timer):
-        try:
-            for ufx in self.__updateables:
-                ufx.tick(self.__period)
+    def collect_stats(self, enabled=True):
+        # Frame timing is off unless asked for, as measuring it adds clock reads to every frame
+        if not enabled:
+            self.__stats = None
+        elif self.__stats is None:
+            self.__stats = FrameStats()
 
-            self.__show()
+    @property
+    def stats(self):
+        return self.__stats
 
-            if self.__paired is not None:
-                self.__paired.__update(timer)
+    def profile(self, enabled=True):
+        # Profiling wraps every tick and evaluation in a timer, so is only for finding what is costly, not for shows
+        if enabled == (self.__profiler is not None):
+            return
+        self.__profiler = EffectProfiler(self.__clock) if enabled else None
+
+        # Rebuild the plan with or without the timing wrappers
+        if self.__effect_list is not None:
+            self.effects = self.__effect_list
+
+    @property
+    def profiler(self):
+        return self.__profiler
+
+    def __timed(self, func, slots, effect):
+        if self.__profiler is None:
+            return func
+        return self.__profiler.timed(f"{slots}: {_label(effect)}", func)
+
+    def __update(self, _timer):
+        try:
+            self.__render_frame()
         except BaseException as e:
             self.stop()
             raise e
 
+    def __render_frame(self):
+        # Measure how much time has really passed since the last update, rather than trusting the timer's period.
+        # Any fraction of a millisecond is carried forward, and late or missed updates get caught up in one tick
+        now = self.__clock.ticks_us()
+        interval_us = self.__clock.ticks_diff(now, self.__last_us)
+        elapsed_us = interval_us + self.__carry_us
+        self.__last_us = now
+
+        delta_ms = elapsed_us // 1000
+        self.__carry_us = elapsed_us - (delta_ms * 1000)
+
+        self.__interval_us = interval_us
+        self.step(delta_ms)
+
+    def step(self, delta_ms, frame=None):
+        # Tick the effects by the given time and show them, once, returning how long that took in microseconds.
+        # This is what the player's timer calls, but can also be called directly to drive the player from a
+        # program's own loop, or faster than real time. If given a frame, the values shown are copied into it
+        return self._step(delta_ms, frame, True)
+
+    def _step(self, delta_ms, frame, tick):
+        # The same as step(), but only ticking the effects if asked to, for a PlayerGroup that has already ticked them
+        capture = None
+        if frame is not None:
+            capture = self.__capture()
+
+        # Steps made by the player's own timing know the real time between frames, and others assume it was delta_ms
+        interval_us = self.__interval_us
+        if interval_us is None:
+            interval_us = delta_ms * 1000
+        else:
+            self.__interval_us = None
+
+        clock = self.__clock
+        start = clock.ticks_us()
+        if capture is None:
+            self.__advance(delta_ms, interval_us, tick)
+        else:
+            # Show this step through the plan that records into the frame, and then go back to the player's own
+            plan, intos, batches = self._plan, self._intos, self._batches
+            self._plan, self._intos, self._batches = capture
+            try:
+                self.__advance(delta_ms, interval_us, tick)
+            finally:
+                self._plan, self._intos, self._batches = plan, intos, batches
+        cost_us = clock.ticks_diff(clock.ticks_us(), start)
+
+        if self.__min_fps is not None:
+            self.__govern(cost_us)
+
+        if frame is not None:
+            frame[:] = self.__captured
+        return cost_us
+
+    def new_frame(self):
+        # Return a frame to give to step(), of brightnesses for mono players, or bytes of R, G, B for colour players
+        return self._new_frame()[:]
+
+    def __capture(self):
+        # Return the plan that records a step as it is shown, by putting LEDs that record the values in front of the
+        # real ones. It is kept alongside the player's own plan, and only compiled again once the effects change
+        if self.__captured is None:
+            self.__captured = self._new_frame()
+        if self.__captured_for is not self._plan:
+            self.__captured_for = self._plan
+            self.__capture_plan = None
+            leds = self._frame_leds(self.__captured, self._leds)
+            if leds is not None and self.__effect_list is not None:
+                own = self._leds
+                self._leds = leds
+                try:
+                    _, plan, intos, batches, _ = self.__compile(self.__effect_list)
+                finally:
+                    self._leds = own
+                self.__capture_plan = (plan, intos, batches)
+        return self.__capture_plan
+
+    def __govern(self, cost_us):
+        self.__cost_us += (cost_us - self.__cost_us) >> 3
+        self.__reviewed += 1
+        if self.__reviewed < EffectPlayer.GOVERN_FRAMES:
+            return
+        self.__reviewed = 0
+
+        # The rate changes in steps small enough that the load after a change stays between the two limits,
+        # so the rate settles rather than bouncing up and down. Effects keep being ticked by the real time passed
+        fps = self.__fps
+        load = (self.__cost_us * 100) // (self.__period * 1000)
+        if load > EffectPlayer.HIGH_LOAD and fps > self.__min_fps:
+            fps = max((fps * 3) // 4, self.__min_fps)
+        elif load < EffectPlayer.LOW_LOAD and fps < self.__target_fps:
+            fps = min(max((fps * 5) // 4, fps + 1), self.__target_fps)
+        else:
+            return
+
+        self.__set_rate(fps)
+        if self.__rate_callback is not None:
+            self.__rate_callback(fps)
+
+    def __advance(self, delta_ms, interval_us, tick=True):
+        stats = self.__stats
+        if stats is None:
+            if tick:
+                for ufx_tick in self._ticks:
+                    ufx_tick(delta_ms)
+
+            self.__show()
+        else:
+            clock = self.__clock
+            start = clock.ticks_us()
+            if tick:
+                for ufx_tick in self._ticks:
+                    ufx_tick(delta_ms)
+
+            ticked = clock.ticks_us()
+            self.__show()
+
+            shown = clock.ticks_us()
+            period_us = self.__period * 1000
+            stats.record(clock.ticks_diff(ticked, start), clock.ticks_diff(shown, ticked), period_us)
+            stats.record_interval(interval_us, delta_ms, period_us)
+
+        if self.__paired is not None:
+            self.__paired.__advance(delta_ms, interval_us)
+
     @property
     def effects(self):
         return tuple(self.__effects)
 
     @effects.setter
     def effects(self, effect_list):
-        effect_list = effect_list if isinstance(effect_list, list) else [effect_list] * self.__num_leds
-
-        if len(effect_list) > self.__num_leds:
-            raise ValueError(f"`effect_list` must have a length less or equal to {self.__num_leds}")
-
-        self.__updateables = set()
+        effect_list = effect_list if isinstance(effect_list, list) else [effect_list] * self._num_leds
+
+        if len(effect_list) > self._num_leds:
+            raise ValueError(f"`effect_list` must have a length less or equal to {self._num_leds}")
+
+        self.__effect_list = effect_list
+        if self.__profiler is not None:
+            self.__profiler.clear()     # Forget the timings of any previous effects
+
+        effects, plan, intos, batches, updateables = self.__compile(effect_list)
+        ticks = [self.__timed(ufx.tick, "tick", ufx) for ufx in updateables]
+
+        # Swap in the new plan all at once, so a running player never sees a partial one
+        self.__effects = effects
+        self._plan = plan
+        self._intos = intos
+        self._batches = batches
+        self._updateables = updateables
+        self._ticks = ticks
+
+    def __compile(self, effect_list):
+        # Compile the effects into a render plan for the player's current LEDs
+        effects = [None] * self._num_leds
+        plan = []
+        intos = []
+        batches = []
+        updateables = []
+        run = None     # The batchable run of slots being collected, as [wave, render, start, positions]
         for i, item in enumerate(effect_list):
-            self.__effects[i] = None
-            self.__data[i] = ()
+            effect, data, updateable = parse_entry(item)
 
-            # Skip the item if it is none
-            if item is None:
+            # Add the updateable to the tick order, if it is not already in there
+            if updateable is not None and updateable not in updateables:
+                updateables.append(updateable)
+
+            if effect is None:
                 continue
+            effects[i] = effect
+            source = effect if updateable is None else updateable
+
+            # Is the effect a position along a wave that the player can render in batches? Only the wave's own
+            # function is batched, as any other function given alongside the wave maps its values differently
+            if updateable is not None and len(data) == 1 and effect == getattr(updateable, "at", None):
+                if run is not None and run[0] is updateable and run[2] + len(run[3]) == i:
+                    run[3].append(data[0])     # Extend the current run
+                    continue
+
+                render = self._renderer(updateable)
+                if render is not None:
+                    self.__close_run(run, batches)
+                    run = [updateable, render, i, [data[0]]]
+                    continue
+
+            # Can the effect write its output straight into the player's buffer?
+            if not data:
+                into = self._into(effect)
+                if into is not None:
+                    intos.append((self._target(i), self.__timed(into, i, source)))
+                    continue
+
+            plan.append((self._target(i), self.__timed(_bind(effect, data), i, source)))
 
-            # Is the item on its own and callable?
-            if callable(item):
-                # It must therefore be an effect function
-                self.__effects[i] = item
-
-                # Is the effect an Updateable class too?
-                if isinstance(item, Updateable):
-                    self.__updateables.add(item)    # Add it to the updateables set
-
-            # Is the item a tuple?
-            elif isinstance(item, tuple):
-                first, *rest = item
-
-                # Is the first element an Updateable class?
-                if isinstance(first, Updateable):
-                    self.__updateables.add(first)   # Add it to the updateables set
-
-                    # Are there are other elements, and is the second element callable?
-                    if rest and callable(rest[0]):
-                        # Assume the effect function is the second element, and the first is its parent class. All elements that follow are data
-                        self.__effects[i] = rest[0]
-                        self.__data[i] = tuple(rest[1:])
-                    else:
-                        # The first element is both the effect function and Updateable class. All elements that follow are data
-                        self.__effects[i] = first
-                        self.__data[i] = tuple(rest)
-
-                # Is the first element only callable?
-                elif callable(first):
-                    # It must therefore be an effect function. All elements that follow are data
-                    self.__effects[i] = first
-                    self.__data[i] = tuple(rest)
-
-        # Clear out excess effects
-        if len(effect_list) < self.__num_leds:
-            for i in range(len(effect_list), self.__num_leds):
-                self.__effects[i] = None
-                self.__data[i] = ()
+        self.__close_run(run, batches)
+        return effects, plan, intos, batches, updateables
+
+    def __close_run(self, run, batches):
+        if run is None:
+            return
+
+        # Even a single slot is rendered as a batch, as this lets colour waves write into the batch's buffer
+        # rather than returning a new tuple from at() every frame
+        wave, render, start, positions = run
+        slots = start if len(positions) == 1 else f"{start}-{start + len(positions) - 1}"
+        batches.append(self._batch(start, len(positions), self.__timed(render, slots, wave), wave.bind(positions)))
 
 
 class MonoPlayer(EffectPlayer):
-    def __init__(self, mono_leds):
-        super().__init__(mono_leds)
+    def __init__(self, mono_leds, clock=None):
+        super().__init__(mono_leds, clock=clock)
+
+    def _target(self, index):
+        return self._leds[index].brightness
+
+    def _renderer(self, effect):
+        return getattr(effect, "render", None)
+
+    def _batch(self, start, count, render, binding):
+        outs = tuple(self._target(i) for i in range(start, start + count))
+        return outs, render, binding, [0.0] * count
 
-    def __show(self):
-        for i in range(self.__num_leds):
-            if self.__effects[i] is not None:
-                self.__leds[i].brightness(self.__effects[i](*self.__data[i]))
+    def _show(self):
+        for out, fx in self._plan:
+            out(fx())
+
+        for outs, render, binding, buffer in self._batches:
+            render(buffer, binding)
+            for i in range(len(outs)):
+                outs[i](buffer[i])
+
+    def _new_frame(self):
+        return [0.0] * self._num_leds
+
+    def _latch(self, frame, leds):
+        for i in range(self._num_leds):
+            leds[i].brightness(frame[i])
 
 
 class ColourPlayer(EffectPlayer):
-    def __init__(self, rgb_leds):
-        super().__init__(rgb_leds)
+    def __init__(self, rgb_leds, clock=None):
+        super().__init__(rgb_leds, clock=clock)
+
+        # Where effects that support it write their colour, before it is passed on to the LED
+        self.__colour = bytearray(3)
+
+    def _target(self, index):
+        return self._leds[index].set_rgb
+
+    def _renderer(self, effect):
+        return getattr(effect, "render_rgb", None)
+
+    def _batch(self, start, count, render, binding):
+        outs = tuple(self._target(i) for i in range(start, start + count))
+        return outs, render, binding, bytearray(count * 3)
+
+    def _into(self, effect):
+        return getattr(effect, "rgb_into", None)
+
+    def _show(self):
+        for out, fx in self._plan:
+            colours = fx()
+            if isinstance(colours, tuple):
+                out(*colours)
+            else:
+                value = int(colours * 255)
+                out(value, value, value)
+
+        colour = self.__colour
+        for out, into in self._intos:
+            into(colour, 0)
+            out(colour[0], colour[1], colour[2])
+
+        for outs, render, binding, buffer in self._batches:
+            render(buffer, binding)
+            for i in range(len(outs)):
+                j = i * 3
+                outs[i](buffer[j], buffer[j + 1], buffer[j + 2])
 
-    def __show(self):
-        for i in range(self.__num_leds):
-            if self.__effects[i] is not None:
-                colours = self.__effects[i](*self.__data[i])
-                if not isinstance(colours, tuple):
-                    colours = [int(colours * 255)] * 3
+    def _new_frame(self):
+        return bytearray(self._num_leds * 3)
 
-                self.__leds[i].set_rgb(*colours)
+    def _latch(self, frame, leds):
+        for i in range(self._num_leds):
+            j = i * 3
+            leds[i].set_rgb(frame[j], frame[j + 1], frame[j + 2])
 
 
 class StripPlayer(EffectPlayer):
-    def __init__(self, led_strip, num_leds=60):
-        super().__init__(led_strip, num_leds)
+    def __init__(self, led_strip, num_leds=60, clock=None):
+        super().__init__(led_strip, num_leds, clock)
+
+        # The frame is rendered into a buffer of three bytes (R, G, B) per LED, before being pushed to the strip
+        self.buffer = bytearray(num_leds * 3)
+        self.__view = memoryview(self.buffer)
+        self.__pushed = bytearray(num_leds * 3)     # What the strip was last given, so unchanged LEDs are not sent again
+        self.__pushes = ()              # (start, end, compare) ranges of LEDs, in the order they are pushed
+        self.__pushes_for = None        # The batches the ranges were planned for
+
+    def view(self, start=0, count=None):
+        # Return a writeable window onto the framebuffer, covering `count` LEDs from `start`
+        end = self._num_leds if count is None else start + count
+        return self.__view[start * 3:end * 3]
+
+    def fill(self, r, g, b, start=0, count=None):
+        end = self._num_leds if count is None else start + count
+        buffer = self.buffer
+        r = _byte(r)
+        g = _byte(g)
+        b = _byte(b)
+        for j in range(start * 3, end * 3, 3):
+            buffer[j] = r
+            buffer[j + 1] = g
+            buffer[j + 2] = b
+
+    def blit(self, data, start=0):
+        # Copy a buffer of R, G, B bytes into the framebuffer, starting at the given LED
+        j = start * 3
+        self.__view[j:j + len(data)] = data
+
+    def copy(self, src, dst, count):
+        # Copy a range of LEDs within the framebuffer. The ranges are allowed to overlap
+        self.__view[dst * 3:(dst + count) * 3] = self.buffer[src * 3:(src + count) * 3]
+
+    def _target(self, index):
+        return index * 3
+
+    def _renderer(self, effect):
+        return getattr(effect, "render_rgb", None)
+
+    def _batch(self, start, count, render, binding):
+        # Batches render straight into their own window of the framebuffer
+        return render, binding, self.view(start, count), start, count
+
+    def _into(self, effect):
+        return getattr(effect, "rgb_into", None)
+
+    def _show(self):
+        self._render()
+        self._push()
+
+    def _render(self):
+        buffer = self.buffer
+        for j, fx in self._plan:
+            colours = fx()
+            if isinstance(colours, tuple):
+                # Bytes are written as they are, and anything the buffer cannot hold is rounded and clamped
+                r, g, b = colours
+                try:
+                    buffer[j] = r
+                    buffer[j + 1] = g
+                    buffer[j + 2] = b
+                except (TypeError, ValueError):
+                    buffer[j] = _byte(r)
+                    buffer[j + 1] = _byte(g)
+                    buffer[j + 2] = _byte(b)
+            else:
+                value = int(colours * 255)
+                if value < 0:
+                    value = 0
+                elif value > 255:
+                    value = 255
+                buffer[j] = value
+                buffer[j + 1] = value
+                buffer[j + 2] = value
+
+        for j, into in self._intos:
+            into(buffer, j)
+
+        for render, binding, view, _, _ in self._batches:
+            render(view, binding)
+
+    def _new_frame(self):
+        # Frames are rendered into the framebuffer as normal, so no stand-in LEDs are needed
+        return self.buffer
+
+    def _frame_leds(self, _frame, _leds):
+        return None
+
+    def _latch(self, frame, _leds):
+        self._push(frame)
+
+    def _push(self, buffer=None):
+        # Copy the frame into the strip driver's own buffer. The Plasma drivers have no call that takes a whole
+        # frame, so each LED is set in turn, and the driver sends its buffer out to the strip itself
+        if buffer is None:
+            buffer = self.buffer
+        if self.__pushes_for is not self._batches:
+            self.__plan_pushes(buffer)
+
+        # Without any batches, every LED is checked, so a frame that is the same as the last needs no more checking
+        pushed = self.__pushed
+        if not self._batches and buffer == pushed:
+            return
+
+        set_rgb = self._leds.set_rgb
+        for start, end, compare in self.__pushes:
+            if not compare:
+                for i in range(start, end):
+                    j = i * 3
+                    set_rgb(i, buffer[j], buffer[j + 1], buffer[j + 2])
+                continue
+
+            # Everything else is only sent when it has changed since it was last pushed
+            for i in range(start, end):
+                j = i * 3
+                r = buffer[j]
+                g = buffer[j + 1]
+                b = buffer[j + 2]
+                if r != pushed[j] or g != pushed[j + 1] or b != pushed[j + 2]:
+                    pushed[j] = r
+                    pushed[j + 1] = g
+                    pushed[j + 2] = b
+                    set_rgb(i, r, g, b)
+
+    def __plan_pushes(self, buffer):
+        # Waves change almost every frame, so their batches are sent without checking them against what was
+        # pushed before. LEDs given anything else, or nothing, are checked, so that those holding their colour
+        # cost no calls into the driver, and a colour set on the strip directly is kept for LEDs without an effect
+        pushes = []
+        start = 0
+        for _, _, _, first, count in sorted(self._batches, key=lambda batch: batch[3]):
+            if first > start:
+                pushes.append((start, first, True))
+            pushes.append((first, first + count, False))
+            start = first + count
+        if start < self._num_leds:
+            pushes.append((start, self._num_leds, True))
+
+        # LEDs whose batch has gone were not tracked while it was sent, so they are marked as changed
+        pushed = self.__pushed
+        for first, end, compare in self.__pushes:
+            if not compare:
+                for j in range(first * 3, end * 3, 3):
+                    pushed[j] = buffer[j] ^ 0xFF
+
+        self.__pushes = tuple(pushes)
+        self.__pushes_for = self._batches
+
+
+def _lcm(a, b):
+    x, y = a, b
+    while y:
+        x, y = y, x % y
+    return (a * b) // x
+
+
+class PlayerGroup:
+    # The group's elapsed time wraps at this mask, like ticks_ms(), so it always stays a small int.
+    # Times are only ever compared as differences, which are correct across a wrap
+    ELAPSED_MASK = (1 << 30) - 1
+
+    def __init__(self, clock=None):
+        self.__members = []         # (player, divisor, offset) for each player in the group
+        self.__sources = None       # The updateables list of each player, when the schedule was last built
+
+        # The frames of one cycle of the group, each as a tuple of (index, tick) pairs for the updateables
+        # that are due, followed by a tuple of (index, player) pairs for the players that are due to be shown
+        self.__schedule = []
+        self.__frame = 0
+        self.__updateables = []
+        self.__ticked_ms = []       # When each updateable was last ticked, so it can be given the time since
+        self.__players = []
+        self.__shown_ms = []        # When each player was last shown, so it can step by the time since
+
+        self.__period = 1000
+        self.__timer = Timer()
+        self.__running = False
+
+        self.__clock = time if clock is None else clock
+        self.__last_us = 0
+        self.__carry_us = 0
+        self.__elapsed_ms = 0
+
+    def add(self, player, divisor=1, offset=0):
+        # The player is shown every `divisor` frames of the group, starting from frame `offset`. Giving
+        # players with the same divisor different offsets spreads their work across the frames
+        if divisor < 1:
+            raise ValueError("`divisor` must be 1 or greater")
+
+        self.remove(player)
+        self.__members.append((player, divisor, offset % divisor))
+        self.__sources = None
+
+    def remove(self, player):
+        self.__members = [member for member in self.__members if member[0] is not player]
+        self.__sources = None
 
-    def __show(self):
-        for i in range(self.__num_leds):
-            if self.__effects[i] is not None:
-                colours = self.__effects[i](*self.__data[i])
-                if not isinstance(colours, tuple):
-                    colours = [int(colours * 255)] * 3
+    def start(self, fps=EffectPlayer.DEFAULT_FPS, force=False):
+        if not self.is_running() or force:
+            self.stop()
+
+            self.__period = int(1000 / fps)
+            self.__last_us = self.__clock.ticks_us()
+            self.__carry_us = 0
+            self.__timer.init(mode=Timer.PERIODIC, period=self.__period, callback=self.__update)
+            self.__running = True
+
+    def stop(self, reset_fx=False):
+        self.__timer.deinit()
+        self.__running = False
+        if reset_fx:
+            for player, _, _ in self.__members:
+                for ufx in player._updateables:
+                    ufx.reset()
+
+    def is_running(self):
+        return self.__running
+
+    def __update(self, _timer):
+        try:
+            # The same as a player's update, with the time that has really passed being measured
+            now = self.__clock.ticks_us()
+            elapsed_us = self.__clock.ticks_diff(now, self.__last_us) + self.__carry_us
+            self.__last_us = now
+
+            delta_ms = elapsed_us // 1000
+            self.__carry_us = elapsed_us - (delta_ms * 1000)
+
+            self.__advance(delta_ms)
+        except BaseException as e:
+            self.stop()
+            raise e
 
-                self.__leds.set_rgb(i, *colours)
+    def __advance(self, delta_ms):
+        if self.__stale():
+            self.__build()
+
+        mask = PlayerGroup.ELAPSED_MASK
+        elapsed_ms = (self.__elapsed_ms + delta_ms) & mask
+        self.__elapsed_ms = elapsed_ms
+        ticked_ms = self.__ticked_ms
+        shown_ms = self.__shown_ms
+
+        # Updateables shared by several players are only ticked once, with all the time since they last were
+        ticks, players = self.__schedule[self.__frame]
+        for i, tick in ticks:
+            tick((elapsed_ms - ticked_ms[i]) & mask)
+            ticked_ms[i] = elapsed_ms
+
+        # Each player then steps as normal without ticking, so its stats, profiler and governor see the frame
+        for i, player in players:
+            player._step((elapsed_ms - shown_ms[i]) & mask, None, False)
+            shown_ms[i] = elapsed_ms
+
+        self.__frame += 1
+        if self.__frame >= len(self.__schedule):
+            self.__frame = 0
+
+    def __stale(self):
+        # Players get a new updateables list whenever their effects are set, so checking these is enough
+        sources = self.__sources
+        if sources is None:
+            return True
+        members = self.__members
+        for i in range(len(members)):
+            if members[i][0]._updateables is not sources[i]:
+                return True
+        return False
+
+    def __build(self):
+        members = self.__members
+        cycle = 1
+        for _, divisor, _ in members:
+            cycle = _lcm(cycle, divisor)
+
+        # Updateables and players that were already in the group keep track of when they were last ticked or shown
+        previous = {}
+        for i in range(len(self.__updateables)):
+            previous[self.__updateables[i]] = self.__ticked_ms[i]
+        for i in range(len(self.__players)):
+            previous[self.__players[i]] = self.__shown_ms[i]
+
+        updateables = []
+        ufx_ticks = []      # The tick of the first player with each updateable, which is timed if it is profiling
+        ticked_ms = []
+        players = [player for player, _, _ in members]
+        shown_ms = [previous.get(player, self.__elapsed_ms) for player in players]
+        schedule = []
+        for frame in range(cycle):
+            due = []
+            shown = []
+            for p in range(len(members)):
+                player, divisor, offset = members[p]
+                if frame % divisor != offset:
+                    continue
+
+                shown.append((p, player))
+                for k in range(len(player._updateables)):
+                    ufx = player._updateables[k]
+                    if ufx not in updateables:
+                        updateables.append(ufx)
+                        ufx_ticks.append(player._ticks[k])
+                        ticked_ms.append(previous.get(ufx, self.__elapsed_ms))
+
+                    i = updateables.index(ufx)
+                    if i not in due:
+                        due.append(i)
+
+            ticks = tuple((i, ufx_ticks[i]) for i in due)
+            schedule.append((ticks, tuple(shown)))
+
+        self.__schedule = schedule
+        self.__updateables = updateables
+        self.__ticked_ms = ticked_ms
+        self.__players = players
+        self.__shown_ms = shown_ms
+        self.__sources = [player._updateables for player, _, _ in members]
+        self.__frame %= cycle
@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+from picofx import Updateable
+
+# A baked animation is a header, then every frame in order, then an index of where each keyframe starts.
+# Each frame is stored as its size in bytes followed by a list of operations that turn the frame before
+# it into this one. Keyframes are stored without reference to the frame before, so playback can start from them
+MAGIC = b"PFXB"
+VERSION = 1
+HEADER = "<4sBBHHHIII"      # Magic, version, channels, LEDs, fps, keyframe interval, frames, largest frame, index offset
+HEADER_SIZE = struct.calcsize(HEADER)
+
+# The channel layouts, as the number of bytes stored for each LED
+MONO = 1
+RGB = 3
+
+KEYFRAME_INTERVAL = 100
+
+# Each operation is a byte, holding its kind in the top two bits, and one less than its count in the bottom five.
+# If the LONG bit is set, the count continues into the next byte, for up to 8192
+SKIP = 0x00     # Leave the next count bytes as they were
+COPY = 0x40     # Copy count bytes from after the operation
+FILL = 0x80     # Repeat the one byte after the operation count times
+LONG = 0x20
+MAX_COUNT = 8192
+MIN_FILL = 4    # Runs of the same byte shorter than this are copied, as a fill saves nothing
+
+# The brightness of each 8-bit level, made up front so that mono playback creates no floats
+LEVELS = tuple(i / 255 for i in range(256))
+
+
+def _op(out, kind, count):
+    count -= 1
+    if count < 32:
+        out.append(kind | count)
+    else:
+        out.append(kind | LONG | (count >> 8))
+        out.append(count & 0xFF)
+
+
+def encode(frame, previous=None):
+    # Encode a frame of bytes as the operations that turn the previous frame into it. Without a previous
+    # frame, the operations build it from nothing, as is needed for a keyframe
+    out = bytearray()
+    size = len(frame)
+    i = 0
+    while i < size:
+        # Skip over what has not changed
+        if previous is not None and frame[i] == previous[i]:
+            j = i + 1
+            while j < size and j - i < MAX_COUNT and frame[j] == previous[j]:
+                j += 1
+            _op(out, SKIP, j - i)
+            i = j
+            continue
+
+        # Fill runs of the same byte
+        value = frame[i]
+        j = i + 1
+        while j < size and j - i < MAX_COUNT and frame[j] == value:
+            j += 1
+        if j - i >= MIN_FILL or previous is None and j == size:
+            _op(out, FILL, j - i)
+            out.append(value)
+            i = j
+            continue
+
+        # Copy anything else, up until the next run that can be skipped or filled
+        j = i + 1
+        while j < size and j - i < MAX_COUNT:
+            if previous is not None and frame[j] == previous[j]:
+                break
+            if j + MIN_FILL <= size and frame[j:j + MIN_FILL] == bytes((frame[j],)) * MIN_FILL:
+                break
+            j += 1
+        _op(out, COPY, j - i)
+        out.extend(frame[i:j])
+        i = j
+    return out
+
+
+class BakedWriter:
+    # Writes frames to a baked animation, given either as a path or as a file opened for writing in binary.
+    # Frames are in the same form a player's new_frame() returns, and the file is only complete once closed
+    def __init__(self, file, num_leds, channels=RGB, fps=100, keyframe_interval=KEYFRAME_INTERVAL):
+        if channels not in (MONO, RGB):
+            raise ValueError("channels must be MONO or RGB")
+        if keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be greater than zero")
+
+        self.__owned = isinstance(file, str)
+        self.__file = open(file, "wb") if self.__owned else file
+        self.num_leds = num_leds
+        self.channels = channels
+        self.fps = fps
+        self.keyframe_interval = keyframe_interval
+        self.frames = 0
+        self.__largest = 0
+        self.__keyframes = []
+        self.__offset = HEADER_SIZE
+        self.__previous = None
+
+        # The header is written again once the frames are known
+        self.__file.write(bytes(HEADER_SIZE))
+
+    def write(self, frame):
+        if self.channels == MONO:
+            frame = bytes(min(max(int(level * 255 + 0.5), 0), 255) for level in frame)
+        else:
+            frame = bytes(frame)
+        if len(frame) != self.num_leds * self.channels:
+            raise ValueError(f"frame must have {self.num_leds * self.channels} values")
+
+        keyframe = self.frames % self.keyframe_interval == 0
+        if keyframe:
+            self.__keyframes.append(self.__offset)
+        data = encode(frame, None if keyframe else self.__previous)
+
+        self.__file.write(struct.pack("<I", len(data)))
+        self.__file.write(data)
+        self.__offset += 4 + len(data)
+        self.__largest = max(self.__largest, len(data))
+        self.__previous = frame
+        self.frames += 1
+
+    def close(self):
+        if self.__file is None:
+            return
+        f = self.__file
+        f.write(struct.pack(f"<{len(self.__keyframes)}I", *self.__keyframes))
+        f.seek(0)
+        f.write(struct.pack(HEADER, MAGIC, VERSION, self.channels, self.num_leds, self.fps, self.keyframe_interval,
+                            self.frames, self.__largest, self.__offset))
+        if self.__owned:
+            f.close()
+        self.__file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def bake(player, file, frames, fps=100, keyframe_interval=KEYFRAME_INTERVAL):
+    # Record the given number of frames of a player's effects to a baked animation, stepping it as it
+    # would be at the given frame rate. The time of each step is rounded, but never drifts
+    frame = player.new_frame()
+    channels = MONO if isinstance(frame, list) else RGB
+    with BakedWriter(file, len(frame) // channels, channels, fps, keyframe_interval) as writer:
+        elapsed_ms = 0
+        for i in range(frames):
+            next_ms = ((i + 1) * 1000) // fps
+            player.step(next_ms - elapsed_ms, frame)
+            elapsed_ms = next_ms
+            writer.write(frame)
+
+
+class BakedFX(Updateable):
+    # Plays a baked animation, streaming its frames from the file as it goes. Only the current frame and
+    # the largest encoded frame are held in memory, however long the animation is
+    def __init__(self, file, loop=True):
+        self.__owned = isinstance(file, str)
+        self.__file = open(file, "rb") if self.__owned else file
+
+        # Everything is found by its offset from the start of the file
+        self.__file.seek(0)
+        header = self.__file.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE:
+            raise ValueError("file is not a baked animation")
+        magic, version, channels, num_leds, fps, keyframe_interval, frames, largest, index_offset = struct.unpack(HEADER, header)
+        if magic != MAGIC or version != VERSION or channels not in (MONO, RGB) or frames == 0:
+            raise ValueError(f"file is not a version {VERSION} baked animation")
+
+        self.channels = channels
+        self.num_leds = num_leds
+        self.fps = fps
+        self.frames = frames
+        self.loop = loop
+        self.__keyframe_interval = keyframe_interval
+        self.__index_offset = index_offset
+
+        self.__frame = bytearray(num_leds * channels)
+        self.__view = memoryview(self.__frame)
+        self.__data = bytearray(max(largest, 4))
+        self.__data_view = memoryview(self.__data)
+        self.__index = 0
+        self.__time = 0     # Kept in thousandths of a frame, so that ticks in milliseconds advance it exactly at any fps
+        self.seek(0)
+
+    @property
+    def index(self):
+        return self.__index
+
+    def __call__(self, led):
+        return self, self.at, led
+
+    def at(self, led):
+        frame = self.__frame
+        if self.channels == MONO:
+            return LEVELS[frame[led]]
+        j = led * 3
+        return frame[j], frame[j + 1], frame[j + 2]
+
+    def bind(self, positions):
+        # Runs of LEDs in order, as a player usually gives them, are copied from the frame in one go
+        positions = tuple(positions)
+        start = positions[0]
+        if positions == tuple(range(start, start + len(positions))):
+            return start, positions
+        return None, positions
+
+    def render(self, buffer, binding):
+        if self.channels != MONO:
+            raise ValueError("only mono animations can be played by a MonoPlayer")
+        frame = self.__frame
+        levels = LEVELS
+        positions = binding[1]
+        for i in range(len(positions)):
+            buffer[i] = levels[frame[positions[i]]]
+
+    def render_rgb(self, buffer, binding):
+        start, positions = binding
+        frame = self.__frame
+        if self.channels == MONO:
+            j = 0
+            for i in range(len(positions)):
+                value = frame[positions[i]]
+                buffer[j] = value
+                buffer[j + 1] = value
+                buffer[j + 2] = value
+                j += 3
+        elif start is not None:
+            buffer[:] = self.__view[start * 3:(start + len(positions)) * 3]
+        else:
+            j = 0
+            for i in range(len(positions)):
+                k = positions[i] * 3
+                buffer[j] = frame[k]
+                buffer[j + 1] = frame[k + 1]
+                buffer[j + 2] = frame[k + 2]
+                j += 3
+
+    def tick(self, delta_ms):
+        self.__time += delta_ms * self.fps
+        if self.__time < 1000:
+            return
+
+        steps = self.__time // 1000
+        self.__time -= steps * 1000
+        target = self.__index + steps
+        if target >= self.frames:
+            if not self.loop:
+                self.__time = 0
+                target = self.frames - 1
+            else:
+                target %= self.frames
+
+        # Carry on decoding up to the target, unless jumping to its keyframe would mean decoding fewer frames
+        if self.__index < target <= self.__index + (target % self.__keyframe_interval) + 1:
+            while self.__index < target:
+                self.__next()
+        elif target != self.__index:
+            self.__seek(target)
+
+    def reset(self):
+        self.seek(0)
+
+    def seek(self, index):
+        # Show the frame at the given index, from where playback then carries on
+        if not 0 <= index < self.frames:
+            raise ValueError(f"index out of range, must be from 0 to {self.frames - 1}")
+        self.__time = 0
+        self.__seek(index)
+
+    def __seek(self, index):
+        # Start from the keyframe at or before the index, and decode up to it
+        f = self.__file
+        data = self.__data
+        keyframe = index // self.__keyframe_interval
+        f.seek(self.__index_offset + keyframe * 4)
+        f.readinto(self.__data_view[:4])
+        f.seek(data[0] | (data[1] << 8) | (data[2] << 16) | (data[3] << 24))
+
+        self.__index = keyframe * self.__keyframe_interval - 1
+        while self.__index < index:
+            self.__next()
+
+    def __next(self):
+        f = self.__file
+        data = self.__data
+        view = self.__data_view
+        f.readinto(view[:4])
+        size = data[0] | (data[1] << 8) | (data[2] << 16) | (data[3] << 24)
+        f.readinto(view[:size])
+        self.__decode(size)
+        self.__index += 1
+
+    def __decode(self, size):
+        frame = self.__frame
+        frame_view = self.__view
+        data = self.__data
+        data_view = self.__data_view
+        pos = 0
+        i = 0
+        while i < size:
+            op = data[i]
+            count = op & 0x1F
+            i += 1
+            if op & LONG:
+                count = (count << 8) | data[i]
+                i += 1
+            count += 1
+
+            kind = op & 0xC0
+            if kind == COPY:
+                frame_view[pos:pos + count] = data_view[i:i + count]
+                i += count
+            elif kind == FILL:
+                value = data[i]
+                i += 1
+                for j in range(pos, pos + count):
+                    frame[j] = value
+            pos += count
+
+    def close(self):
+        if self.__owned and self.__file is not None:
+            self.__file.close()
+        self.__file = None
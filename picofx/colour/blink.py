@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: MIT
 
-from picofx import CyclingAction
+from picofx import PHASE_MASK, PHASE_ONE, CyclingAction
+
+BLACK = (0, 0, 0)
 
 
 # Derived from maltheim's example: https://forums.pimoroni.com/t/rgb-led-kit-for-tiny-fx-tutorial/25293/15
@@ -33,13 +35,19 @@ class RGBBlinkFX(CyclingAction):
         else:
             raise TypeError("colour is not a supported type. Expected a tuple of 3 numbers, a list of tuples, or None.")
 
+        # Convert the colours up front, so every call can return an existing tuple rather than creating a new one.
+        # Each component is also clamped to a byte, so it can be written straight into a player's buffer
+        self.__colours = [tuple(max(min(int(c[i]), 255), 0) for i in range(3)) for c in self.__colours]
+
     def __call__(self):
-        percent = (self.__offset + self.phase) % 1.0
-        if percent < self.duty:
-            colour = self.__colours[self.__index]
-            return int(colour[0]), int(colour[1]), int(colour[2])
+        percent = (self._phase + int(self.phase * PHASE_ONE)) & PHASE_MASK
+        if percent < self.duty * PHASE_ONE:
+            return self.__colours[self.__index]
         else:
-            return 0, 0, 0
+            return BLACK
+
+    def rgb_into(self, buffer, index):
+        buffer[index], buffer[index + 1], buffer[index + 2] = self()
 
     def next(self):
         self.__index = (self.__index + 1) % len(self.__colours)
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from picofx import rgb_from_hsv
+from picofx import PHASE_ONE, _byte, rgb_from_hsv_int
 
 
 class RGBFX:
@@ -11,10 +11,43 @@ class RGBFX:
         self.green = green
         self.blue = blue
 
+    # The colour is only recalculated after one of its components changes,
+    # so every call can return the same tuple rather than creating a new one
+    @property
+    def red(self):
+        return self.__red
+
+    @red.setter
+    def red(self, red):
+        self.__red = red
+        self.__colour = None
+
+    @property
+    def green(self):
+        return self.__green
+
+    @green.setter
+    def green(self, green):
+        self.__green = green
+        self.__colour = None
+
+    @property
+    def blue(self):
+        return self.__blue
+
+    @blue.setter
+    def blue(self, blue):
+        self.__blue = blue
+        self.__colour = None
+
     def __call__(self):
-        return max(min(self.red, 255), 0), \
-            max(min(self.green, 255), 0), \
-            max(min(self.blue, 255), 0)
+        if self.__colour is None:
+            # Components are rounded and clamped to a byte, so the colour can be written straight into a buffer
+            self.__colour = _byte(self.__red), _byte(self.__green), _byte(self.__blue)
+        return self.__colour
+
+    def rgb_into(self, buffer, index):
+        buffer[index], buffer[index + 1], buffer[index + 2] = self()
 
 
 class HSVFX:
@@ -23,6 +56,39 @@ class HSVFX:
         self.sat = sat
         self.val = val
 
+    # The colour is only recalculated after one of its components changes,
+    # so every call can return the same tuple rather than creating a new one
+    @property
+    def hue(self):
+        return self.__hue
+
+    @hue.setter
+    def hue(self, hue):
+        self.__hue = hue
+        self.__colour = None
+
+    @property
+    def sat(self):
+        return self.__sat
+
+    @sat.setter
+    def sat(self, sat):
+        self.__sat = sat
+        self.__colour = None
+
+    @property
+    def val(self):
+        return self.__val
+
+    @val.setter
+    def val(self, val):
+        self.__val = val
+        self.__colour = None
+
     def __call__(self):
-        r, g, b = rgb_from_hsv(self.hue, self.sat, self.val)
-        return int(r * 255), int(g * 255), int(b * 255)
+        if self.__colour is None:
+            self.__colour = rgb_from_hsv_int(int(self.__hue * PHASE_ONE + 0.5), int(self.__sat * 255), int(self.__val * 255))
+        return self.__colour
+
+    def rgb_into(self, buffer, index):
+        buffer[index], buffer[index + 1], buffer[index + 2] = self()
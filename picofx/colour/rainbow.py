@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from picofx import Cycling, rgb_from_hsv
+from picofx import PHASE_ONE, Cycling, CyclingWave, rgb_from_hsv_int, rgb_from_hsv_into
 
 
 class RainbowFX(Cycling):
@@ -12,22 +12,28 @@ class RainbowFX(Cycling):
         self.val = val
 
     def __call__(self):
-        r, g, b = rgb_from_hsv(self.__offset, self.sat, self.val)
-        return int(r * 255), int(g * 255), int(b * 255)
+        return rgb_from_hsv_int(self._phase, int(self.sat * 255), int(self.val * 255))
 
+    def rgb_into(self, buffer, index):
+        rgb_from_hsv_into(buffer, index, self._phase, int(self.sat * 255), int(self.val * 255))
 
-class RainbowWaveFX(Cycling):
+
+class RainbowWaveFX(CyclingWave):
     def __init__(self, speed=1, length=1, sat=1, val=1):
-        super().__init__(speed)
-        self.length = length
+        super().__init__(speed, length)
         self.sat = sat
         self.val = val
 
-    def __call__(self, pos):
-        def fx():
-            nonlocal pos
-            phase = pos / self.length
-            hue = (self.__offset + phase) % 1.0
-            r, g, b = rgb_from_hsv(hue, self.sat, self.val)
-            return int(r * 255), int(g * 255), int(b * 255)
-        return self, fx
+    def at(self, pos):
+        phase = int(pos * PHASE_ONE / self.length)
+        return rgb_from_hsv_int(self._phase + phase, int(self.sat * 255), int(self.val * 255))
+
+    def render_rgb(self, buffer, binding):
+        phases = self._bound_phases(binding)
+        offset = self._phase
+        sat = int(self.sat * 255)
+        val = int(self.val * 255)
+        j = 0
+        for i in range(len(phases)):
+            rgb_from_hsv_into(buffer, j, offset + phases[i], sat, val)
+            j += 3
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from picofx import Updateable, rgb_from_hsv
+from picofx import PHASE_ONE, Updateable, rgb_from_hsv_int
 
 
 class HueStepFX(Updateable):
@@ -15,16 +15,64 @@ class HueStepFX(Updateable):
         self.__current_step = 0
         self.__time = 0
 
+    @property
+    def interval(self):
+        return self.__interval_ms / 1000
+
+    @interval.setter
+    def interval(self, interval):
+        # Kept in whole milliseconds, so ticking does not need any floating point maths
+        self.__interval_ms = round(interval * 1000)
+
+    # The colour of every step is only recalculated after one of its components changes,
+    # so every call can return an existing tuple rather than creating a new one
+    @property
+    def start_hue(self):
+        return self.__start_hue
+
+    @start_hue.setter
+    def start_hue(self, hue):
+        self.__start_hue = hue
+        self.__colours = None
+
+    @property
+    def sat(self):
+        return self.__sat
+
+    @sat.setter
+    def sat(self, sat):
+        self.__sat = sat
+        self.__colours = None
+
+    @property
+    def val(self):
+        return self.__val
+
+    @val.setter
+    def val(self, val):
+        self.__val = val
+        self.__colours = None
+
     def __call__(self):
-        hue = (self.start_hue + (self.__current_step / self.__steps)) % 1.0
-        r, g, b = rgb_from_hsv(hue, self.sat, self.val)
-        return int(r * 255), int(g * 255), int(b * 255)
+        colours = self.__colours
+        if colours is None:
+            sat = int(self.__sat * 255)
+            val = int(self.__val * 255)
+            colours = []
+            for step in range(self.__steps):
+                hue = int((self.__start_hue + (step / self.__steps)) * PHASE_ONE + 0.5)
+                colours.append(rgb_from_hsv_int(hue, sat, val))
+            self.__colours = colours
+        return colours[self.__current_step]
+
+    def rgb_into(self, buffer, index):
+        buffer[index], buffer[index + 1], buffer[index + 2] = self()
 
     def tick(self, delta_ms):
         self.__time += delta_ms
 
         # Check if the interval has elapsed
-        if self.__time >= (self.interval * 1000):
-            self.__time -= (self.interval * 1000)
+        if self.__time >= self.__interval_ms:
+            self.__time -= self.__interval_ms
 
             self.__current_step = (self.__current_step + 1) % self.__steps
@@ -11,6 +11,7 @@ from .pulse import PulseFX, PulseWaveFX
 from .rand import RandomFX
 from .static import StaticFX
 from .traffic import TrafficLightFX
+from .waveform import WaveformFX, WaveformWaveFX
 
 MONO_EFFECTS = [
     BinaryCounterFX,
@@ -25,4 +26,6 @@ MONO_EFFECTS = [
     RandomFX,
     StaticFX,
     TrafficLightFX,
+    WaveformFX,
+    WaveformWaveFX,
 ]
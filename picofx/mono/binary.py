@@ -12,6 +12,15 @@ class BinaryCounterFX(Updateable):
         self.step = step
         self.__time = 0
 
+    @property
+    def interval(self):
+        return self.__interval_ms / 1000
+
+    @interval.setter
+    def interval(self, interval):
+        # Kept in whole milliseconds, so ticking does not need any floating point maths
+        self.__interval_ms = round(interval * 1000)
+
     def __call__(self, bit):
         def fx():
             nonlocal bit
@@ -22,6 +31,6 @@ class BinaryCounterFX(Updateable):
         self.__time += delta_ms
 
         # Check if the interval has elapsed
-        if self.__time >= (self.interval * 1000):
-            self.__time -= (self.interval * 1000)
+        if self.__time >= self.__interval_ms:
+            self.__time -= self.__interval_ms
             self.counter += self.step
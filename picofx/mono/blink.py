@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from picofx import Cycling
+from picofx import PHASE_MASK, PHASE_ONE, Cycling, CyclingWave
 
 
 class BlinkFX(Cycling):
@@ -12,21 +12,24 @@ class BlinkFX(Cycling):
         self.duty = duty
 
     def __call__(self):
-        percent = (self.__offset + self.phase) % 1.0
-        return 1.0 if percent < self.duty else 0.0
+        percent = (self._phase + int(self.phase * PHASE_ONE)) & PHASE_MASK
+        return 1.0 if percent < self.duty * PHASE_ONE else 0.0
 
 
-class BlinkWaveFX(Cycling):
+class BlinkWaveFX(CyclingWave):
     def __init__(self, speed=1, length=1, phase=0.0, duty=0.5):
-        super().__init__(speed)
-        self.length = length
+        super().__init__(speed, length)
         self.phase = phase
         self.duty = duty
 
-    def __call__(self, pos):
-        def fx():
-            nonlocal pos
-            phase = (pos / self.length)
-            percent = (self.__offset + self.phase + phase) % 1.0
-            return 1.0 if percent < self.duty else 0.0
-        return self, fx
+    def at(self, pos):
+        phase = int((pos / self.length + self.phase) * PHASE_ONE)
+        percent = (self._phase + phase) & PHASE_MASK
+        return 1.0 if percent < self.duty * PHASE_ONE else 0.0
+
+    def render(self, buffer, binding):
+        phases = self._bound_phases(binding)
+        offset = self._phase + int(self.phase * PHASE_ONE)
+        duty = self.duty * PHASE_ONE
+        for i in range(len(phases)):
+            buffer[i] = 1.0 if (offset + phases[i]) & PHASE_MASK < duty else 0.0
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from picofx import Cycling
+from picofx import PHASE_MASK, PHASE_ONE, Cycling, CyclingWave
 
 
 class FlashFX(Cycling):
@@ -25,17 +25,17 @@ class FlashFX(Cycling):
         self.__flashes = int(flashes)
 
     def __call__(self):
-        offset = (self.__offset + self.phase) % 1.0
-        if offset < self.window:
-            percent = ((offset * self.__flashes) / self.window) % 1.0
+        offset = (self._phase + int(self.phase * PHASE_ONE)) & PHASE_MASK
+        window = self.window * PHASE_ONE
+        if offset < window:
+            percent = ((offset * self.__flashes) / window) % 1.0
             return 1.0 if percent < self.duty else 0.0
         return 0.0
 
 
-class FlashSequenceFX(Cycling):
+class FlashSequenceFX(CyclingWave):
     def __init__(self, speed=1, length=1, flashes=1, window=1, phase=0.0, duty=0.5):
-        super().__init__(speed)
-        self.length = length
+        super().__init__(speed, length)
         self.flashes = flashes
         self.window = window
         self.phase = phase
@@ -52,13 +52,27 @@ class FlashSequenceFX(Cycling):
 
         self.__flashes = int(flashes)
 
-    def __call__(self, pos):
-        def fx():
-            nonlocal pos
-            phase = pos / self.length
-            offset = (self.__offset + self.phase + phase) % 1.0
-            if offset < self.window:
-                percent = ((offset * self.__flashes) / self.window) % 1.0
-                return 1.0 if percent < self.duty else 0.0
-            return 0.0
-        return self, fx
+    def at(self, pos):
+        phase = int((pos / self.length + self.phase) * PHASE_ONE)
+        offset = (self._phase + phase) & PHASE_MASK
+        window = self.window * PHASE_ONE
+        if offset < window:
+            percent = ((offset * self.__flashes) / window) % 1.0
+            return 1.0 if percent < self.duty else 0.0
+        return 0.0
+
+    def render(self, buffer, binding):
+        phases = self._bound_phases(binding)
+        start = self._phase + int(self.phase * PHASE_ONE)
+        window = self.window * PHASE_ONE
+        if window <= 0:
+            # Nothing ever falls within an empty window, as with at()
+            for i in range(len(phases)):
+                buffer[i] = 0.0
+            return
+
+        scale = self.__flashes / window
+        duty = self.duty
+        for i in range(len(phases)):
+            offset = (start + phases[i]) & PHASE_MASK
+            buffer[i] = 1.0 if offset < window and (offset * scale) % 1.0 < duty else 0.0
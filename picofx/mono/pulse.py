@@ -2,31 +2,16 @@
 #
 # SPDX-License-Identifier: MIT
 
-import math
+from picofx import wavetable
 
-from picofx import Cycling
+from .waveform import WaveformFX, WaveformWaveFX
 
 
-class PulseFX(Cycling):
+class PulseFX(WaveformFX):
     def __init__(self, speed=1, phase=0):
-        super().__init__(speed)
-        self.phase = phase
+        super().__init__(wavetable.sine, speed, phase)
 
-    def __call__(self):
-        angle = (self.__offset + self.phase) * math.pi * 2
-        return (math.sin(angle) + 1) / 2.0
 
-
-class PulseWaveFX(Cycling):
+class PulseWaveFX(WaveformWaveFX):
     def __init__(self, speed=1, length=1, phase=0.0):
-        super().__init__(speed)
-        self.length = length
-        self.phase = phase
-
-    def __call__(self, pos):
-        def fx():
-            nonlocal pos
-            phase = pos / self.length
-            angle = (self.__offset + self.phase + phase) * math.pi * 2
-            return (math.sin(angle) + 1) / 2.0
-        return self, fx
+        super().__init__(wavetable.sine, speed, length, phase)
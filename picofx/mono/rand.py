@@ -15,6 +15,15 @@ class RandomFX(Updateable):
         self.__time = 0
         self.__brightness = random.uniform(self.brightness_min, self.brightness_max)
 
+    @property
+    def interval(self):
+        return self.__interval_ms / 1000
+
+    @interval.setter
+    def interval(self, interval):
+        # Kept in whole milliseconds, so ticking does not need any floating point maths
+        self.__interval_ms = round(interval * 1000)
+
     def __call__(self):
         return self.__brightness
 
@@ -22,7 +31,7 @@ class RandomFX(Updateable):
         self.__time += delta_ms
 
         # Check if the interval has elapsed
-        if self.__time >= (self.interval * 1000):
-            self.__time -= (self.interval * 1000)
+        if self.__time >= self.__interval_ms:
+            self.__time -= self.__interval_ms
 
             self.__brightness = random.uniform(self.brightness_min, self.brightness_max)
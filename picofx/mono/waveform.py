@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from picofx import PHASE_BITS, PHASE_MASK, PHASE_ONE, Cycling, CyclingWave, wavetable
+
+# Converts from a table level to a brightness
+LEVEL_TO_BRIGHTNESS = 1 / wavetable.MAX_VALUE
+
+
+class WaveformFX(Cycling):
+    def __init__(self, shape=wavetable.sine, speed=1, phase=0.0):
+        super().__init__(speed)
+        self.shape = shape
+        self.phase = phase
+
+    @property
+    def shape(self):
+        return self.__table
+
+    @shape.setter
+    def shape(self, shape):
+        self.__table = wavetable.table(shape)
+
+    def __call__(self):
+        phase = self._phase + int(self.phase * PHASE_ONE)
+        return wavetable.sample(self.__table, phase) * LEVEL_TO_BRIGHTNESS
+
+
+class WaveformWaveFX(CyclingWave):
+    def __init__(self, shape=wavetable.sine, speed=1, length=1, phase=0.0):
+        super().__init__(speed, length)
+        self.shape = shape
+        self.phase = phase
+
+    @property
+    def shape(self):
+        return self.__table
+
+    @shape.setter
+    def shape(self, shape):
+        self.__table = wavetable.table(shape)
+
+    def at(self, pos):
+        phase = self._phase + int((pos / self.length + self.phase) * PHASE_ONE)
+        return wavetable.sample(self.__table, phase) * LEVEL_TO_BRIGHTNESS
+
+    def render(self, buffer, binding):
+        phases = self._bound_phases(binding)
+        offset = self._phase + int(self.phase * PHASE_ONE)
+        table = self.__table
+        size = len(table)
+        for i in range(len(phases)):
+            # The same as wavetable.sample(), but inlined to save a call per position
+            pos = ((offset + phases[i]) & PHASE_MASK) * size
+            j = pos >> PHASE_BITS
+            frac = (pos & PHASE_MASK) >> 8
+            a = table[j]
+            buffer[i] = (a + (((table[(j + 1) % size] - a) * frac) >> 8)) * LEVEL_TO_BRIGHTNESS
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import math
+from array import array
+
+from picofx import PHASE_BITS, PHASE_MASK
+
+DEFAULT_SIZE = 256
+MAX_VALUE = 65535
+
+__tables = {}
+
+
+# Built-in waveform shapes. Each takes a position through the cycle from 0.0 to 1.0 and returns a level from 0.0 to 1.0
+def sine(t):
+    return (math.sin(t * math.pi * 2) + 1) / 2.0
+
+
+def triangle(t):
+    return t * 2 if t < 0.5 else 2 - (t * 2)
+
+
+def saw(t):
+    return t
+
+
+def square(t):
+    return 1.0 if t < 0.5 else 0.0
+
+
+def ease(t):
+    t = triangle(t)
+    return t * t * (3 - (2 * t))
+
+
+def ease_in(t):
+    return t * t
+
+
+def ease_out(t):
+    return 1 - ((1 - t) * (1 - t))
+
+
+def build(shape, size=DEFAULT_SIZE):
+    # Sample a shape function into a new table of 16-bit levels
+    table = array("H")
+    for i in range(size):
+        level = min(1.0, max(0.0, shape(i / size)))
+        table.append(int(level * MAX_VALUE + 0.5))
+    return table
+
+
+def table(shape, size=DEFAULT_SIZE):
+    # Get the table for a shape function, building it on first use. Tables are shared by every effect that uses them.
+    # Anything that is not callable is assumed to already be a table, and is returned as is
+    if not callable(shape):
+        return shape
+
+    key = (shape, size)
+    found = __tables.get(key)
+    if found is None:
+        found = build(shape, size)
+        __tables[key] = found
+    return found
+
+
+def sample(table, phase):
+    # Look up the level at an integer phase, linearly interpolating between the table's entries
+    size = len(table)
+    pos = (phase & PHASE_MASK) * size
+    i = pos >> PHASE_BITS
+    frac = (pos & PHASE_MASK) >> 8
+    a = table[i]
+    return a + (((table[(i + 1) % size] - a) * frac) >> 8)
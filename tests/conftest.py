@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import pathlib
+import sys
+import time
+
+import pytest
+
+TESTS_DIR = pathlib.Path(__file__).parent
+REPO_DIR = TESTS_DIR.parent
+
+# Use the picofx in this repository, with the emulator's `machine` module on a board that records nothing.
+# Its timers only run when fired, as nothing attaches the board to the host's time
+sys.path.insert(0, str(REPO_DIR))
+
+from tools.emulator import board as emulator_board
+from tools.emulator import machine
+from tools.emulator.allocations import Allocations  # noqa: F401
+
+emulator_board.board = emulator_board.Board(trace=False)
+sys.modules["machine"] = machine
+
+from picofx import CyclingWave
+from picofx.mono import BinaryCounterFX, TrafficLightFX
+
+BASELINE_FILE = TESTS_DIR / "benchmarks.json"
+GOLDEN_FILE = TESTS_DIR / "goldens.bin"
+
+DELTA_MS = 10
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmark", action="store_true",
+                    help="run the benchmarks, which are skipped by default as their timings depend on the machine")
+    group.addoption("--benchmark-save", action="store_true",
+                    help="save the benchmark results as the new baseline, rather than comparing against it")
+    group.addoption("--benchmark-tolerance", type=float, default=0.5,
+                    help="how much slower than its baseline a benchmark may be before failing, as a fraction (default 0.5)")
+    group = parser.getgroup("goldens")
+    group.addoption("--golden-save", action="store_true",
+                    help="save the frames each effect shows as its new golden frames, rather than comparing against them")
+    group.addoption("--golden-tolerance", type=int, default=1,
+                    help="how many 8 bit levels a channel may differ from its golden frames by before failing (default 1)")
+
+
+class StepClock:
+    """A clock for players that advances by a fixed step every time it is read."""
+    def __init__(self, step_us=10000):
+        self.step_us = step_us
+        self.now_us = 0
+
+    def ticks_us(self):
+        self.now_us += self.step_us
+        return self.now_us
+
+    def ticks_diff(self, ticks1, ticks2):
+        return ticks1 - ticks2
+
+
+@pytest.fixture
+def clock():
+    return StepClock()
+
+
+class Strip:
+    """A stand-in for a Plasma LED strip, that keeps the last colour set for each LED."""
+    def __init__(self, num_leds):
+        self.leds = [(0, 0, 0)] * num_leds
+
+    def set_rgb(self, index, r, g, b):
+        self.leds[index] = (r, g, b)
+
+
+def entry(effect):
+    # The entry to give a player, for one output of the effect
+    if isinstance(effect, TrafficLightFX):
+        return effect.red()
+    if isinstance(effect, (BinaryCounterFX, CyclingWave)):
+        return effect(0)
+    return effect
+
+
+def frame(player):
+    # Run a single tick and show
+    player.step(DELTA_MS)
+
+
+class Benchmarks:
+    """
+    Times pieces of code and compares them against the baseline file.
+
+    Times are recorded relative to a fixed reference workload measured on
+    the same machine, so that baselines remain comparable between machines.
+    """
+    REPEATS = 7
+
+    def __init__(self, save, tolerance):
+        self.save = save
+        self.tolerance = tolerance
+        self.results = {}
+        try:
+            self.baseline = json.loads(BASELINE_FILE.read_text())
+        except FileNotFoundError:
+            self.baseline = {}
+
+    @staticmethod
+    def __reference():
+        total = 0
+        for i in range(100):
+            total += i * i
+        return total
+
+    @staticmethod
+    def __time(func, number):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        return (time.perf_counter_ns() - start) / number
+
+    def measure(self, name, func, number=200):
+        # The reference is timed alongside the benchmark, so both see the same conditions on the machine,
+        # and the best of several runs of each is taken, as the least affected by anything else happening
+        best = None
+        unit = None
+        for _ in range(self.REPEATS):
+            unit = min(unit or float("inf"), self.__time(self.__reference, 20))
+            best = min(best or float("inf"), self.__time(func, number))
+
+        cost = round(best / unit, 4)
+        self.results[name] = cost
+
+        expected = self.baseline.get(name)
+        if not self.save and expected is not None:
+            limit = expected * (1 + self.tolerance)
+            assert cost <= limit, f"{name} has regressed: costs {cost:.4f} units, against a baseline of {expected:.4f}"
+        return cost
+
+    def write(self):
+        baseline = dict(self.baseline)
+        baseline.update(self.results)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=4, sort_keys=True) + "\n")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: a benchmark, only run when given --benchmark or --benchmark-save")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Benchmarks are deselected unless asked for, so that timings on a busy machine cannot fail an ordinary run
+    if config.getoption("--benchmark") or config.getoption("--benchmark-save"):
+        return
+    selected = [item for item in items if item.get_closest_marker("benchmark") is None]
+    if len(selected) != len(items):
+        config.hook.pytest_deselected(items=[item for item in items if item.get_closest_marker("benchmark") is not None])
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+def benchmarks(request):
+    bench = Benchmarks(request.config.getoption("--benchmark-save"),
+                       request.config.getoption("--benchmark-tolerance"))
+    yield bench
+    if bench.save:
+        bench.write()
+
+
+class Goldens:
+    """Compares the frames effects show against the golden file, or collects them to save as the new goldens."""
+    def __init__(self, save, tolerance):
+        from tools import golden
+        self.golden = golden
+        self.save = save
+        self.tolerance = tolerance
+        self.results = []
+        try:
+            self.goldens = golden.load(GOLDEN_FILE)
+        except FileNotFoundError:
+            self.goldens = {}
+
+    def check(self, actual):
+        self.results.append(actual)
+        if self.save:
+            return
+        expected = self.goldens.get(actual.name)
+        if expected is None:
+            pytest.fail(f"{actual.name} has no golden frames, so run with --golden-save to record them")
+        difference = self.golden.compare(expected, actual, self.tolerance)
+        assert difference is None, f"{actual.name} differs from its golden frames at {self.golden.describe(difference)}"
+
+    def write(self):
+        goldens = dict(self.goldens)
+        goldens.update((actual.name, actual) for actual in self.results)
+        self.golden.save(GOLDEN_FILE, list(goldens.values()))
+
+
+@pytest.fixture(scope="session")
+def goldens(request):
+    checker = Goldens(request.config.getoption("--golden-save"),
+                      request.config.getoption("--golden-tolerance"))
+    yield checker
+    if checker.save:
+        checker.write()
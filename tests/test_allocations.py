@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from conftest import Allocations, Strip, entry, frame
+
+from picofx import PWMLED, RGBLED, ColourPlayer, MonoPlayer, StripPlayer, rgb_from_hsv_int, rgb_from_hsv_into
+from picofx.colour import COLOUR_EFFECTS, HSVFX, RGBFX, RainbowWaveFX
+from picofx.mono import MONO_EFFECTS, BlinkWaveFX, PulseWaveFX, StaticFX
+
+LED_COUNTS = [6, 60, 300]
+
+
+def wave_of(effect_class):
+    def effects(num_leds):
+        wave = effect_class(length=num_leds)
+        return [wave(i) for i in range(num_leds)]
+    return effects
+
+
+def shared(effects):
+    # Repeat the effects across all the outputs, with each effect shared by several outputs
+    def repeated(num_leds):
+        return [entry(effects[i % len(effects)]) for i in range(num_leds)]
+    return repeated
+
+
+MONO_CONFIGS = {
+    "static": shared([StaticFX(0.5)]),
+    "pulse_wave": wave_of(PulseWaveFX),
+    "blink_wave": wave_of(BlinkWaveFX),
+    "mixed": shared([effect_class() for effect_class in MONO_EFFECTS]),
+}
+
+COLOUR_CONFIGS = {
+    "static": shared([RGBFX(255, 128, 0), HSVFX(0.5, 1.0, 0.5)]),
+    "rainbow_wave": wave_of(RainbowWaveFX),
+    "mixed": shared([effect_class() for effect_class in COLOUR_EFFECTS]),
+}
+
+
+def check(player, effects, num_leds):
+    player.effects = effects(num_leds)
+    allocations = Allocations(lambda: frame(player))
+    assert allocations.count == 0, f"{allocations}, when a settled frame should allocate nothing"
+    assert allocations.growth == 0, f"{allocations}, when a settled frame should allocate nothing"
+
+
+def test_hsv_conversion_allocations():
+    # Writing into a buffer creates nothing, and returning a colour creates only the tuple it is returned in
+    buffer = bytearray(3)
+    assert Allocations(lambda: rgb_from_hsv_into(buffer, 0, 12345, 200, 150)).count == 0
+    assert Allocations(lambda: rgb_from_hsv_int(12345, 200, 150)).count == 1
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+@pytest.mark.parametrize("config", MONO_CONFIGS)
+def test_mono_player_allocations(clock, config, num_leds):
+    player = MonoPlayer([PWMLED(i) for i in range(num_leds)], clock=clock)
+    check(player, MONO_CONFIGS[config], num_leds)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+@pytest.mark.parametrize("config", COLOUR_CONFIGS)
+def test_colour_player_allocations(clock, config, num_leds):
+    player = ColourPlayer([RGBLED(i, i, i) for i in range(num_leds)], clock=clock)
+    check(player, COLOUR_CONFIGS[config], num_leds)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+@pytest.mark.parametrize("config", COLOUR_CONFIGS)
+def test_strip_player_allocations(clock, config, num_leds):
+    player = StripPlayer(Strip(num_leds), num_leds=num_leds, clock=clock)
+    check(player, COLOUR_CONFIGS[config], num_leds)
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import io
+
+import pytest
+from conftest import Allocations, StepClock, Strip
+
+from picofx import PWMLED, RGBLED, ColourPlayer, MonoPlayer, StripPlayer
+from picofx.baked import HEADER_SIZE, MONO, RGB, BakedFX, BakedWriter, bake, encode
+from picofx.colour import RainbowWaveFX
+from picofx.mono import BlinkFX, PulseWaveFX
+
+
+def baked(player, frames, fps=100, keyframe_interval=25):
+    file = io.BytesIO()
+    bake(player, file, frames, fps, keyframe_interval)
+    file.seek(0)
+    return file
+
+
+def recorded(player, frames, delta_ms=10):
+    frame = player.new_frame()
+    shown = []
+    for _ in range(frames):
+        player.step(delta_ms, frame)
+        shown.append(bytes(frame) if isinstance(frame, bytearray) else [round(level * 255) for level in frame])
+    return shown
+
+
+def mono_player(num_leds=6):
+    player = MonoPlayer([PWMLED(i) for i in range(num_leds)], clock=StepClock())
+    wave = PulseWaveFX(speed=0.7, length=num_leds)
+    player.effects = [wave(i) for i in range(num_leds - 1)] + [BlinkFX(speed=3)]
+    return player
+
+
+def colour_player(num_leds=12):
+    player = ColourPlayer([RGBLED(i, i, i) for i in range(num_leds)], clock=StepClock())
+    wave = RainbowWaveFX(speed=0.3, length=num_leds, val=0.8)
+    player.effects = [wave(i) for i in range(num_leds)]
+    return player
+
+
+@pytest.mark.parametrize("previous", [None, bytes(300)])
+def test_encode_round_trip(previous):
+    # Unchanged, repeated and varied bytes, in runs long enough to need long counts
+    frame = bytes(100) + bytes(range(100)) + bytes([7]) * 9000 + bytes(range(50)) * 2 + bytes([1, 1, 2, 2, 3])
+    previous = previous and frame[:150] + bytes(len(frame) - 150)
+    data = encode(frame, previous)
+    assert len(data) < 400
+
+    file = io.BytesIO()
+    with BakedWriter(file, len(frame), MONO) as writer:
+        writer.write([value / 255 for value in frame])
+    file.seek(0)
+    assert bytes(BakedFX(file)._BakedFX__frame) == frame
+
+
+def test_mono_round_trip():
+    expected = recorded(mono_player(), 120)
+    file = baked(mono_player(), 120)
+
+    effect = BakedFX(file)
+    assert (effect.channels, effect.num_leds, effect.fps, effect.frames) == (MONO, 6, 100, 120)
+    player = MonoPlayer([PWMLED(i) for i in range(6)], clock=StepClock())
+    player.effects = [effect(i) for i in range(6)]
+
+    # The first frame is shown until the first tick, so each frame is shown one step late
+    assert recorded(player, 119) == expected[1:]
+
+
+@pytest.mark.parametrize("player_class", [ColourPlayer, StripPlayer])
+def test_colour_round_trip(player_class):
+    expected = recorded(colour_player(), 120)
+    effect = BakedFX(baked(colour_player(), 120))
+    assert (effect.channels, effect.num_leds) == (RGB, 12)
+
+    if player_class is ColourPlayer:
+        player = ColourPlayer([RGBLED(i, i, i) for i in range(12)], clock=StepClock())
+    else:
+        player = StripPlayer(Strip(12), 12, clock=StepClock())
+    player.effects = [effect(i) for i in range(12)]
+    assert recorded(player, 119) == expected[1:]
+
+
+def test_positions_out_of_order():
+    effect = BakedFX(baked(colour_player(4), 10))
+    player = ColourPlayer([RGBLED(i, i, i) for i in range(4)], clock=StepClock())
+    player.effects = [effect(3), effect(2), effect(0), effect(1)]
+    frame = player.new_frame()
+    player.step(10, frame)
+    rgb = [effect.at(i) for i in range(4)]
+    assert list(frame) == [*rgb[3], *rgb[2], *rgb[0], *rgb[1]]
+
+
+def test_seek_matches_playing():
+    file = baked(colour_player(), 200)
+    played = BakedFX(file)
+    frames = [bytes(played._BakedFX__frame)]
+    for _ in range(199):
+        played.tick(10)
+        frames.append(bytes(played._BakedFX__frame))
+
+    seeker = BakedFX(file)
+    for index in (137, 0, 24, 25, 26, 199, 50):
+        seeker.seek(index)
+        assert seeker.index == index
+        assert bytes(seeker._BakedFX__frame) == frames[index]
+
+    with pytest.raises(ValueError):
+        seeker.seek(200)
+
+
+def test_looping():
+    # Ticks at a different rate to the file's fps still land on the right frames, even when skipping many
+    file = baked(mono_player(), 50, fps=40)
+    effect = BakedFX(file)
+    effect.tick(25 * 49)
+    assert effect.index == 49
+    effect.tick(25)
+    assert effect.index == 0
+    effect.tick(10)
+    effect.tick(15)
+    assert effect.index == 1
+    effect.tick(25 * 120)
+    assert effect.index == 21
+
+    effect = BakedFX(file, loop=False)
+    effect.tick(25 * 120)
+    assert effect.index == 49
+    effect.tick(25)
+    assert effect.index == 49
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        BakedFX(io.BytesIO(b"PFXG" + bytes(HEADER_SIZE)))
+    with pytest.raises(ValueError):
+        BakedWriter(io.BytesIO(), 6, channels=2)
+
+
+def test_playback_memory_is_bounded(tmp_path):
+    # Memory use depends on the size of the frames, rather than how many there are. Decoding still slices
+    # the frame and data buffers, which allocates a little on each frame, but nothing is kept
+    path = str(tmp_path / "show.bin")
+    bake(colour_player(60), path, 1000)
+
+    effect = BakedFX(path)
+    player = StripPlayer(Strip(60), 60, clock=StepClock())
+    player.effects = [effect(i) for i in range(60)]
+    allocations = Allocations(lambda: player.step(10), frames=400)
+    effect.close()
+    assert allocations.growth == 0, allocations
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from conftest import DELTA_MS, Strip, entry, frame
+
+from picofx import PWMLED, RGBLED, ColourPlayer, MonoPlayer, StripPlayer, Updateable
+from picofx.colour import COLOUR_EFFECTS, RGBFX, RainbowWaveFX
+from picofx.mono import MONO_EFFECTS, PulseWaveFX
+
+# Timings depend on the machine, so these only run when asked for with --benchmark
+pytestmark = pytest.mark.benchmark
+
+LED_COUNTS = [6, 60, 300]
+
+
+def shown(player):
+    # The call the player makes to show its only output, whether from its plan, by writing into a buffer, or as a batch
+    if player._plan:
+        return player._plan[0][1]
+
+    if player._intos:
+        into = player._intos[0][1]
+        buffer = bytearray(3)
+
+        def fx():
+            into(buffer, 0)
+        return fx
+
+    _, render, binding, buffer = player._batches[0]
+
+    def fx():
+        render(buffer, binding)
+    return fx
+
+
+@pytest.mark.parametrize("effect_class", MONO_EFFECTS, ids=lambda cls: cls.__name__)
+def test_mono_effect_call(benchmarks, effect_class):
+    player = MonoPlayer(PWMLED(0))
+    player.effects = [entry(effect_class())]
+    benchmarks.measure(f"mono/{effect_class.__name__}/call", shown(player), number=2000)
+
+
+@pytest.mark.parametrize("effect_class", COLOUR_EFFECTS, ids=lambda cls: cls.__name__)
+def test_colour_effect_call(benchmarks, effect_class):
+    player = ColourPlayer(RGBLED(0, 1, 2))
+    player.effects = [entry(effect_class())]
+    benchmarks.measure(f"colour/{effect_class.__name__}/call", shown(player), number=2000)
+
+
+@pytest.mark.parametrize("effect_class", MONO_EFFECTS + COLOUR_EFFECTS, ids=lambda cls: cls.__name__)
+def test_effect_tick(benchmarks, effect_class):
+    effect = effect_class()
+    if not isinstance(effect, Updateable):
+        pytest.skip("not an Updateable effect")
+
+    def tick():
+        effect.tick(DELTA_MS)
+    benchmarks.measure(f"effect/{effect_class.__name__}/tick", tick, number=2000)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+def test_mono_player_frame(benchmarks, clock, num_leds):
+    player = MonoPlayer([PWMLED(i) for i in range(num_leds)], clock=clock)
+    wave = PulseWaveFX(length=num_leds)
+    player.effects = [wave(i) for i in range(num_leds)]
+    benchmarks.measure(f"player/MonoPlayer/{num_leds}", lambda: frame(player), number=20)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+def test_mono_player_mixed_frame(benchmarks, clock, num_leds):
+    # Every mono effect at once, repeated across the outputs
+    player = MonoPlayer([PWMLED(i) for i in range(num_leds)], clock=clock)
+    player.effects = [entry(MONO_EFFECTS[i % len(MONO_EFFECTS)]()) for i in range(num_leds)]
+    benchmarks.measure(f"player/MonoPlayer/mixed/{num_leds}", lambda: frame(player), number=20)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+def test_colour_player_frame(benchmarks, clock, num_leds):
+    player = ColourPlayer([RGBLED(i, i, i) for i in range(num_leds)], clock=clock)
+    rainbow = RainbowWaveFX(length=num_leds)
+    player.effects = [rainbow(i) for i in range(num_leds)]
+    benchmarks.measure(f"player/ColourPlayer/{num_leds}", lambda: frame(player), number=20)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+def test_colour_player_mixed_frame(benchmarks, clock, num_leds):
+    # Every colour effect at once, repeated across the outputs
+    player = ColourPlayer([RGBLED(i, i, i) for i in range(num_leds)], clock=clock)
+    player.effects = [entry(COLOUR_EFFECTS[i % len(COLOUR_EFFECTS)]()) for i in range(num_leds)]
+    benchmarks.measure(f"player/ColourPlayer/mixed/{num_leds}", lambda: frame(player), number=20)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+def test_strip_player_frame(benchmarks, clock, num_leds):
+    player = StripPlayer(Strip(num_leds), num_leds=num_leds, clock=clock)
+    rainbow = RainbowWaveFX(length=num_leds)
+    player.effects = [rainbow(i) for i in range(num_leds)]
+    benchmarks.measure(f"player/StripPlayer/{num_leds}", lambda: frame(player), number=20)
+
+
+@pytest.mark.parametrize("num_leds", LED_COUNTS)
+def test_strip_player_steady_frame(benchmarks, clock, num_leds):
+    # Colours that hold from frame to frame, which the strip is not sent again
+    player = StripPlayer(Strip(num_leds), num_leds=num_leds, clock=clock)
+    player.effects = [RGBFX(i & 0xFF, 64, 255 - (i & 0xFF)) for i in range(num_leds)]
+    benchmarks.measure(f"player/StripPlayer/steady/{num_leds}", lambda: frame(player), number=20)
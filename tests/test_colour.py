@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from conftest import Strip, entry
+
+from picofx import PHASE_ONE, RGBLED, ColourPlayer, StripPlayer, rgb_from_hsv_int, rgb_from_hsv_into
+from picofx.colour import COLOUR_EFFECTS, HSVFX, RGBFX, HueStepFX, RainbowFX, RainbowWaveFX, RGBBlinkFX
+
+
+class LED:
+    """A stand-in for an RGBLED, that keeps the last colour set."""
+    def __init__(self):
+        self.colour = None
+
+    def set_rgb(self, r, g, b):
+        self.colour = (r, g, b)
+
+
+@pytest.mark.parametrize("sat", [0, 128, 255])
+def test_rgb_from_hsv_into(sat):
+    buffer = bytearray(5)
+    for h in range(0, PHASE_ONE, 97):
+        rgb_from_hsv_into(buffer, 1, h, sat, 200)
+        assert tuple(buffer[1:4]) == rgb_from_hsv_int(h, sat, 200)
+        assert buffer[0] == 0 and buffer[4] == 0
+
+
+def test_rgb_from_hsv_clamps():
+    # Saturations and values outside of 0 to 255 are clamped rather than overflowing a byte
+    buffer = bytearray(3)
+    for h in range(0, PHASE_ONE, 997):
+        assert rgb_from_hsv_int(h, 300, 306) == rgb_from_hsv_int(h, 255, 255)
+        assert rgb_from_hsv_int(h, -20, -5) == (0, 0, 0)
+        rgb_from_hsv_into(buffer, 0, h, 128, 400)
+        assert tuple(buffer) == rgb_from_hsv_int(h, 128, 255)
+
+
+@pytest.mark.parametrize("effect_class", COLOUR_EFFECTS, ids=lambda cls: cls.__name__)
+def test_rgb_into_matches_call(effect_class):
+    effect = effect_class()
+    if not hasattr(effect, "rgb_into"):
+        pytest.skip("effect does not write into buffers")
+
+    buffer = bytearray(6)
+    for _ in range(50):
+        if hasattr(effect, "tick"):
+            effect.tick(37)
+        effect.rgb_into(buffer, 3)
+        assert tuple(buffer[3:]) == effect()
+
+
+@pytest.mark.parametrize("effect_class", COLOUR_EFFECTS, ids=lambda cls: cls.__name__)
+def test_players_show_rgb_into(clock, effect_class):
+    effects = [entry(effect_class()) for _ in range(3)]
+    leds = [LED() for _ in range(3)]
+    colour_player = ColourPlayer(leds, clock=clock)
+    colour_player.effects = effects
+    strip = Strip(3)
+    strip_player = StripPlayer(strip, num_leds=3, clock=clock)
+    strip_player.effects = effects
+
+    expected = []
+    for effect in effects:
+        colour = effect[1](*effect[2:]) if isinstance(effect, tuple) else effect()
+        expected.append(colour if isinstance(colour, tuple) else (int(colour * 255),) * 3)
+
+    # Show the effects without ticking them, so both players see the same colours
+    colour_player._show()
+    strip_player._show()
+    assert [led.colour for led in leds] == expected
+    assert strip.leds == expected
+
+
+def test_players_show_bright_colours(clock):
+    # Effects given values above 1.0 show at full brightness, rather than overflowing a player's buffer
+    def bright():
+        return [HSVFX(0.5, 1.0, 1.2), RainbowFX(sat=0.5, val=1.1), RainbowWaveFX(length=3, val=1.5)(1),
+                HueStepFX(sat=1.5, val=2), RGBBlinkFX(colour=(300, -10, 128)), lambda: 1.2]
+
+    leds = [LED() for _ in range(6)]
+    colour_player = ColourPlayer(leds, clock=clock)
+    colour_player.effects = bright()
+    strip = Strip(6)
+    strip_player = StripPlayer(strip, num_leds=6, clock=clock)
+    strip_player.effects = bright()
+
+    for _ in range(10):
+        colour_player.step(37)
+        strip_player.step(37)
+        assert [led.colour for led in leds[:5]] == strip.leds[:5]
+    assert strip.leds[0] == rgb_from_hsv_int(PHASE_ONE // 2, 255, 255)
+    assert strip.leds[4] in ((255, 0, 128), (0, 0, 0))
+    assert strip.leds[5] == (255, 255, 255)
+
+
+def test_players_round_and_clamp_components(clock):
+    # Colours with fractional or out of range components are rounded and clamped to bytes, as set_rgb() does
+    def effects():
+        return [RGBFX(127.5, 10, 300), RGBFX(-4, 254.4, 0.6), lambda: (127.5, 300, -1), lambda: (1e3, 0.2, 99.9)]
+    expected = [(128, 10, 255), (0, 254, 1), (128, 255, 0), (255, 0, 100)]
+
+    leds = [RGBLED(i, i, i) for i in range(4)]
+    colour_player = ColourPlayer(leds, clock=clock)
+    colour_player.effects = effects()
+    frame = colour_player.new_frame()
+    colour_player.step(10, frame)
+    colour_player.step(10)
+    assert list(frame) == [c for rgb in expected for c in rgb]
+
+    strip = Strip(4)
+    strip_player = StripPlayer(strip, num_leds=4, clock=clock)
+    strip_player.effects = effects()
+    strip_player.step(10)
+    assert strip.leds == expected
+
+    strip_player.fill(12.7, -3, 256)
+    assert bytes(strip_player.view(0, 1)) == bytes([13, 0, 255])
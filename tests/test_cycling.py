@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import math
+
+import pytest
+
+from picofx import PHASE_ONE, Cycling, CyclingAction
+
+WRAP = Cycling._WRAP
+
+
+class Counted(CyclingAction):
+    """An action that counts how many times it has moved on and back."""
+    def __init__(self, speed):
+        super().__init__(speed)
+        self.moves = 0
+
+    def next(self):
+        self.moves += 1
+
+    def prev(self):
+        self.moves -= 1
+
+
+def cycles(speed, elapsed_ms):
+    # How many cycles the given speed covers in the given time, worked out from the speed itself
+    return speed * elapsed_ms / 1000
+
+
+def assert_phase(cycling, speed, elapsed_ms):
+    # The phase is the fraction of the cycle reached, rounded down, from a speed rounded to 2^-33 of a
+    # cycle per second, so it is within a little over one of the exact value, allowing for either of
+    # them having just wrapped
+    expected = (cycles(speed, elapsed_ms) % 1) * PHASE_ONE
+    difference = abs(cycling._phase - expected)
+    tolerance = 1 + cycles(2 ** -33, elapsed_ms) * PHASE_ONE
+    assert min(difference, PHASE_ONE - difference) <= tolerance, (cycling._phase, expected)
+
+
+@pytest.mark.parametrize("speed", [0.0001, -0.0001, 0.003, -0.37])
+def test_phase_follows_speed_across_wrap(speed):
+    cycling = Cycling(speed)
+
+    # Start a second short of where the phase wraps, then tick a millisecond at a time across it
+    elapsed_ms = int(1000 / abs(speed)) - 1000
+    cycling.tick(elapsed_ms)
+    phases = []
+    for _ in range(2000):
+        cycling.tick(1)
+        elapsed_ms += 1
+        assert_phase(cycling, speed, elapsed_ms)
+        phases.append(cycling._phase)
+
+    # Even the slowest speed moves the phase on, and it wraps to the other end of the cycle
+    assert len(set(phases)) > 1
+    assert max(phases) >= PHASE_ONE - 100 and min(phases) <= 100
+    assert 0 <= cycling._accum < WRAP
+
+
+def test_slow_ticks_are_not_lost():
+    # Ticks that move the phase by less than one step each still add up to the same as one long tick
+    ticked = Cycling(0.0001)
+    for _ in range(100_000):
+        ticked.tick(1)
+    whole = Cycling(0.0001)
+    whole.tick(100_000)
+    assert (ticked._accum, ticked._fraction, ticked._phase) == (whole._accum, whole._fraction, whole._phase)
+    assert_phase(ticked, 0.0001, 100_000)
+
+
+@pytest.mark.parametrize("speed", [0.0001, -0.0001, 0.0123, 1.7])
+def test_slow_speeds_keep_time(speed):
+    # Ten hours of frames at 50 per second end up where the speed says they should
+    cycling = Cycling(speed)
+    for _ in range(10 * 60 * 60 * 50):
+        cycling.tick(20)
+    assert_phase(cycling, speed, 10 * 60 * 60 * 1000)
+
+
+def test_offset_follows_phase():
+    # Effects written before the phase was an integer can read it as a fraction of a cycle instead
+    cycling = Cycling(0.25)
+    cycling.tick(1000)
+    assert cycling.offset == cycling._phase / PHASE_ONE
+    assert 0.249 < cycling.offset <= 0.25
+    with pytest.raises(AttributeError):
+        cycling.offset = 0.5
+
+
+@pytest.mark.parametrize("speed", [0.0001, -0.0001, -2.5])
+def test_actions_move_once_per_wrap(speed):
+    # Actions move on or back each time the phase wraps, which going backwards it does straight away.
+    # Each check is made a little way either side of a wrap, where the speed alone says how many there were
+    action = Counted(speed)
+    wrap_ms = round(1000 / abs(speed))
+    margin_ms = wrap_ms // 100
+    elapsed_ms = 0
+    for delta_ms in (wrap_ms - margin_ms, 2 * margin_ms, 1, wrap_ms * 3, 1):
+        action.tick(delta_ms)
+        elapsed_ms += delta_ms
+        assert action.moves == math.floor(cycles(speed, elapsed_ms))
+        assert_phase(action, speed, elapsed_ms)
+    assert action.moves == (4 if speed > 0 else -5)
@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+from conftest import REPO_DIR
+
+from tools import emulator
+from tools.emulator import board as emulator_board
+from tools.emulator import machine
+from tools.emulator.aye_arr.nec import NECRemoteReceiver
+from tools.emulator.aye_arr.nec.remotes import PimoroniRemote
+from tools.emulator.board import VirtualClock
+from tools.emulator.loop import VirtualEventLoop
+
+EXAMPLES_DIR = REPO_DIR / "examples" / "tiny_fx" / "examples"
+
+
+@pytest.fixture
+def board(monkeypatch):
+    board = emulator_board.Board(VirtualClock())
+    monkeypatch.setattr(emulator_board, "board", board)
+    return board
+
+
+def advance(board, us):
+    board.advance_to(board.now_us() + us)
+
+
+def test_timer_is_periodic(board):
+    fired = []
+    timer = machine.Timer()
+    timer.init(mode=machine.Timer.PERIODIC, period=10, callback=lambda t: fired.append(board.now_us()))
+    advance(board, 35000)
+    assert fired == [10000, 20000, 30000]
+
+    timer.deinit()
+    advance(board, 20000)
+    assert len(fired) == 3
+
+
+def test_timer_one_shot(board):
+    fired = []
+    machine.Timer(mode=machine.Timer.ONE_SHOT, period=5, callback=lambda t: fired.append(board.now_us()))
+    advance(board, 20000)
+    assert fired == [5000]
+
+
+def test_late_timer_catches_up(board):
+    fired = []
+    machine.Timer(period=10, callback=lambda t: fired.append(board.now_us()))
+    board.clock.us = 45000
+    board.run_due()
+    assert len(fired) == 4
+
+
+def test_sleep_moves_virtual_time(board):
+    fired = []
+    machine.Timer(period=10, callback=lambda t: fired.append(board.now_us()))
+    board.sleep_us(3_600_000_000)
+    assert board.now_us() == 3_600_000_000
+    assert len(fired) == 360_000
+    assert fired[-1] == 3_600_000_000
+
+
+def test_inputs_wait_for_next_event(board):
+    # Reading an input moves time on to the next event, or by the poll time when there is none
+    button = machine.Pin(22, machine.Pin.IN, machine.Pin.PULL_UP)
+    button.value()
+    assert board.now_us() == board.poll_us
+
+    board.after(2500, lambda: board.set_pin(22, 0))
+    while button.value():
+        pass
+    assert board.now_us() == board.poll_us + 2500
+
+    # But not for anything an event does
+    board.after(0, button.value)
+    board.run_due()
+    assert board.now_us() == board.poll_us + 2500
+
+
+def test_virtual_clock_ticks():
+    clock = VirtualClock(emulator.TICKS_MAX - 999)
+    start = clock.ticks_us()
+    clock.advance(2000)
+    assert clock.ticks_diff(clock.ticks_us(), start) == 2000
+
+
+def test_virtual_event_loop(board):
+    async def wait():
+        await asyncio.sleep(3600)
+        return loop.time()
+
+    loop = VirtualEventLoop()
+    try:
+        assert loop.run_until_complete(wait()) == pytest.approx(3600)
+    finally:
+        loop.close()
+    assert board.now_us() >= 3_600_000_000
+
+
+def test_timer_stops_on_error(board, capsys):
+    calls = []
+
+    def fail(timer):
+        calls.append(timer)
+        raise RuntimeError("oops")
+
+    machine.Timer(period=10, callback=fail)
+    advance(board, 50000)
+    assert len(calls) == 1
+    assert "Uncaught exception in IRQ callback handler" in capsys.readouterr().err
+
+
+def test_pwm_traces_pin_level(board):
+    pwm = machine.PWM(machine.Pin(3), freq=1000, duty_u16=0)
+    inverted = machine.PWM(machine.Pin(4), freq=1000, duty_u16=0, invert=True)
+    board.clock.us = 100
+    pwm.duty_u16(1000)
+    pwm.duty_u16(1000)
+    inverted.duty_u16(65535)
+    assert pwm.duty_u16() == 1000
+    assert board.trace == [(0, "pwm", 3, 0), (0, "pwm", 4, 65535), (100, "pwm", 3, 1000), (100, "pwm", 4, 0)]
+
+
+def test_pin_inputs(board):
+    button = machine.Pin(22, machine.Pin.IN, machine.Pin.PULL_UP)
+    sensor = machine.Pin(26, machine.Pin.IN)
+    assert button.value() == 1
+    assert sensor.value() == 0
+
+    presses = []
+    button.irq(lambda pin: presses.append(pin.value()), trigger=machine.Pin.IRQ_FALLING)
+    board.set_pin(22, 0)
+    board.set_pin(22, 1)
+    assert presses == []    # Handlers run as events, so have not yet
+
+    board.run_due()
+    assert presses == [1]
+
+
+def test_pin_outputs(board):
+    led = machine.Pin(21, machine.Pin.OUT, value=0)
+    led.on()
+    led.on()
+    led.toggle()
+    assert [value for _, _, _, value in board.trace] == [1, 0]
+
+
+def test_adc_inputs(board):
+    adc = machine.ADC(machine.Pin(26))
+    assert adc.read_u16() == 0
+    board.set_adc(26, 40000)
+    assert machine.ADC(0).read_u16() == 40000
+
+    # Inputs can be functions of the time in seconds
+    board.set_adc(28, lambda seconds: seconds * 100000)
+    reading = machine.ADC(28).read_u16()
+    assert reading == int(board.seconds() * 100000)
+    assert reading > 0
+
+
+def test_i2s_irq_follows_playback(board):
+    done = []
+    i2s = machine.I2S(0, mode=machine.I2S.TX, bits=16, format=machine.I2S.MONO, rate=8000)
+    i2s.irq(lambda i2s: done.append(board.now_us()))
+
+    # 1600 bytes is 800 samples, which take 100ms to play at 8kHz
+    assert i2s.write(bytearray(1600)) == 1600
+    advance(board, 99000)
+    assert done == []
+    advance(board, 1000)
+    assert done == [100000]
+
+    i2s.deinit()
+    i2s.write(bytearray(1600))
+    advance(board, 200000)
+    assert done == [100000]
+
+
+def test_ticks_wrap():
+    assert emulator.ticks_diff(5, emulator.TICKS_MAX - 4) == 10
+    assert emulator.ticks_diff(emulator.TICKS_MAX - 4, 5) == -10
+    assert emulator.ticks_add(emulator.TICKS_MAX, 3) == 2
+
+
+def test_remote_presses(board):
+    presses = []
+    remote = PimoroniRemote()
+    remote.bind("1_RED", on_press=(presses.append, "press"), on_short=(presses.append, "short"),
+                on_long=(presses.append, "long"), on_repeat=(presses.append, "repeat"))
+    receiver = NECRemoteReceiver(26, 1, 0)
+    receiver.bind(remote)
+    receiver.start()
+
+    board.press("1_RED")
+    receiver.decode()
+    assert presses == ["press", "short"]
+
+    presses.clear()
+    board.press("1_RED", hold_ms=1000)
+    receiver.decode()
+    assert presses == ["press"]
+    advance(board, 1000000)
+    receiver.decode()
+    assert presses == ["press"] + ["repeat"] * 9 + ["long"]
+
+
+def run(example, *args):
+    result = subprocess.run([sys.executable, "-m", "tools.emulator", str(EXAMPLES_DIR / example), *args],
+                            cwd=REPO_DIR, capture_output=True, text=True, timeout=30, check=False)
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def test_run_example(tmp_path):
+    trace_file = tmp_path / "trace.csv"
+    run("effects/mono/pulse_wave.py", "--duration", "0.3", "--trace", str(trace_file))
+    trace = emulator.read_trace(trace_file)
+
+    # Every mono output should be pulsing, with the changes recorded in order
+    levels = {}
+    for _, device, pin, value in trace:
+        levels.setdefault((device, pin), set()).add(value)
+    for pin in (3, 2, 4, 5, 8, 9):
+        assert len(levels[("pwm", pin)]) > 5
+    times = [time_us for time_us, _, _, _ in trace]
+    assert times == sorted(times)
+    assert times[-1] < 400000
+
+
+def test_run_example_with_inputs(tmp_path):
+    # Pressing Boot starts the countdown, turning on the amp and output one, and playing the first tone
+    trace_file = tmp_path / "trace.csv"
+    run("audio/race_start.py", "--duration", "0.4", "--pin", "22=0@0.1", "--pin", "22=1@0.2", "--trace", str(trace_file))
+    trace = emulator.read_trace(trace_file)
+    assert ("pin", 21, 1) in [(device, pin, value) for _, device, pin, value in trace]
+    assert ("pwm", 3, 65535) in [(device, pin, value) for _, device, pin, value in trace]
+    assert any(device == "i2s" for _, device, _, _ in trace)
+
+
+def test_run_example_virtually(tmp_path):
+    # An hour of playback runs in far less, with the same results every time for the same seed
+    start = time.perf_counter()
+    run("effects/mono/traffic_light.py", "--virtual", "--duration", "3600")
+    assert time.perf_counter() - start < 30
+
+    traces = []
+    for seed in (1, 1, 2):
+        trace_file = tmp_path / f"trace-{len(traces)}.csv"
+        run("effects/mono/single_flicker.py", "--virtual", "--duration", "10", "--seed", str(seed), "--trace", str(trace_file))
+        traces.append(emulator.read_trace(trace_file))
+    assert traces[0] == traces[1]
+    assert traces[0] != traces[2]
+    assert traces[0][-1][0] <= 10_000_000
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from tools.golden import COLOUR, MONO, Golden, compare, load, save
+from tools.golden.effects import CASES, render
+
+NAMES = [name for name, _, _ in CASES]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_effect_matches_golden(goldens, name):
+    goldens.check(render(name))
+
+
+def test_every_effect_has_a_case():
+    from picofx.colour import COLOUR_EFFECTS
+    from picofx.mono import MONO_EFFECTS
+    for effect in MONO_EFFECTS + COLOUR_EFFECTS:
+        assert effect.__name__ in NAMES
+
+
+def test_render_is_repeatable():
+    # Even the effects that use random numbers show the same frames every time
+    first = render("RandomFX", frames=100)
+    assert first.data == render("RandomFX", frames=100).data
+    assert len(set(first.data)) > 2
+
+
+def test_compare_reports_first_difference():
+    golden = Golden("test", COLOUR, 2, 3, 10, bytearray(18))
+    actual = Golden("test", COLOUR, 2, 3, 10, bytearray(18))
+    actual.data[10] = 1
+    assert compare(golden, actual) is None
+
+    actual.data[10] = 2
+    actual.data[17] = 9
+    assert compare(golden, actual) == (1, 1, 1, 0, 2)
+    assert compare(golden, actual, tolerance=2) == (2, 1, 2, 0, 9)
+
+    # Mono tolerances are in the same 8 bit levels, for values held in 16 bits
+    golden = Golden("test", MONO, 1, 2, 10, [0, 65535])
+    assert compare(golden, Golden("test", MONO, 1, 2, 10, [257, 65278])) is None
+    assert compare(golden, Golden("test", MONO, 1, 2, 10, [258, 65535])) == (0, 0, 0, 0, 258)
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "goldens.bin"
+    goldens = [render("PulseWaveFX", frames=50), render("RainbowWaveFX", frames=50)]
+    save(path, goldens)
+
+    loaded = load(path)
+    for golden in goldens:
+        assert compare(loaded[golden.name], golden, tolerance=0) is None
+        assert list(loaded[golden.name].data) == list(golden.data)
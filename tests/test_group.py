@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from conftest import StepClock
+from test_player import Counter
+
+from picofx import PWMLED, MonoPlayer, PlayerGroup
+
+
+class Shows(MonoPlayer):
+    """A player that records which group frames it was shown on."""
+    def __init__(self, clock, log):
+        super().__init__(PWMLED(0), clock=clock)
+        self.log = log
+
+    def _show(self):
+        self.log.append(self)
+
+
+def group_frame(group):
+    group._PlayerGroup__timer.fire()
+
+
+def test_divisors_and_offsets(clock):
+    group = PlayerGroup(clock=clock)
+    log = []
+    every = Shows(clock, log)
+    even = Shows(clock, log)
+    odd = Shows(clock, log)
+    group.add(every)
+    group.add(even, divisor=2)
+    group.add(odd, divisor=2, offset=1)
+    group.start()
+
+    shown = []
+    for _ in range(4):
+        group_frame(group)
+        shown.append(list(log))
+        log.clear()
+    assert shown == [[every, even], [every, odd], [every, even], [every, odd]]
+
+
+def test_shared_updateables_tick_once():
+    clock = StepClock(0)
+    group = PlayerGroup(clock=clock)
+    shared = Counter()
+    slow_only = Counter()
+    fast = MonoPlayer([PWMLED(0)], clock=clock)
+    slow = MonoPlayer([PWMLED(1), PWMLED(2)], clock=clock)
+    fast.effects = [shared]
+    slow.effects = [shared, slow_only]
+    group.add(fast)
+    group.add(slow, divisor=3)
+    group.start()
+
+    for _ in range(9):
+        clock.now_us += 10000
+        group_frame(group)
+
+    # The shared effect is ticked once every frame, and the other once every third frame,
+    # with each being given all the time that passed since it was last ticked
+    assert shared.ticks == 9 and shared.elapsed_ms == 90
+    assert slow_only.ticks == 3 and slow_only.elapsed_ms == 70
+
+
+def test_effect_changes_are_picked_up(clock):
+    group = PlayerGroup(clock=clock)
+    player = MonoPlayer([PWMLED(0)], clock=clock)
+    first = Counter()
+    player.effects = [first]
+    group.add(player)
+    group.start()
+    group_frame(group)
+
+    second = Counter()
+    player.effects = [second]
+    group_frame(group)
+    assert first.ticks == 1 and second.ticks == 1
+
+    group.remove(player)
+    group_frame(group)
+    assert second.ticks == 1
+
+
+def test_divisor_must_be_positive(clock):
+    with pytest.raises(ValueError):
+        PlayerGroup(clock=clock).add(MonoPlayer(PWMLED(0)), divisor=0)
+
+
+def test_players_show_in_group(clock):
+    # A group frame shows the player the same as it would show itself
+    group = PlayerGroup(clock=clock)
+    led = PWMLED(0)
+    player = MonoPlayer([led], clock=clock)
+    player.effects = [lambda: 1.0]
+    group.add(player)
+    group.start()
+    group_frame(group)
+    assert led._PWMLED__led.duty_u16() == 65535
+    group.stop()
+    assert not group.is_running()
+
+
+def test_players_step_in_group():
+    # Group frames are stepped through each player, so they are seen by its stats and profiler
+    clock = StepClock(0)
+    group = PlayerGroup(clock=clock)
+    counter = Counter()
+    player = MonoPlayer([PWMLED(0)], clock=clock)
+    player.effects = [counter]
+    player.collect_stats()
+    player.profile()
+    group.add(player, divisor=2)
+    group.start()
+
+    for _ in range(6):
+        clock.now_us += 10000
+        group_frame(group)
+
+    assert player.stats.frames == 3 and player.stats.interval_ms == 50
+    assert sorted((name, calls) for name, calls, _, _ in player.profiler.report()) == [("0: Counter", 3), ("tick: Counter", 3)]
+    assert counter.ticks == 3 and counter.elapsed_ms == 50
+
+
+def test_elapsed_time_wraps():
+    clock = StepClock(0)
+    group = PlayerGroup(clock=clock)
+    counter = Counter()
+    player = MonoPlayer([PWMLED(0)], clock=clock)
+    player.effects = [counter]
+    group.add(player)
+    group._PlayerGroup__elapsed_ms = PlayerGroup.ELAPSED_MASK - 15
+    group.start()
+
+    for _ in range(4):
+        clock.now_us += 10000
+        group_frame(group)
+
+    assert counter.elapsed_ms == 40
+    assert group._PlayerGroup__elapsed_ms == 24
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from conftest import StepClock
+
+from picofx import PWMLED, RGBLED, MonoPlayer
+from picofx.mono import StaticFX
+
+
+def duties(rgb):
+    return tuple(led._PWMLED__led.duty_u16() for led in (rgb.led_r, rgb.led_g, rgb.led_b))
+
+
+def test_pwmled_duty_skips_unchanged():
+    led = PWMLED(0)
+    led.duty(1000)
+    led.duty(1000)
+    led.duty(0)
+    assert led._PWMLED__led.duty_u16() == 0
+    assert led.write_stats() == (2, 1)
+
+
+def test_write_stats_count_skips():
+    led = PWMLED(0, gamma=2.2)
+
+    # Brightnesses that land on the same step of the table, or on the same duty after gamma, are not written
+    led.brightness(0.5)
+    led.brightness(0.5001)
+    led.brightness(0.0001)
+    led.brightness(0.0005)
+    assert led.write_stats() == (2, 2)
+
+    # Turning on when already on is not written, and toggling back off is
+    led.on()
+    led.on()
+    led.toggle()
+    assert led.write_stats(reset=True) == (4, 3)
+    assert led.write_stats() == (0, 0)
+
+    # A player showing an unchanging effect only writes on its first frame
+    player = MonoPlayer(led, clock=StepClock())
+    player.effects = [StaticFX(0.3)]
+    for _ in range(10):
+        player.step(10)
+    assert led.write_stats() == (1, 9)
+
+
+def lit(led):
+    # Tables are built when an LED is first given a brightness
+    led.on()
+    return led
+
+
+def test_gamma_tables_are_shared():
+    # LEDs with equal gamma and resolution share one table, however their gamma was given
+    leds = [lit(PWMLED(0, gamma=2.2)), lit(PWMLED(1, gamma=2.2)), lit(PWMLED(2, gamma=2.2, resolution=1024))]
+    table = PWMLED.gamma_table(2.2)
+    assert all(led._PWMLED__table is table for led in leds)
+    assert lit(PWMLED(3, gamma=2))._PWMLED__table is lit(PWMLED(4, gamma=2.0))._PWMLED__table
+
+    # Any difference in either gets a table of its own
+    assert lit(PWMLED(5, gamma=1.8))._PWMLED__table is not table
+    assert lit(PWMLED(6, gamma=2.2, resolution=4096))._PWMLED__table is not table
+    assert len(PWMLED.gamma_table(2.2, 4096)) == 4097
+    assert table[0] == 0 and table[-1] == 65535
+
+
+def test_channel_tables_are_shared():
+    assert RGBLED.channel_table(2.2, 0.5) is RGBLED.channel_table(2.2, 0.5)
+    table = RGBLED.channel_table(1, 1.0)
+    assert len(table) == 256
+    assert table[0] == 0 and table[255] == 65535
+
+
+def test_set_rgb_matches_brightness():
+    rgb = RGBLED(0, 1, 2, gamma=2.2)
+    single = PWMLED(3, gamma=2.2, resolution=4096)
+    for value in (0, 1, 64, 128, 200, 255):
+        rgb.set_rgb(value, value, value)
+        single.brightness(value / 255)
+        for duty in duties(rgb):
+            assert abs(duty - single._PWMLED__led.duty_u16()) <= 48
+
+
+def test_given_leds_keep_their_gamma():
+    # PWMLEDs given to an RGBLED are gamma corrected with their own gamma, as set_rgb() once did through brightness()
+    rgb = RGBLED(PWMLED(0, gamma=2.2), 1, PWMLED(2, gamma=1.8), gamma=1.4)
+    rgb.set_rgb(128, 128, 128)
+    assert duties(rgb) == (14386, int(pow(128 / 255, 1.4) * 65535 + 0.5), int(pow(128 / 255, 1.8) * 65535 + 0.5))
+
+    # Calibrating the gamma sets it for every channel
+    rgb.calibrate(gamma=1)
+    rgb.set_rgb(255, 0, 51)
+    assert duties(rgb) == (65535, 0, 13107)
+
+
+def test_set_rgb_clamps_and_rounds():
+    rgb = RGBLED(0, 1, 2)
+    rgb.set_rgb(-10, 300, 127.6)
+    assert duties(rgb) == (0, 65535, RGBLED.channel_table(1)[128])
+
+
+def test_calibration_applies_balance_and_scale():
+    rgb = RGBLED(0, 1, 2, balance=(1.0, 0.5, 0.25))
+    rgb.set_rgb(255, 255, 255)
+    assert duties(rgb) == (65535, 32768, 16384)
+
+    rgb.calibrate(scale=0.5)
+    rgb.set_rgb(255, 255, 255)
+    assert duties(rgb) == (32768, 16384, 8192)
+    assert rgb.calibration() == (1, (1.0, 0.5, 0.25), 0.5)
+
+    # A balance above one is limited to the full duty
+    rgb.calibrate(balance=(2.0, 1.0, 1.0), scale=1.0)
+    rgb.set_rgb(255, 0, 0)
+    assert duties(rgb) == (65535, 0, 0)
+
+
+def test_rgb_channels_follow_set_rgb():
+    # Channels driven through set_rgb() never build a gamma table of their own
+    rgb = RGBLED(0, 1, 2, gamma=2.2)
+    rgb.set_rgb(255, 128, 0)
+    assert all(led._PWMLED__table is None for led in (rgb.led_r, rgb.led_g, rgb.led_b))
+
+    # Toggling a channel afterwards inverts the brightness set_rgb() gave it, rather than a stale one
+    rgb.led_r.toggle()
+    rgb.led_g.toggle()
+    rgb.led_b.toggle()
+    assert duties(rgb) == (0, PWMLED.gamma_table(2.2)[1024 - round(128 / 255 * 1024)], 65535)
+
+    # As does a brightness followed by a colour and a toggle
+    rgb.led_r.brightness(0.25)
+    rgb.set_rgb(0, 0, 0)
+    rgb.led_r.toggle()
+    assert duties(rgb)[0] == 65535
@@ -0,0 +1,418 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+
+from conftest import StepClock, Strip
+
+from picofx import PWMLED, RGBLED, ColourPlayer, FrameStats, MonoPlayer, StripPlayer, Updateable
+from picofx.colour import HSVFX, RGBFX, RainbowWaveFX
+from picofx.mono import FlashSequenceFX, PulseWaveFX, StaticFX
+
+
+def frame(player):
+    # Run a single update through the player's timer, which measures the time between frames itself
+    player._EffectPlayer__timer.fire()
+
+
+class Busy(Updateable):
+    """An effect that moves the clock on by a set time whenever it is ticked or called."""
+    def __init__(self, clock, tick_us, call_us):
+        self.clock = clock
+        self.tick_us = tick_us
+        self.call_us = call_us
+
+    def __call__(self):
+        self.clock.now_us += self.call_us
+        return 0.5
+
+    def tick(self, delta_ms):
+        self.clock.now_us += self.tick_us
+
+
+class Counter(Updateable):
+    """An effect that counts its ticks and the time they covered."""
+    def __init__(self):
+        self.ticks = 0
+        self.elapsed_ms = 0
+
+    def __call__(self):
+        return 1.0
+
+    def tick(self, delta_ms):
+        self.ticks += 1
+        self.elapsed_ms += delta_ms
+
+
+def busy_player(tick_us, call_us, step_us=0):
+    clock = StepClock(step_us)
+    player = MonoPlayer(PWMLED(0), clock=clock)
+    player.effects = [Busy(clock, tick_us, call_us)]
+    player.collect_stats()
+    player.start()
+    return player, clock
+
+
+def test_stats_are_off_by_default(clock):
+    player = MonoPlayer(PWMLED(0), clock=clock)
+    assert player.stats is None
+
+
+def test_stats_split_tick_and_show():
+    player, clock = busy_player(tick_us=1000, call_us=3000)
+    for _ in range(10):
+        clock.now_us += 10000
+        frame(player)
+
+    stats = player.stats
+    assert stats.frames == 10
+    assert stats.tick_us == 10 * 1000
+    assert stats.show_us == 10 * 3000
+    assert stats.min_us == stats.max_us == stats.mean_us() == 4000
+    assert stats.overruns == 0
+
+
+def test_stats_count_overruns():
+    player, clock = busy_player(tick_us=6000, call_us=6000)
+    for _ in range(5):
+        frame(player)
+    assert player.stats.overruns == 5
+    assert player.stats.max_us == 12000
+
+
+def test_stats_jitter_and_fps():
+    player, clock = busy_player(tick_us=0, call_us=0)
+    for interval_us in (10000, 10200, 10400, 12000, 20000):
+        clock.now_us += interval_us
+        frame(player)
+
+    stats = player.stats
+    assert stats.jitter == [2, 1, 0, 1, 0, 1]
+    assert stats.intervals == 5
+    assert abs(stats.fps() - (5000 / 62.6)) < 1     # Whole milliseconds are counted, with the rest carried
+
+    stats.reset()
+    assert stats.frames == 0 and stats.fps() == 0.0 and sum(stats.jitter) == 0
+
+
+def test_stats_can_be_turned_off():
+    player, clock = busy_player(tick_us=0, call_us=0)
+    stats = player.stats
+    assert isinstance(stats, FrameStats)
+    player.collect_stats()
+    assert player.stats is stats
+    player.collect_stats(False)
+    assert player.stats is None
+    frame(player)
+
+
+def test_profiler_attributes_costs():
+    clock = StepClock(0)
+    player = MonoPlayer([PWMLED(i) for i in range(4)], clock=clock)
+    cheap = Busy(clock, tick_us=100, call_us=200)
+    costly = Busy(clock, tick_us=500, call_us=1000)
+    player.effects = [cheap, costly, costly, None]
+    assert player.profiler is None
+
+    player.profile()
+    player.start()
+    for _ in range(10):
+        frame(player)
+
+    report = player.profiler.report()
+    assert report == [
+        ("1: Busy", 10, 10000, 1000),
+        ("2: Busy", 10, 10000, 1000),
+        ("tick: Busy", 10, 5000, 500),
+        ("0: Busy", 10, 2000, 200),
+        ("tick: Busy", 10, 1000, 100),
+    ]
+
+    player.profiler.reset()
+    assert all(calls == 0 for _, calls, _, _ in player.profiler.report())
+
+    # Turning profiling off returns the player to its untimed plan
+    player.profile(False)
+    assert player.profiler is None
+    frame(player)
+
+
+def test_profiler_times_batches(clock):
+    wave = PulseWaveFX(length=6)
+    player = MonoPlayer([PWMLED(i) for i in range(6)], clock=clock)
+    player.profile()
+    player.effects = [wave(i) for i in range(6)]
+    player.start()
+    frame(player)
+
+    names = [name for name, _, _, _ in player.profiler.report()]
+    assert sorted(names) == ["0-5: PulseWaveFX", "tick: PulseWaveFX"]
+
+
+class UnbatchedPlayer(MonoPlayer):
+    """A player that shows every slot on its own, to compare batched players against."""
+    def _renderer(self, _effect):
+        return None
+
+
+def test_batches_keep_other_functions(clock):
+    # Entries that pair a wave with a function of their own are not mistaken for positions along the wave
+    def inverse(pos):
+        return 1.0 - wave.at(pos)
+
+    wave = PulseWaveFX(speed=0.3, length=6)
+    effect_list = [wave(0), wave(1), (wave, inverse, 2), wave(3), wave(4), (wave, inverse, 5), (wave, inverse, 1)]
+    batched = MonoPlayer([PWMLED(i) for i in range(7)], clock=clock)
+    batched.effects = effect_list
+    unbatched = UnbatchedPlayer([PWMLED(i) for i in range(7)], clock=clock)
+    unbatched.effects = effect_list
+    assert len(batched._batches) == 2 and not unbatched._batches
+
+    expected = unbatched.new_frame()
+    values = batched.new_frame()
+    for _ in range(50):
+        unbatched.step(0, expected)
+        batched.step(0, values)
+        assert values == expected
+        wave.tick(37)
+    assert values[6] == 1.0 - values[1]
+
+
+def test_flashes_with_empty_window(clock):
+    # A window of zero shows nothing, whether the wave is rendered as a batch or one position at a time
+    flash = FlashSequenceFX(length=4, window=0)
+    player = MonoPlayer([PWMLED(i) for i in range(5)], clock=clock)
+    player.effects = [flash(i) for i in range(4)] + [(flash, lambda: flash.at(2))]
+    values = player.new_frame()
+    for _ in range(10):
+        player.step(37, values)
+        assert values == [0.0] * 5
+
+
+def test_governor_sheds_and_restores_rate():
+    player, clock = busy_player(tick_us=0, call_us=9000)
+    rates = []
+    player.govern(min_fps=20, callback=rates.append)
+    timer = player._EffectPlayer__timer
+
+    # Frames of 9ms are too costly for 100fps, so the rate drops until they fit
+    for _ in range(500):
+        frame(player)
+    assert rates == [75]
+    assert player.fps() == 75
+    assert timer._Timer__period_us == int(1000 / 75) * 1000
+
+    # Once frames are cheap again, the rate returns to the one it was started at
+    player.effects = [Busy(clock, 0, 1000)]
+    for _ in range(500):
+        frame(player)
+    assert rates[1:] == [93, 100]
+    assert player.fps() == 100
+
+
+def test_governor_keeps_to_floor():
+    player, clock = busy_player(tick_us=0, call_us=100000)
+    rates = []
+    player.govern(min_fps=30, callback=rates.append)
+    for _ in range(500):
+        frame(player)
+    assert rates == [75, 56, 42, 31, 30]
+
+    # Without a floor, the rate is left alone
+    player.govern(None)
+    player.start(force=True)
+    for _ in range(500):
+        frame(player)
+    assert player.fps() == 100
+
+
+class HostClock:
+    """A clock for players that follows the host's real time."""
+    def ticks_us(self):
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(self, ticks1, ticks2):
+        return ticks1 - ticks2
+
+
+def test_run_as_asyncio_task():
+    clock = HostClock()
+    player = MonoPlayer(PWMLED(0), clock=clock)
+    counter = Counter()
+    player.effects = [counter]
+    other = []
+
+    async def main():
+        task = asyncio.create_task(player.run(fps=100))
+
+        # Another task gets to run alongside the player
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            other.append(player.is_running())
+
+        player.stop()
+        await task
+
+    start_us = clock.ticks_us()
+    asyncio.run(main())
+    elapsed_ms = (clock.ticks_us() - start_us) // 1000
+    assert all(other)
+    assert not player.is_running()
+
+    # The effect was ticked several times, by the real time that passed
+    assert counter.ticks >= 5
+    assert elapsed_ms - 20 <= counter.elapsed_ms <= elapsed_ms
+
+
+def test_run_hands_over_to_start():
+    player = MonoPlayer(PWMLED(0), clock=HostClock())
+    player.effects = [Counter()]
+
+    async def main():
+        task = asyncio.create_task(player.run(fps=100))
+        await asyncio.sleep(0.05)
+
+        # Starting the player on its timer ends the task, without stopping the player
+        player.start(force=True)
+        await task
+
+    asyncio.run(main())
+    assert player.is_running()
+    player.stop()
+
+
+def test_step_without_timer():
+    clock = StepClock(0)
+    player = MonoPlayer(PWMLED(0), clock=clock)
+    counter = Counter()
+    busy = Busy(clock, tick_us=300, call_us=200)
+    player.effects = [busy]
+    player.effects = [counter]
+    assert not player.is_running()
+
+    # Steps can cover any amount of time, regardless of how long they take
+    for _ in range(5):
+        player.step(60000)
+    assert counter.ticks == 5 and counter.elapsed_ms == 300000
+
+    player.effects = [busy]
+    assert player.step(10) == 500
+
+
+def test_step_captures_frames(clock):
+    leds = [PWMLED(i) for i in range(3)]
+    mono = MonoPlayer(leds, clock=clock)
+    mono.effects = [StaticFX(0.25), None, StaticFX(1.0)]
+    values = mono.new_frame()
+    mono.step(10, values)
+    assert values == [0.25, 0.0, 1.0]
+
+    # The values are still shown on the LEDs
+    assert leds[2]._PWMLED__led.duty_u16() == 65535
+
+    colour = ColourPlayer([RGBLED(0, 1, 2), RGBLED(3, 4, 5)], clock=clock)
+    colour.effects = [RGBFX(1, 2, 3), HSVFX(0.0, 1.0, 1.0)]
+    values = colour.new_frame()
+    colour.step(10, values)
+    assert values == bytearray([1, 2, 3, 255, 0, 0])
+
+    strip = StripPlayer(Strip(2), num_leds=2, clock=clock)
+    strip.effects = [None, RGBFX(4, 5, 6)]
+    values = strip.new_frame()
+    strip.step(10, values)
+    assert values == bytearray([0, 0, 0, 4, 5, 6])
+    assert values is not strip.buffer
+
+
+def test_capture_keeps_own_leds(clock):
+    leds = [PWMLED(i) for i in range(2)]
+    player = MonoPlayer(leds, clock=clock)
+    static = StaticFX(0.25)
+    player.effects = [static, StaticFX(1.0)]
+    values = player.new_frame()
+    player.step(10, values)
+    assert values == [0.25, 1.0]
+
+    # Steps without a frame show through the player's own plan, straight to its LEDs
+    assert player._leds is leds
+    assert player._plan[0][0] == leds[0].brightness
+    static.brightness = 0.5
+    player.step(10)
+    assert values == [0.25, 1.0]
+    assert leds[0]._PWMLED__led.duty_u16() == 32768
+
+    # Captures pick up changes to the effects
+    player.effects = [StaticFX(0.75), StaticFX(0.0)]
+    player.step(10, values)
+    assert values == [0.75, 0.0]
+
+
+def test_strip_framebuffer():
+    strip = Strip(6)
+    player = StripPlayer(strip, num_leds=6, clock=StepClock())
+    player.fill(1, 2, 3)
+    player.fill(9, 8, 7, start=4, count=1)
+    assert bytes(player.buffer) == bytes([1, 2, 3] * 4 + [9, 8, 7, 1, 2, 3])
+
+    # Views are windows onto the framebuffer, so writes to them change it
+    view = player.view(1, 2)
+    assert len(view) == 6
+    view[0] = 50
+    assert player.buffer[3] == 50
+
+    player.blit(bytes(range(10, 16)), start=2)
+    assert bytes(player.view(2, 2)) == bytes(range(10, 16))
+
+    # Overlapping copies move the LEDs as if through a temporary buffer
+    player.copy(1, 2, 3)
+    assert bytes(player.buffer) == bytes([1, 2, 3, 50, 2, 3, 50, 2, 3, 10, 11, 12, 13, 14, 15, 1, 2, 3])
+
+    # Pushing sends the frame to the strip
+    player._push()
+    assert strip.leds == [(1, 2, 3), (50, 2, 3), (50, 2, 3), (10, 11, 12), (13, 14, 15), (1, 2, 3)]
+
+
+class CountingStrip(Strip):
+    """A strip that also counts how many LEDs have been set on it."""
+    def __init__(self, num_leds):
+        super().__init__(num_leds)
+        self.sets = 0
+
+    def set_rgb(self, index, r, g, b):
+        super().set_rgb(index, r, g, b)
+        self.sets += 1
+
+
+def test_strip_pushes_only_changes(clock):
+    strip = CountingStrip(4)
+    player = StripPlayer(strip, num_leds=4, clock=clock)
+    static = RGBFX(1, 2, 3)
+    player.effects = [static, None, RainbowWaveFX(length=4)(2), RGBFX(0, 0, 0)]
+
+    # LEDs that keep their colour, or have no effect, are only sent when they change
+    player.step(10)
+    assert strip.sets == 2
+    for _ in range(5):
+        player.step(10)
+    assert strip.sets == 7
+    static.red = 9
+    player.step(10)
+    assert strip.sets == 9 and strip.leds[0] == (9, 2, 3)
+
+    # So a colour set on the strip directly is kept, until the framebuffer's copy of that LED changes
+    strip.set_rgb(1, 7, 7, 7)
+    player.step(10)
+    assert strip.leds[1] == (7, 7, 7)
+    player.fill(5, 5, 5, start=1, count=1)
+    player.step(10)
+    assert strip.leds[1] == (5, 5, 5)
+
+    # Waves are sent on every frame, and once one is taken away, its LEDs are checked like any other
+    sets = strip.sets
+    player.effects = [static, None, None, RGBFX(0, 0, 0)]
+    player.step(10)
+    assert strip.sets == sets + 1 and strip.leds[2] == tuple(player.view(2, 1))
+    player.step(10)
+    assert strip.sets == sets + 1
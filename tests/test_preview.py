@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import random
+import time
+
+import pytest
+from conftest import StepClock
+
+np = pytest.importorskip("numpy")
+
+from picofx import PWMLED, RGBLED, ColourPlayer, MonoPlayer  # noqa: E402
+from picofx.colour import RainbowFX, RainbowWaveFX, RGBBlinkFX  # noqa: E402
+from picofx.mono import BlinkWaveFX, FlashFX, FlashSequenceFX, PulseFX, PulseWaveFX, StaticFX  # noqa: E402
+from tools.golden import COLOUR  # noqa: E402
+from tools.golden.effects import CASES, SEED  # noqa: E402
+from tools.preview.render import Preview, rgb_from_hsv  # noqa: E402
+
+# Uneven times between frames, as a player running on its own timing would tick by
+DELTAS = [7, 10, 33, 1, 16, 16, 17, 250, 10, 3] * 30
+
+
+def play(effect_list, colour, deltas):
+    # The frames a player shows for the effects, as an array in the same layout as a Preview's
+    num_leds = len(effect_list)
+    if colour:
+        player = ColourPlayer([RGBLED(i, i, i) for i in range(num_leds)], clock=StepClock())
+    else:
+        player = MonoPlayer([PWMLED(i) for i in range(num_leds)], clock=StepClock())
+    player.effects = effect_list
+
+    frame = player.new_frame()
+    frames = []
+    for delta_ms in deltas:
+        player.step(delta_ms, frame)
+        frames.append(list(frame))
+    if colour:
+        return np.array(frames, dtype=np.uint8).reshape(len(deltas), num_leds, 3)
+    return np.array(frames)
+
+
+@pytest.mark.parametrize("name,kind,entries", CASES, ids=[name for name, _, _ in CASES])
+def test_matches_player(name, kind, entries):
+    random.seed(SEED)
+    expected = play(entries(), kind == COLOUR, DELTAS)
+
+    # Rendering in pieces carries on from where the last left off
+    random.seed(SEED)
+    preview = Preview(entries(), kind == COLOUR)
+    frames = np.concatenate([preview.render(100, DELTAS[:100]), preview.render(200, DELTAS[100:])])
+    np.testing.assert_array_equal(frames, expected)
+
+
+def mono_layout():
+    # Waves going backwards, at fractional positions, and both batched in runs and on their own
+    pulse = PulseWaveFX(speed=-0.37, length=7.3, phase=0.11)
+    flash = FlashSequenceFX(speed=1.3, length=13, flashes=3, window=0.7, phase=0.05, duty=0.3)
+    blink = BlinkWaveFX(speed=0.21, length=3, duty=0.77)
+    return [pulse(0.5), None, pulse(2), pulse(3), pulse(4.1), flash(1), flash(2), blink(5), StaticFX(0.3),
+            blink(-1.5), blink(2), flash(7), pulse(9), PulseFX(speed=2.1)]
+
+
+def colour_layout():
+    # Mono waves shown by a colour player become greys
+    rainbow = RainbowWaveFX(speed=-0.77, length=11.1, sat=0.6, val=0.9)
+    pulse = PulseWaveFX(speed=0.37, length=7.3)
+    return [rainbow(0), rainbow(1.5), rainbow(2.5), None, rainbow(7), pulse(1), pulse(2), pulse(3), RainbowFX(speed=0.4),
+            rainbow(-3), RGBBlinkFX(), pulse(5)]
+
+
+@pytest.mark.parametrize("layout,colour", [(mono_layout, False), (colour_layout, True)])
+def test_matches_player_layouts(layout, colour):
+    np.testing.assert_array_equal(Preview(layout(), colour).render(len(DELTAS), DELTAS), play(layout(), colour, DELTAS))
+
+
+def test_wave_used_by_other_functions():
+    # A wave that something else also reads from is ticked each frame, as it cannot be rendered ahead
+    def layout():
+        pulse = PulseWaveFX(speed=0.3, length=5)
+        return [pulse(0), pulse(1), (pulse, lambda: pulse.at(2) / 2), pulse(3)]
+    np.testing.assert_array_equal(Preview(layout()).render(len(DELTAS), DELTAS), play(layout(), False, DELTAS))
+
+
+def test_empty_flash_window():
+    def layout():
+        flash = FlashSequenceFX(length=4, window=0)
+        return [flash(0), flash(1), FlashFX(window=0), flash(3)]
+    np.testing.assert_array_equal(Preview(layout()).render(len(DELTAS), DELTAS), play(layout(), False, DELTAS))
+
+
+def test_render_ticks_effects():
+    pulse = PulseWaveFX(speed=0.7, length=20)
+    ticked = PulseWaveFX(speed=0.7, length=20)
+    Preview([pulse(i) for i in range(20)]).render(len(DELTAS), DELTAS)
+    for delta_ms in DELTAS:
+        ticked.tick(delta_ms)
+    assert (pulse._accum, pulse._phase) == (ticked._accum, ticked._phase)
+
+
+def test_rgb_from_hsv():
+    from picofx import rgb_from_hsv_int
+    hues = np.arange(-70000, 70000, 37)
+    for s, v in ((255, 255), (128, 200), (0, 77)):
+        expected = [rgb_from_hsv_int(h, s, v) for h in hues.tolist()]
+        np.testing.assert_array_equal(rgb_from_hsv(hues, s, v), expected)
+
+
+def test_large_show_is_fast():
+    # Ten thousand LEDs for ten seconds at 100fps, in chunks as the preview tool renders them
+    pulse = PulseWaveFX(length=100)
+    preview = Preview([pulse(i) for i in range(10_000)])
+    out = preview.new_frames(100)
+    start = time.perf_counter()
+    for _ in range(10):
+        preview.render(100, out=out)
+    assert time.perf_counter() - start < 5
+    assert out.min() < 0.01 and out.max() > 0.99
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import time
+
+import pytest
+from conftest import Strip
+from test_player import Counter, HostClock
+
+from picofx import PWMLED, RGBLED, ColourPlayer, MonoPlayer, StripPlayer
+from picofx.colour import RGBFX
+from picofx.mono import StaticFX
+
+
+def wait_for_frame(player):
+    # Wait for the render thread to finish the frame it was asked for
+    thread = player._EffectPlayer__thread
+    for _ in range(1000):
+        if thread.ready or thread.error is not None:
+            return
+        time.sleep(0.001)
+    raise TimeoutError("the render thread did not finish a frame")
+
+
+def latch_frame(player):
+    # Ask for a frame, and once it is rendered, latch it to the outputs
+    timer = player._EffectPlayer__timer
+    timer.fire()
+    wait_for_frame(player)
+    timer.fire()
+
+
+def duty(led):
+    return led._PWMLED__led.duty_u16()
+
+
+def test_mono_frames_are_latched():
+    leds = [PWMLED(i) for i in range(3)]
+    player = MonoPlayer(leds, clock=HostClock())
+    static = StaticFX(1.0)
+    counter = Counter()
+    player.effects = [static, counter, None]
+    player.start(threaded=True)
+    try:
+        # Nothing reaches the outputs until a finished frame is latched
+        player._EffectPlayer__timer.fire()
+        wait_for_frame(player)
+        assert duty(leds[0]) == 0
+
+        player._EffectPlayer__timer.fire()
+        assert [duty(led) for led in leds] == [65535, 65535, 0]
+        assert counter.ticks >= 1
+
+        # Changes made while holding the edit lock are picked up at the start of a frame
+        with player.edit():
+            static.brightness = 0.0
+        latch_frame(player)
+        assert duty(leds[0]) == 0
+    finally:
+        player.stop()
+
+    # Stopping returns the player to showing on its own LEDs
+    assert not player.is_running()
+    assert player._leds is leds
+    assert player._plan[0][0] == leds[0].brightness
+
+
+def test_colour_frames_are_latched():
+    led = RGBLED(0, 1, 2)
+    player = ColourPlayer(led, clock=HostClock())
+    player.effects = RGBFX(255, 0, 128)
+    player.start(threaded=True)
+    try:
+        latch_frame(player)
+        assert (duty(led.led_r), duty(led.led_g), duty(led.led_b)) == (65535, 0, RGBLED.channel_table(1)[128])
+    finally:
+        player.stop()
+
+
+def test_strip_frames_are_latched():
+    strip = Strip(4)
+    player = StripPlayer(strip, num_leds=4, clock=HostClock())
+    player.effects = [RGBFX(10, 20, 30), None, RGBFX(40, 50, 60), None]
+    player.start(threaded=True)
+    try:
+        latch_frame(player)
+        assert strip.leds == [(10, 20, 30), (0, 0, 0), (40, 50, 60), (0, 0, 0)]
+    finally:
+        player.stop()
+
+
+def test_errors_are_raised_by_the_timer():
+    def broken():
+        raise RuntimeError("broken effect")
+
+    player = MonoPlayer(PWMLED(0), clock=HostClock())
+    player.effects = [broken]
+    player.start(threaded=True)
+    with pytest.raises(RuntimeError, match="broken effect"):
+        latch_frame(player)
+    assert not player.is_running()
+    assert player._EffectPlayer__thread is None
+
+
+def test_edit_without_thread():
+    player = MonoPlayer(PWMLED(0), clock=HostClock())
+    with player.edit():
+        player.effects = [StaticFX(0.5)]
+
+
+def test_paired_players_are_not_threaded():
+    player = MonoPlayer(PWMLED(0), clock=HostClock())
+    other = MonoPlayer(PWMLED(1), clock=HostClock())
+    player.pair(other)
+    with pytest.raises(ValueError):
+        player.start(threaded=True)
+    assert not player.is_running()
+
+    player.pair(None)
+    player.start(threaded=True)
+    try:
+        with pytest.raises(ValueError):
+            player.pair(other)
+    finally:
+        player.stop()
+    player.pair(other)
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+A host emulation of the hardware that picofx and the Tiny FX examples use,
+so they can run headless on a regular computer. Calling `install()` makes
+the emulated modules importable under their MicroPython names, adds
+MicroPython's tick and sleep functions to `time`, and puts the board's
+libraries on the path, so no library code needs to change to use it.
+
+Run an example with:
+
+    python -m tools.emulator examples/tiny_fx/examples/effects/mono/pulse.py --duration 5 --trace pulse.csv
+"""
+
+import builtins
+import os
+import pathlib
+import random
+import sys
+import time
+
+from . import board as _board
+from .board import TICKS_MAX, Board, RealClock, host_sleep, ticks_add, ticks_diff
+
+REPO_DIR = pathlib.Path(__file__).resolve().parents[2]
+BOARD_DIR = REPO_DIR / "boards" / "PIMORONI_TINYFX"
+LIB_DIRS = (REPO_DIR, BOARD_DIR / "visible_libs", BOARD_DIR / "frozen_libs")
+
+# The emulated modules, by the names they are imported as on the board
+MODULES = ("machine", "pimoroni_i2c", "breakout_msa301", "aye_arr", "aye_arr.nec", "aye_arr.nec.remotes")
+
+TRACE_HEADER = "time_us,device,pin,value"
+
+
+def ticks_us():
+    return _board.board.now_us() & TICKS_MAX
+
+
+def ticks_ms():
+    return (_board.board.now_us() // 1000) & TICKS_MAX
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def sleep(seconds):
+    _board.board.sleep_us(round(seconds * 1_000_000))
+
+
+def sleep_ms(ms):
+    _board.board.sleep_us(ms * 1000)
+
+
+def sleep_us(us):
+    _board.board.sleep_us(us)
+
+
+TIME_FUNCTIONS = {
+    "ticks_us": ticks_us,
+    "ticks_ms": ticks_ms,
+    "ticks_cpu": ticks_cpu,
+    "ticks_add": ticks_add,
+    "ticks_diff": ticks_diff,
+    "sleep_ms": sleep_ms,
+    "sleep_us": sleep_us,
+}
+
+
+def install(clock=None, trace=True, root=None, seed=None):
+    """
+    Sets up a fresh emulated board and makes it importable, returning the board.
+
+    `clock` is what the board keeps time by, which defaults to the host's real time,
+    `trace` is whether to record the outputs, and `root`, if given, is a directory
+    that stands in for the board's filesystem, so that paths like "/sound.wav" open
+    the files within it. `seed`, if given, seeds the random numbers that effects
+    like FlickerFX and RandomFX use.
+
+    On a VirtualClock, `time.sleep()` and asyncio wait on the board's clock too, so
+    that a program runs as fast as the host can manage, rather than in real time.
+    """
+    import asyncio
+    from importlib import import_module
+
+    from .loop import VirtualEventLoopPolicy
+
+    _board.board = Board(RealClock() if clock is None else clock, trace)
+
+    if seed is not None:
+        random.seed(seed)
+
+    for path in reversed(LIB_DIRS):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    for name in MODULES:
+        sys.modules[name] = import_module(f"{__name__}.{name}")
+
+    for name, function in TIME_FUNCTIONS.items():
+        setattr(time, name, function)
+
+    if _board.board.virtual:
+        time.sleep = sleep
+        asyncio.set_event_loop_policy(VirtualEventLoopPolicy())
+    else:
+        time.sleep = host_sleep
+        asyncio.set_event_loop_policy(None)
+
+    if root is not None:
+        _mount(pathlib.Path(root).resolve())
+
+    return _board.board
+
+
+def _mount(root):
+    # Absolute paths are opened from within the root whenever the file exists there, and left alone otherwise,
+    # so the host's own files can still be opened. The working directory is the root, as it is "/" on the board
+    host_open = getattr(builtins.open, "host_open", builtins.open)
+
+    def board_open(file, *args, **kwargs):
+        if isinstance(file, str) and file.startswith("/"):
+            path = root / file.lstrip("/")
+            if path.exists() or not pathlib.Path(file).parent.exists():
+                file = str(path)
+        return host_open(file, *args, **kwargs)
+
+    board_open.host_open = host_open
+    builtins.open = board_open
+    os.chdir(root)
+
+
+def write_trace(path, trace=None):
+    trace = _board.board.trace if trace is None else trace
+    with open(path, "w") as f:
+        f.write(TRACE_HEADER + "\n")
+        f.writelines(f"{time_us},{device},{pin},{value}\n" for time_us, device, pin, value in trace)
+
+
+def read_trace(path):
+    trace = []
+    with open(path) as f:
+        if f.readline().strip() != TRACE_HEADER:
+            raise ValueError(f"'{path}' is not an emulator trace")
+        for line in f:
+            time_us, device, pin, value = line.strip().split(",")
+            trace.append((int(time_us), device, int(pin), int(value)))
+    return trace
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import pathlib
+import runpy
+import sys
+import traceback
+
+from . import install, write_trace
+from .board import VirtualClock
+
+
+def scripted(text):
+    # Inputs are given as "WHAT@SECONDS", with the time defaulting to the start
+    what, _, at = text.partition("@")
+    try:
+        return what, float(at or 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"\"{text}\" is not of the form WHAT@SECONDS") from None
+
+
+def assignment(text):
+    name, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError(f"\"{text}\" is not of the form PIN=VALUE@SECONDS")
+    value, at = scripted(value)
+    return int(name), int(value), at
+
+
+def press(text):
+    button, at = scripted(text)
+    button, _, hold = button.partition(":")
+    return button, int(hold or 0), at
+
+
+def accel(text):
+    axes, at = scripted(text)
+    x, y, z = (float(axis) for axis in axes.split(","))
+    return x, y, z, at
+
+
+parser = argparse.ArgumentParser(prog="python -m tools.emulator", description="Run a Tiny FX example on the emulated board.")
+parser.add_argument("example", type=pathlib.Path, help="the example to run")
+parser.add_argument("-d", "--duration", type=float, default=10.0,
+                    help="how long to run the example for in seconds of the board's time, before interrupting it as Ctrl+C would (default 10, or 0 to let it run until it ends)")
+parser.add_argument("-t", "--trace", type=pathlib.Path, help="a CSV file to write the trace of the outputs to")
+parser.add_argument("-r", "--root", type=pathlib.Path, help="the directory to use as the board's filesystem (default: the example's directory)")
+parser.add_argument("-v", "--virtual", action="store_true",
+                    help="run on a virtual clock, as fast as the host can manage and with the same results every time")
+parser.add_argument("-s", "--seed", type=int,
+                    help="seed the random numbers that effects use (default: 0 on a virtual clock, otherwise unseeded)")
+parser.add_argument("--pin", type=assignment, action="append", default=[], metavar="PIN=VALUE@SECONDS",
+                    help="set an input pin at a given time, such as 22=0@2 to press Boot two seconds in")
+parser.add_argument("--adc", type=assignment, action="append", default=[], metavar="PIN=VALUE@SECONDS",
+                    help="set the 16 bit reading of an ADC pin at a given time")
+parser.add_argument("--ir", type=press, action="append", default=[], metavar="BUTTON[:HOLD_MS]@SECONDS",
+                    help="press a button on the IR remote at a given time, optionally holding it")
+parser.add_argument("--accel", type=accel, action="append", default=[], metavar="X,Y,Z@SECONDS",
+                    help="set the acceleration read by an MSA301 at a given time, in g")
+
+
+def main(args):
+    example = args.example.resolve()
+    trace = args.trace.resolve() if args.trace is not None else None
+    seed = 0 if args.seed is None and args.virtual else args.seed
+    board = install(VirtualClock() if args.virtual else None, root=args.root or example.parent, seed=seed)
+
+    for pin, value, at in args.pin:
+        board.at(int(at * 1_000_000), lambda pin=pin, value=value: board.set_pin(pin, value))
+    for pin, value, at in args.adc:
+        board.at(int(at * 1_000_000), lambda pin=pin, value=value: board.set_adc(pin, value))
+    for button, hold_ms, at in args.ir:
+        board.at(int(at * 1_000_000), lambda button=button, hold_ms=hold_ms: board.press(button, hold_ms))
+    for x, y, z, at in args.accel:
+        board.at(int(at * 1_000_000), lambda x=x, y=y, z=z: board.set_accel(x, y, z))
+
+    def interrupt():
+        raise KeyboardInterrupt
+
+    if args.duration > 0:
+        board.at(int(args.duration * 1_000_000), interrupt)
+
+    # The example runs as the main program, as it would on the board. Its directory comes last on the path,
+    # as modules built into MicroPython take priority over files of the same name, like examples named random.py
+    status = 0
+    sys.argv = [str(example)]
+    sys.path.append(str(example.parent))
+    board.attach()
+    try:
+        runpy.run_path(str(example), run_name="__main__")
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        board.detach()
+
+    seconds = board.seconds()
+    if trace is not None:
+        write_trace(trace, board.trace)
+
+    outputs = {}
+    for _, device, pin, value in board.trace:
+        outputs[(device, pin)] = outputs.get((device, pin), 0) + 1
+    summary = ", ".join(f"{device} {pin}: {count}" for (device, pin), count in sorted(outputs.items()))
+    print(f"Ran {example.name} for {seconds:.2f}s, with {len(board.trace)} output changes ({summary or 'none'})", file=sys.stderr)
+    return status
+
+
+sys.exit(main(parser.parse_args()))
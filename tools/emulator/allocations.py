@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Counts the allocations a show makes on each frame, on the host, as a guide
+to what it would allocate on MicroPython's heap. Pair it with the emulator
+to check a show of your own, for example:
+
+    from tools import emulator
+    emulator.install(trace=False)
+
+    from tools.emulator.allocations import Allocations
+    ...
+    print(Allocations(lambda: player.step(10)))
+"""
+
+import builtins
+import dis
+import gc
+import os
+import pathlib
+import sys
+import tracemalloc
+
+PICOFX_DIR = str(pathlib.Path(__file__).resolve().parents[2] / "picofx")
+
+
+class Allocations:
+    """
+    Counts what each frame of a player allocates, once the effects have settled.
+
+    `frame` is called to run one frame, first `warmup` times and then `frames`
+    more for each count. Only code in files under `root` is traced, which is
+    picofx by default, and can be the folder of a show's own effects instead.
+
+    `count` is the most operations in any one frame that would allocate on
+    MicroPython's heap: building a list, tuple, dict, set, slice, string or
+    function, or creating an instance of a class. These are found by tracing
+    each bytecode of the traced code as it runs, so objects that are thrown
+    away again straight after are still counted. Arithmetic on ints and floats
+    is not.
+
+    `growth` is how many more blocks the traced code had allocated after all the
+    frames than before them, as traced by tracemalloc with the garbage collector off.
+    Blocks the size of a boxed int are left out, as CPython boxes ints above
+    256 that are small ints on MicroPython, and state held in them comes and
+    goes as it changes.
+    """
+    BUILDS = frozenset(dis.opmap[name] for name in (
+        "BUILD_LIST", "BUILD_TUPLE", "BUILD_MAP", "BUILD_CONST_KEY_MAP", "BUILD_SET", "BUILD_SLICE",
+        "BUILD_STRING", "FORMAT_VALUE", "LIST_EXTEND", "MAKE_FUNCTION") if name in dis.opmap)
+    LOAD_GLOBAL = dis.opmap["LOAD_GLOBAL"]
+
+    # Types that are called without creating anything on MicroPython, for their value or to loop over
+    NOT_CREATED = (int, float, bool, range)
+
+    INT_SIZES = frozenset(sys.getsizeof(1 << bits) for bits in (16, 32, 64))
+
+    def __init__(self, frame, frames=50, warmup=50, root=PICOFX_DIR):
+        self.__root = str(pathlib.Path(root).resolve())
+        self.__counted = 0
+        self.__created = {}     # The offsets of calls that create an instance of a class, for each code object
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Let the effects settle, with anything they create on their first frames being left out
+            for _ in range(warmup):
+                frame()
+
+            self.count = 0
+            sys.settrace(self.__trace)
+            try:
+                for _ in range(frames):
+                    self.__counted = 0
+                    frame()
+                    self.count = max(self.count, self.__counted)
+            finally:
+                sys.settrace(None)
+
+            tracemalloc.start()
+            try:
+                before = self.__blocks()
+                for _ in range(frames):
+                    frame()
+                self.growth = self.__blocks() - before
+            finally:
+                tracemalloc.stop()
+        finally:
+            if enabled:
+                gc.enable()
+
+    def __blocks(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, os.path.join(self.__root, "*"))])
+        return sum(1 for trace in snapshot.traces if trace.size not in Allocations.INT_SIZES)
+
+    def __trace(self, frame, event, arg):
+        # Only the code under the root is traced, and only by its bytecodes
+        if not frame.f_code.co_filename.startswith(self.__root):
+            return None
+        frame.f_trace_lines = False
+        frame.f_trace_opcodes = True
+        return self.__opcode
+
+    def __opcode(self, frame, event, arg):
+        if event == "opcode":
+            code = frame.f_code
+            offset = frame.f_lasti
+            op = code.co_code[offset]
+            if op in Allocations.BUILDS or (op == Allocations.LOAD_GLOBAL and offset in self.__creates(frame)):
+                self.__counted += 1
+        return self.__opcode
+
+    def __creates(self, frame):
+        # Find where the code loads a class to call it. Loads of a global that is then called also push a NULL,
+        # shown by the lowest bit of their argument, which tells them apart from a class passed to isinstance()
+        code = frame.f_code
+        offsets = self.__created.get(code)
+        if offsets is None:
+            offsets = set()
+            for instruction in dis.get_instructions(code):
+                if instruction.opcode != Allocations.LOAD_GLOBAL or not instruction.arg & 1:
+                    continue
+                value = frame.f_globals.get(instruction.argval, getattr(builtins, instruction.argval, None))
+                if isinstance(value, type) and value not in Allocations.NOT_CREATED:
+                    offsets.add(instruction.offset)
+            self.__created[code] = offsets
+        return offsets
+
+    def __repr__(self):
+        return f"Allocations(count={self.count}, growth={self.growth})"
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from ... import board as _board
+from ...machine import _pin_id
+
+REPEAT_US = 108_000     # How often an NEC remote repeats whilst a button is held
+
+
+class NECRemoteReceiver:
+    def __init__(self, pin, pio=0, sm=0):
+        self.pin = _pin_id(pin)
+        self.__remotes = []
+        self.__received = []    # (time_us, remote, button, kind) for each code received but not yet decoded
+        self.__running = False
+
+    def bind(self, remote):
+        self.__remotes.append(remote)
+
+    def start(self):
+        if not self.__running:
+            self.__running = True
+            _board.board.remotes.append(self)
+
+    def stop(self):
+        if self.__running:
+            self.__running = False
+            _board.board.remotes.remove(self)
+        self.__received.clear()
+
+    def _press(self, button, hold_ms):
+        # Called by the board to send a button press, with the codes it makes queued up
+        # to be handled as decode() reaches the time they would have been received
+        start_us = _board.board.now_us()
+        hold_us = hold_ms * 1000
+        for remote in self.__remotes:
+            self.__received.append((start_us, remote, button, "press"))
+            for repeat_us in range(REPEAT_US, hold_us, REPEAT_US):
+                self.__received.append((start_us + repeat_us, remote, button, "repeat"))
+            self.__received.append((start_us + hold_us, remote, button, "release"))
+        self.__received.sort(key=lambda code: code[0])
+
+    def decode(self):
+        _board.board.idle()
+        now_us = _board.board.now_us()
+        received = self.__received
+        while received and received[0][0] <= now_us:
+            _, remote, button, kind = received.pop(0)
+            remote._receive(button, kind)
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+
+def _call(action):
+    # Actions are either a function, or a tuple of a function and the arguments to give it
+    if action is None:
+        return
+    if isinstance(action, tuple):
+        action[0](*action[1:])
+    else:
+        action()
+
+
+class NECRemote:
+    LONG_REPEATS = 8    # How many repeats a held button needs to count as a long press, rather than a short one
+
+    def __init__(self):
+        self.__bindings = {}
+        self.__repeats = {}
+
+    def bind(self, button, on_press=None, on_short=None, on_long=None, on_repeat=None, on_release=None):
+        self.__bindings[button] = (on_press, on_short, on_long, on_repeat, on_release)
+
+    def unbind(self, button):
+        self.__bindings.pop(button, None)
+
+    def _receive(self, button, kind):
+        binding = self.__bindings.get(button)
+        if binding is None:
+            return
+        on_press, on_short, on_long, on_repeat, on_release = binding
+        if kind == "press":
+            self.__repeats[button] = 0
+            _call(on_press)
+        elif kind == "repeat":
+            self.__repeats[button] = self.__repeats.get(button, 0) + 1
+            _call(on_repeat)
+        else:
+            _call(on_short if self.__repeats.pop(button, 0) < self.LONG_REPEATS else on_long)
+            _call(on_release)
+
+
+class PimoroniRemote(NECRemote):
+    BUTTONS = ("1_RED", "2_GREEN", "3_BLUE", "4_CYAN", "5_MAGENTA", "6_YELLOW", "7_WARM", "8_WHITE", "9_COOL",
+               "UP", "DOWN", "LEFT", "RIGHT", "OK_STOP", "CLOCKWISE", "ANTICLOCK")
@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import heapq
+import itertools
+import signal
+import sys
+import time
+import traceback
+
+# The host's own sleep, as time.sleep() is replaced when running on a virtual clock
+host_sleep = time.sleep
+
+# MicroPython's ticks wrap around, which ticks_diff() and ticks_add() allow for
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALF = TICKS_PERIOD // 2
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    return ((ticks1 - ticks2 + TICKS_HALF) & TICKS_MAX) - TICKS_HALF
+
+
+class RealClock:
+    """A clock that follows the host's own time, counting from when it was created."""
+    virtual = False
+
+    def __init__(self):
+        self.__start_ns = time.perf_counter_ns()
+
+    def now_us(self):
+        return (time.perf_counter_ns() - self.__start_ns) // 1000
+
+
+class VirtualClock:
+    """
+    A clock that only moves when it is told to. As well as keeping time for
+    the board, it has MicroPython's ticks functions, so it can be given to
+    anything that takes a clock, such as an EffectPlayer.
+    """
+    virtual = True
+
+    def __init__(self, start_us=0):
+        self.us = start_us
+
+    def now_us(self):
+        return self.us
+
+    def advance(self, us):
+        self.us += us
+
+    def ticks_us(self):
+        return self.us & TICKS_MAX
+
+    def ticks_ms(self):
+        return (self.us // 1000) & TICKS_MAX
+
+    ticks_add = staticmethod(ticks_add)
+    ticks_diff = staticmethod(ticks_diff)
+
+
+class Board:
+    """
+    The state shared by all the emulated devices: the clock they run from,
+    the inputs scripted for them, the events waiting to happen, and the
+    trace of everything the outputs have been told to do.
+
+    Events are only run when something asks for them, either by calling
+    `run_due()`, or by `attach()`-ing the board to the host's real time, at
+    which point they are run from a SIGALRM handler. This interrupts the main
+    thread between bytecodes, much like a soft IRQ on MicroPython.
+
+    On a virtual clock, time instead moves on as the program waits for it.
+    Sleeping moves it on by however long was asked for, and reading an input
+    moves it on to the next event, up to `poll_us` later. Once attached, a
+    program that spins without doing either for a tenth of a second of real
+    time is moved on in the same way as reading an input. Events are run at the
+    exact time they are due, so a program gives the same results on every
+    run, however fast or slow the host is.
+    """
+    STALL_S = 0.001
+    STALL_CHECKS = 100
+
+    def __init__(self, clock=None, trace=True, poll_us=10_000):
+        self.clock = RealClock() if clock is None else clock
+        self.virtual = self.clock.virtual
+        self.poll_us = poll_us
+        self.tracing = trace
+        self.trace = []             # (time_us, device, pin, value) for every change to an output
+        self.pins = {}              # Scripted values for input pins, by pin number
+        self.adcs = {}              # Scripted readings for ADCs, by pin number
+        self.accel = (0.0, 0.0, 1.0)
+        self.remotes = []           # IR receivers, to be sent button presses
+        self.__irqs = {}            # The pins with an IRQ handler, by pin number
+        self.__events = []          # A heap of (due_us, sequence, function) entries
+        self.__sequence = itertools.count()
+        self.__attached = False
+        self.__dispatching = False
+        self.__stalled_us = None
+        self.__stalls = 0
+        self.__spun_us = None
+
+    def now_us(self):
+        return self.clock.now_us()
+
+    def seconds(self):
+        return self.clock.now_us() / 1_000_000
+
+    def record(self, device, pin, value):
+        if self.tracing:
+            self.trace.append((self.clock.now_us(), device, pin, value))
+
+    # Inputs
+    def read(self, inputs, pin, default):
+        # An input is either a fixed value, or a function of the time in seconds
+        value = inputs.get(pin, default)
+        return value(self.seconds()) if callable(value) else value
+
+    def set_pin(self, pin, value):
+        self.pins[pin] = value
+        for irq in self.__irqs.get(pin, ()):
+            irq._changed()
+
+    def set_adc(self, pin, value):
+        self.adcs[pin] = value
+
+    def set_accel(self, x, y, z):
+        self.accel = (x, y, z)
+
+    def press(self, button, hold_ms=0):
+        for receiver in self.remotes:
+            receiver._press(button, hold_ms)
+
+    def _watch(self, pin, irq):
+        irqs = self.__irqs.setdefault(pin, [])
+        if irq not in irqs:
+            irqs.append(irq)
+
+    def _unwatch(self, pin, irq):
+        irqs = self.__irqs.get(pin, [])
+        if irq in irqs:
+            irqs.remove(irq)
+
+    # Events
+    def at(self, due_us, function):
+        # Returns an entry that can be passed to cancel(). Heap operations are single calls into C,
+        # so are never interrupted part way by the SIGALRM handler
+        entry = [due_us, next(self.__sequence), function]
+        heapq.heappush(self.__events, entry)
+        self.__rearm()
+        return entry
+
+    def after(self, delay_us, function):
+        return self.at(self.clock.now_us() + delay_us, function)
+
+    def cancel(self, entry):
+        if entry is not None:
+            entry[2] = None
+
+    def next_due(self):
+        events = self.__events
+        while events and events[0][2] is None:
+            heapq.heappop(events)
+        return events[0][0] if events else None
+
+    def run_due(self):
+        # Run every event whose time has come. Events that are added along the way are run too if they were
+        # already due when this began, so that a late periodic timer catches up but cannot run forever
+        events = self.__events
+        now = self.clock.now_us()
+        dispatching = self.__dispatching
+        self.__dispatching = True
+        try:
+            while True:
+                due = self.next_due()
+                if due is None or due > now:
+                    return
+                function = heapq.heappop(events)[2]
+                try:
+                    function()
+                except KeyboardInterrupt:
+                    raise
+                except Exception:
+                    print("Uncaught exception in IRQ callback handler", file=sys.stderr)
+                    traceback.print_exc()
+        finally:
+            self.__dispatching = dispatching
+
+    # Virtual time
+    def sleep_us(self, us):
+        if self.virtual:
+            self.advance_to(self.clock.now_us() + us)
+        else:
+            host_sleep(us / 1_000_000)
+
+    def idle(self):
+        # Called whenever the program reads an input. Time does not move for anything an event does, as
+        # it would otherwise be measured as spending time on the event when it was really spent waiting
+        if self.virtual and not self.__dispatching:
+            now = self.clock.now_us()
+            due = self.next_due()
+            self.advance_to(now + self.poll_us if due is None else min(max(due, now), now + self.poll_us))
+
+    def advance_to(self, target_us):
+        # Move a virtual clock on to the given time, stopping at each event along the way to run it
+        if self.__dispatching:
+            return
+        clock = self.clock
+        self.__dispatching = True
+        try:
+            while True:
+                due = self.next_due()
+                if due is None or due > target_us:
+                    break
+                clock.us = max(clock.us, due)
+                self.run_due()
+            clock.us = max(clock.us, target_us)
+        finally:
+            self.__dispatching = False
+
+    def attach(self):
+        # Start running events in real time, from the main thread, or watching for a program that spins on a virtual clock
+        self.__attached = True
+        if self.virtual:
+            signal.signal(signal.SIGALRM, self.__stall)
+            signal.setitimer(signal.ITIMER_REAL, self.STALL_S, self.STALL_S)
+        else:
+            signal.signal(signal.SIGALRM, self.__alarm)
+            self.__rearm()
+
+    def detach(self):
+        if self.__attached:
+            self.__attached = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, signal.SIG_DFL)
+
+    def __stall(self, signum, frame):
+        # Checked every millisecond. A program that has not moved time on for a while is taken to be spinning,
+        # and once it is, time is moved on at every check until the program moves it on itself. The wait is
+        # long enough that a program busy with work of its own is not moved on part way, which would differ
+        # from run to run
+        now = self.clock.now_us()
+        if now == self.__spun_us or (now == self.__stalled_us and self.__stalls >= self.STALL_CHECKS):
+            self.idle()
+            self.__spun_us = self.clock.now_us()
+        elif now == self.__stalled_us:
+            self.__stalls += 1
+        else:
+            self.__stalls = 0
+            self.__spun_us = None
+        self.__stalled_us = now
+
+    def __alarm(self, signum, frame):
+        try:
+            self.run_due()
+        finally:
+            self.__rearm()
+
+    def __rearm(self):
+        # The alarm is re-armed at the end of each dispatch, so not while one is running
+        if not self.__attached or self.__dispatching or self.virtual:
+            return
+        due = self.next_due()
+        if due is None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        else:
+            signal.setitimer(signal.ITIMER_REAL, max(due - self.clock.now_us(), 1) / 1_000_000)
+
+
+# The board the emulated devices belong to, which install() replaces with a fresh one
+board = Board()
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from . import board as _board
+
+
+class BreakoutMSA301:
+    DEFAULT_I2C_ADDRESS = 0x26
+
+    ACTIVE = 0b0000000000000111
+    SINGLE_TAP = 0b0000000000100000
+    DOUBLE_TAP = 0b0000000000010000
+    ORIENTATION = 0b0000000001000000
+    FREEFALL = 0b0000100000000000
+    NEW_DATA = 0b0001000000000000
+
+    X_AXIS = 0
+    Y_AXIS = 1
+    Z_AXIS = 2
+
+    def __init__(self, i2c, address=DEFAULT_I2C_ADDRESS, interrupt=None):
+        self.address = address
+        self.__interrupts = 0
+        if hasattr(i2c, "devices"):
+            i2c.devices.append(address)
+
+    def enable_interrupts(self, interrupts):
+        self.__interrupts |= interrupts
+
+    def disable_interrupts(self, interrupts):
+        self.__interrupts &= ~interrupts
+
+    def get_axis(self, axis, sample_count=1):
+        # The acceleration is scripted on the board in g, either as fixed values or a function of the time in seconds
+        _board.board.idle()
+        accel = _board.board.accel
+        if callable(accel):
+            accel = accel(_board.board.seconds())
+        return float(accel[axis])
+
+    def get_x_axis(self, sample_count=1):
+        return self.get_axis(self.X_AXIS, sample_count)
+
+    def get_y_axis(self, sample_count=1):
+        return self.get_axis(self.Y_AXIS, sample_count)
+
+    def get_z_axis(self, sample_count=1):
+        return self.get_axis(self.Z_AXIS, sample_count)
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import math
+import selectors
+
+from . import board as _board
+
+
+class VirtualSelector(selectors.BaseSelector):
+    """
+    A selector for asyncio that never has anything to read or write, and
+    waits by moving the board's virtual clock on rather than blocking.
+    """
+    def __init__(self):
+        self.__keys = {}
+
+    def register(self, fileobj, events, data=None):
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        key = selectors.SelectorKey(fileobj, fd, events, data)
+        self.__keys[fileobj] = key
+        return key
+
+    def unregister(self, fileobj):
+        return self.__keys.pop(fileobj)
+
+    def get_map(self):
+        return self.__keys
+
+    def select(self, timeout=None):
+        # Rounded up, so the loop always reaches the time it was waiting for
+        if timeout is None:
+            _board.board.idle()
+        elif timeout > 0:
+            _board.board.sleep_us(math.ceil(timeout * 1_000_000))
+        return []
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """An asyncio event loop that keeps time by the board's virtual clock."""
+    def __init__(self):
+        super().__init__(VirtualSelector())
+
+    def time(self):
+        return _board.board.seconds()
+
+
+class VirtualEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    def new_event_loop(self):
+        return VirtualEventLoop()
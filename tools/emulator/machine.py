@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+An emulation of MicroPython's `machine` module for RP2040 boards, covering
+Pin, PWM, ADC, Timer and I2S. Outputs are recorded into the board's trace,
+inputs are read from what has been scripted on the board, and timers and
+I2S interrupts are run as events on the board's clock.
+"""
+
+from . import board as _board
+
+ADC_PINS = (26, 27, 28, 29)     # The pins for ADC channels 0 to 3
+
+
+def _pin_id(pin):
+    return pin.id if isinstance(pin, Pin) else pin
+
+
+def freq(hz=None):
+    if hz is None:
+        return 125_000_000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    ALT = 3
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = _pin_id(id)
+        self.__mode = self.IN
+        self.__pull = None
+        self.__out = 0
+        self.__handler = None
+        self.__trigger = 0
+        self.__level = 0
+        self.init(mode, pull, value)
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if mode != -1:
+            self.__mode = mode
+        if pull != -1:
+            self.__pull = pull
+        if value is not None:
+            self.value(value)
+
+    def value(self, value=None):
+        if value is None:
+            if self.__mode == self.OUT:
+                return self.__out
+            _board.board.idle()
+            return self.__input()
+        value = int(bool(value))
+        if value != self.__out:
+            self.__out = value
+            if self.__mode == self.OUT:
+                _board.board.record("pin", self.id, value)
+
+    def __input(self):
+        # An unscripted input floats to its pull, or reads low without one
+        return int(bool(_board.board.read(_board.board.pins, self.id, 1 if self.__pull == self.PULL_UP else 0)))
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def high(self):
+        self.value(1)
+
+    def low(self):
+        self.value(0)
+
+    def toggle(self):
+        self.value(1 - self.__out)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        self.__handler = handler
+        self.__trigger = trigger
+        self.__level = self.__input()
+        if handler is None:
+            _board.board._unwatch(self.id, self)
+        else:
+            _board.board._watch(self.id, self)
+
+    def _changed(self):
+        # Called by the board when a scripted input is set, with the handler run as an event like a soft IRQ
+        value = self.__input()
+        if value == self.__level:
+            return
+        self.__level = value
+        if self.__trigger & (self.IRQ_RISING if value else self.IRQ_FALLING):
+            handler = self.__handler
+            _board.board.after(0, lambda: handler(self))
+
+    def __repr__(self):
+        return f"Pin({self.id})"
+
+
+class PWM:
+    MAX_DUTY = 65535
+
+    def __init__(self, dest, freq=0, duty_u16=None, duty_ns=None, invert=False):
+        self.pin = _pin_id(dest)
+        self.__freq = freq
+        self.__invert = invert
+        self.__duty = None
+        self.__level = None
+        self.duty_u16(0 if duty_u16 is None else duty_u16)
+
+    def init(self, freq=None, duty_u16=None, invert=None):
+        if freq is not None:
+            self.__freq = freq
+        if invert is not None:
+            self.__invert = invert
+        if duty_u16 is not None:
+            self.duty_u16(duty_u16)
+
+    def freq(self, value=None):
+        if value is None:
+            return self.__freq
+        self.__freq = value
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self.__duty
+        self.__duty = min(max(int(value), 0), self.MAX_DUTY)
+
+        # The trace holds the level seen on the pin, so inverted outputs read the same as any other
+        level = self.MAX_DUTY - self.__duty if self.__invert else self.__duty
+        if level != self.__level:
+            self.__level = level
+            _board.board.record("pwm", self.pin, level)
+
+    def duty_ns(self, value=None):
+        period_ns = 1_000_000_000 // self.__freq if self.__freq else 0
+        if value is None:
+            return (self.__duty * period_ns) // self.MAX_DUTY
+        self.duty_u16((value * self.MAX_DUTY) // period_ns if period_ns else 0)
+
+    def deinit(self):
+        self.duty_u16(0)
+
+
+class ADC:
+    CORE_TEMP = 4
+
+    def __init__(self, pin):
+        pin = _pin_id(pin)
+        self.pin = ADC_PINS[pin] if 0 <= pin < len(ADC_PINS) else pin
+
+    def read_u16(self):
+        _board.board.idle()
+        value = _board.board.read(_board.board.adcs, self.pin, 0)
+        return min(max(int(value), 0), 65535)
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, mode=PERIODIC, period=-1, freq=-1, callback=None):
+        self.__callback = None
+        self.__period_us = 0
+        self.__mode = mode
+        self.__entry = None
+        if callback is not None:
+            self.init(mode=mode, period=period, freq=freq, callback=callback)
+
+    def init(self, mode=PERIODIC, period=-1, freq=-1, tick_hz=1000, callback=None):
+        self.deinit()
+        if freq > 0:
+            self.__period_us = round(1_000_000 / freq)
+        else:
+            self.__period_us = (period * 1_000_000) // tick_hz
+        self.__mode = mode
+        self.__callback = callback
+        if callback is not None:
+            self.__entry = _board.board.after(self.__period_us, self.__expire)
+
+    def deinit(self):
+        _board.board.cancel(self.__entry)
+        self.__entry = None
+        self.__callback = None
+
+    def fire(self):
+        # Run the timer's callback once, as if its period had elapsed, without changing when it is next due
+        if self.__callback is not None:
+            self.__callback(self)
+
+    def __expire(self):
+        due_us = self.__entry[0]
+        self.__entry = None
+
+        # Periodic timers are due again a whole period after they were last due, rather than after they ran,
+        # so do not drift. A callback that raises is not run again, as with an IRQ on MicroPython
+        callback = self.__callback
+        if self.__mode == self.PERIODIC:
+            self.__entry = _board.board.at(due_us + max(self.__period_us, 1), self.__expire)
+        try:
+            callback(self)
+        except BaseException:
+            if self.__callback is callback:
+                self.deinit()
+            raise
+
+
+class I2S:
+    TX = 0
+    RX = 1
+    MONO = 0
+    STEREO = 1
+
+    def __init__(self, id, sck=None, ws=None, sd=None, mck=None, mode=TX, bits=16, format=MONO, rate=44_100, ibuf=20_000):
+        self.id = id
+        self.__bytes_per_us = (bits // 8) * (2 if format == self.STEREO else 1) * rate / 1_000_000
+        self.__handler = None
+        self.__entry = None
+        self.__playing_until_us = 0
+
+    def irq(self, handler):
+        self.__handler = handler
+
+    def write(self, buf):
+        # The samples are taken at once, and the IRQ runs when they would have finished playing,
+        # so writing from the IRQ keeps audio streaming at the rate it would on the board
+        size = len(buf)
+        _board.board.record("i2s", self.id, size)
+        start_us = max(self.__playing_until_us, _board.board.now_us())
+        self.__playing_until_us = start_us + int(size / self.__bytes_per_us)
+        if self.__handler is not None:
+            _board.board.cancel(self.__entry)
+            self.__entry = _board.board.at(self.__playing_until_us, self.__done)
+        return size
+
+    def readinto(self, buf):
+        for i in range(len(buf)):
+            buf[i] = 0
+        return len(buf)
+
+    def __done(self):
+        self.__entry = None
+        if self.__handler is not None:
+            self.__handler(self)
+
+    def deinit(self):
+        _board.board.cancel(self.__entry)
+        self.__entry = None
+        self.__handler = None
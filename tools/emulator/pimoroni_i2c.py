@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+from .machine import _pin_id
+
+
+class PimoroniI2C:
+    def __init__(self, sda, scl, baudrate=400_000):
+        self.sda = _pin_id(sda)
+        self.scl = _pin_id(scl)
+        self.baudrate = baudrate
+        self.devices = []       # The addresses of the breakouts created on this bus
+
+    def scan(self):
+        return sorted(self.devices)
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Golden frames for every built-in effect. Each case plays an effect, at its
+defaults or at some representative parameters, through a player for a fixed
+number of frames, and the frames shown are kept in a golden file. Checking
+renders them again and compares them against the file, so that a change to
+picofx that alters what an effect shows is caught, however small.
+
+Mono frames are kept as 16 bit levels and colour frames as 8 bit channels.
+Tolerances are given in 8 bit levels for both, so a tolerance of 1 allows
+either to be off by 1/255 of full brightness.
+"""
+
+import struct
+import zlib
+
+MAGIC = b"PFXG"
+VERSION = 1
+
+MONO = 0
+COLOUR = 1
+
+TOLERANCE = 1
+
+
+class Golden:
+    """The frames of one case: `data` holds every frame one after another, each with `channels` values per LED."""
+    def __init__(self, name, kind, num_leds, frames, delta_ms, data):
+        self.name = name
+        self.kind = kind
+        self.num_leds = num_leds
+        self.frames = frames
+        self.delta_ms = delta_ms
+        self.data = data
+
+    @property
+    def channels(self):
+        return 3 if self.kind == COLOUR else 1
+
+    @property
+    def scale(self):
+        # How many of the stored units make one 8 bit level
+        return 1 if self.kind == COLOUR else 257
+
+    def value(self, frame, led, channel):
+        index = (frame * self.num_leds + led) * self.channels + channel
+        return self.data[index]
+
+    def same_shape(self, other):
+        return (self.kind, self.num_leds, self.frames, self.delta_ms) == (other.kind, other.num_leds, other.frames, other.delta_ms)
+
+
+def compare(golden, actual, tolerance=TOLERANCE):
+    # Returns None if the frames match to within the tolerance, or the first difference,
+    # as a tuple of the frame, LED, channel, and the golden and actual values
+    if not golden.same_shape(actual):
+        raise ValueError(f"{golden.name} was rendered differently to its golden, so cannot be compared")
+    limit = tolerance * golden.scale
+    for index, (expected, value) in enumerate(zip(golden.data, actual.data)):
+        if abs(expected - value) > limit:
+            pixel, channel = divmod(index, golden.channels)
+            frame, led = divmod(pixel, golden.num_leds)
+            return frame, led, channel, expected, value
+    return None
+
+
+def describe(difference):
+    frame, led, channel, expected, value = difference
+    return f"frame {frame}, LED {led}, channel {channel}: expected {expected}, got {value}"
+
+
+def save(path, goldens):
+    with open(path, "wb") as f:
+        f.write(MAGIC + struct.pack("<BH", VERSION, len(goldens)))
+        for golden in goldens:
+            name = golden.name.encode()
+            if golden.kind == COLOUR:
+                data = bytes(golden.data)
+            else:
+                data = struct.pack(f"<{len(golden.data)}H", *golden.data)
+            data = zlib.compress(data, 9)
+            f.write(struct.pack("<B", len(name)) + name)
+            f.write(struct.pack("<BHIHI", golden.kind, golden.num_leds, golden.frames, golden.delta_ms, len(data)))
+            f.write(data)
+
+
+def load(path):
+    goldens = {}
+    with open(path, "rb") as f:
+        magic = f.read(4)
+        version, count = struct.unpack("<BH", f.read(3))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a version {VERSION} golden file")
+        for _ in range(count):
+            name = f.read(f.read(1)[0]).decode()
+            kind, num_leds, frames, delta_ms, size = struct.unpack("<BHIHI", f.read(13))
+            data = zlib.decompress(f.read(size))
+            if kind == MONO:
+                data = list(struct.unpack(f"<{len(data) // 2}H", data))
+            goldens[name] = Golden(name, kind, num_leds, frames, delta_ms, data)
+    return goldens
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import pathlib
+import sys
+
+from ..emulator import REPO_DIR, install
+
+# picofx needs a machine module to import, which the emulator provides
+install(trace=False)
+
+from . import TOLERANCE, compare, describe, load, save  # noqa: E402
+from .effects import CASES, DELTA_MS, FRAMES, render  # noqa: E402
+
+parser = argparse.ArgumentParser(prog="python -m tools.golden", description="Check the built-in effects against their golden frames, or record new ones.")
+parser.add_argument("-f", "--file", type=pathlib.Path, default=REPO_DIR / "tests" / "goldens.bin", help="the golden file (default: tests/goldens.bin)")
+parser.add_argument("-s", "--save", action="store_true", help="record the current frames as the goldens, rather than checking against them")
+parser.add_argument("-t", "--tolerance", type=int, default=TOLERANCE, help=f"how many 8 bit levels a channel may differ by (default {TOLERANCE})")
+parser.add_argument("-n", "--frames", type=int, default=FRAMES, help=f"how many frames to record when saving (default {FRAMES})")
+parser.add_argument("cases", nargs="*", help="the cases to check or save (default: all of them)")
+
+
+def main(args):
+    names = args.cases or [name for name, _, _ in CASES]
+
+    if args.save:
+        # Any cases not being saved keep their existing goldens
+        goldens = load(args.file) if args.file.exists() else {}
+        goldens.update((name, render(name, args.frames, DELTA_MS)) for name in names)
+        save(args.file, list(goldens.values()))
+        print(f"Saved {len(names)} goldens of {args.frames} frames to {args.file}")
+        return 0
+
+    goldens = load(args.file)
+    failed = 0
+    for name in names:
+        golden = goldens.get(name)
+        if golden is None:
+            print(f"{name}: no golden frames")
+            failed += 1
+            continue
+        difference = compare(golden, render(name, golden.frames, golden.delta_ms), args.tolerance)
+        if difference is None:
+            print(f"{name}: ok")
+        else:
+            print(f"{name}: differs at {describe(difference)}")
+            failed += 1
+
+    print(f"{len(names) - failed} of {len(names)} match their goldens")
+    return 1 if failed else 0
+
+
+sys.exit(main(parser.parse_args()))
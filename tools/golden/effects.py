@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+The cases that golden frames are kept for, and how they are rendered. This
+imports picofx, so needs a `machine` module to be importable first.
+"""
+
+import random
+
+from picofx import PWMLED, RGBLED, ColourPlayer, MonoPlayer, wavetable
+from picofx.colour import BLUE, GREEN, HSVFX, RED, RGBFX, HueStepFX, RainbowFX, RainbowWaveFX, RGBBlinkFX
+from picofx.mono import BinaryCounterFX, BlinkFX, BlinkWaveFX, FlashFX, FlashSequenceFX, FlickerFX, NoneFX, PulseFX, PulseWaveFX, RandomFX, StaticFX, TrafficLightFX, WaveformFX, WaveformWaveFX
+
+from ..emulator.board import VirtualClock
+from . import COLOUR, MONO, Golden
+
+FRAMES = 500
+DELTA_MS = 10
+SEED = 0
+
+
+def _outputs(effect, count=6):
+    return [effect(i) for i in range(count)]
+
+
+def _lights(traffic):
+    return [traffic.red(), traffic.amber(), traffic.green()]
+
+
+# Each case is a name, whether it is for mono or colour LEDs, and a function that creates the entries to play, one per LED
+CASES = [
+    ("BinaryCounterFX", MONO, lambda: _outputs(BinaryCounterFX())),
+    ("BinaryCounterFX/fast", MONO, lambda: _outputs(BinaryCounterFX(interval=0.03, count=7, step=3))),
+    ("BlinkFX", MONO, lambda: [BlinkFX()]),
+    ("BlinkFX/params", MONO, lambda: [BlinkFX(speed=2.5, phase=0.25, duty=0.2)]),
+    ("BlinkWaveFX", MONO, lambda: _outputs(BlinkWaveFX())),
+    ("BlinkWaveFX/params", MONO, lambda: _outputs(BlinkWaveFX(speed=0.7, length=6, phase=0.1, duty=0.3))),
+    ("FlashFX", MONO, lambda: [FlashFX()]),
+    ("FlashFX/params", MONO, lambda: [FlashFX(speed=1.5, flashes=3, window=0.4, phase=0.2, duty=0.4)]),
+    ("FlashSequenceFX", MONO, lambda: _outputs(FlashSequenceFX())),
+    ("FlashSequenceFX/params", MONO, lambda: _outputs(FlashSequenceFX(speed=0.8, length=6, flashes=2, window=0.5, phase=0.1, duty=0.6))),
+    ("FlickerFX", MONO, lambda: [FlickerFX()]),
+    ("FlickerFX/params", MONO, lambda: [FlickerFX(brightness=0.8, dimness=0.2, bright_min=0.02, bright_max=0.3, dim_min=0.01, dim_max=0.1)]),
+    ("NoneFX", MONO, lambda: [NoneFX()]),
+    ("PulseFX", MONO, lambda: [PulseFX()]),
+    ("PulseFX/params", MONO, lambda: [PulseFX(speed=3.3, phase=0.4)]),
+    ("PulseWaveFX", MONO, lambda: _outputs(PulseWaveFX())),
+    ("PulseWaveFX/params", MONO, lambda: _outputs(PulseWaveFX(speed=0.5, length=6, phase=0.3))),
+    ("RandomFX", MONO, lambda: [RandomFX()]),
+    ("RandomFX/params", MONO, lambda: [RandomFX(interval=0.2, brightness_min=0.2, brightness_max=0.8)]),
+    ("StaticFX", MONO, lambda: [StaticFX()]),
+    ("StaticFX/params", MONO, lambda: [StaticFX(0.37)]),
+    ("TrafficLightFX", MONO, lambda: _lights(TrafficLightFX())),
+    ("TrafficLightFX/params", MONO, lambda: _lights(TrafficLightFX(red_interval=0.8, red_amber_interval=0.4, green_interval=0.8, amber_interval=0.6,
+                                                                   fade_rate=0.05, amber_flashing=True))),
+    ("WaveformFX", MONO, lambda: [WaveformFX()]),
+    ("WaveformFX/params", MONO, lambda: [WaveformFX(shape=wavetable.ease, speed=1.7, phase=0.3)]),
+    ("WaveformWaveFX", MONO, lambda: _outputs(WaveformWaveFX())),
+    ("WaveformWaveFX/params", MONO, lambda: _outputs(WaveformWaveFX(shape=wavetable.triangle, speed=0.9, length=6, phase=0.2))),
+    ("RGBFX", COLOUR, lambda: [RGBFX()]),
+    ("RGBFX/params", COLOUR, lambda: [RGBFX(200, 100, 30)]),
+    ("HSVFX", COLOUR, lambda: [HSVFX()]),
+    ("HSVFX/params", COLOUR, lambda: [HSVFX(0.7, 0.5, 0.8)]),
+    ("RainbowFX", COLOUR, lambda: [RainbowFX()]),
+    ("RainbowFX/params", COLOUR, lambda: [RainbowFX(speed=2.2, sat=0.8, val=0.6)]),
+    ("RainbowWaveFX", COLOUR, lambda: _outputs(RainbowWaveFX())),
+    ("RainbowWaveFX/params", COLOUR, lambda: _outputs(RainbowWaveFX(speed=0.6, length=6, sat=0.9, val=0.7))),
+    ("HueStepFX", COLOUR, lambda: [HueStepFX()]),
+    ("HueStepFX/params", COLOUR, lambda: [HueStepFX(interval=0.1, hue=0.3, sat=0.8, val=0.9, steps=4)]),
+    ("RGBBlinkFX", COLOUR, lambda: [RGBBlinkFX()]),
+    ("RGBBlinkFX/params", COLOUR, lambda: [RGBBlinkFX(colour=[RED, GREEN, BLUE], speed=2, phase=0.1, duty=0.3)]),
+]
+
+
+def render(name, frames=FRAMES, delta_ms=DELTA_MS):
+    # Randomness is seeded for each case, so the effects that use it show the same on every render
+    _, kind, entries = next(case for case in CASES if case[0] == name)
+    random.seed(SEED)
+    entries = entries()
+    num_leds = len(entries)
+
+    clock = VirtualClock()
+    if kind == COLOUR:
+        player = ColourPlayer([RGBLED(i, i, i) for i in range(num_leds)], clock=clock)
+        data = bytearray()
+    else:
+        player = MonoPlayer([PWMLED(i) for i in range(num_leds)], clock=clock)
+        data = []
+    player.effects = entries
+
+    frame = player.new_frame()
+    for _ in range(frames):
+        player.step(delta_ms, frame)
+        if kind == COLOUR:
+            data.extend(frame)
+        else:
+            data.extend(round(min(max(level, 0.0), 1.0) * 65535) for level in frame)
+
+    return Golden(name, kind, num_leds, frames, delta_ms, data)
@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Previews of shows far larger than a board could play, rendered on the host
+with NumPy. The renderer itself is in `render`, which imports picofx, so the
+emulator (or another `machine` module) needs installing before it is used.
+
+Render an effect across ten thousand LEDs for a minute with:
+
+    python -m tools.preview "PulseWaveFX(speed=0.5, length=100)" --leds 10000 --duration 60 --output show.npy
+"""
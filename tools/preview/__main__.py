@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import pathlib
+import sys
+import time
+
+import numpy as np
+
+from ..emulator import install
+
+# picofx needs a machine module to import, which the emulator provides
+install(trace=False)
+
+import picofx.colour  # noqa: E402
+import picofx.mono  # noqa: E402
+from picofx import CyclingWave, wavetable  # noqa: E402
+
+from .render import Preview  # noqa: E402
+
+CHUNK = 100     # How many frames are rendered at once, which keeps memory use down for long shows
+
+parser = argparse.ArgumentParser(prog="python -m tools.preview", description="Render an effect across many LEDs, as quickly as possible.")
+parser.add_argument("effect", help='the effect to play, as Python, such as "PulseWaveFX(speed=0.5, length=100)"')
+parser.add_argument("-n", "--leds", type=int, default=10_000, help="how many LEDs to play it on (default 10000)")
+parser.add_argument("-d", "--duration", type=float, default=60.0, help="how long to render in seconds (default 60)")
+parser.add_argument("-f", "--fps", type=int, default=100, help="the frames per second to render at (default 100)")
+parser.add_argument("-o", "--output", type=pathlib.Path, help="a .npy file to save the frames to, of brightnesses for mono effects, or R, G, B bytes for colour")
+
+
+def main(args):
+    names = {"wavetable": wavetable}
+    names.update((name, getattr(picofx.mono, name)) for name in dir(picofx.mono) if not name.startswith("_"))
+    names.update((name, getattr(picofx.colour, name)) for name in dir(picofx.colour) if not name.startswith("_"))
+    effect = eval(args.effect, names)
+
+    # Waves are spread along the LEDs, while anything else is shown the same on all of them
+    if isinstance(effect, CyclingWave):
+        effect_list = [effect(i) for i in range(args.leds)]
+    else:
+        effect_list = [effect] * args.leds
+    colour = type(effect).__module__.startswith("picofx.colour")
+    preview = Preview(effect_list, colour)
+
+    # Frames are ticked by the same whole milliseconds a player running at this rate would use
+    frames = round(args.duration * args.fps)
+    delta_ms = int(1000 / args.fps)
+    if args.output is not None:
+        shape = (frames,) + preview.new_frames(0).shape[1:]
+        out = np.lib.format.open_memmap(args.output, mode="w+", dtype=preview.new_frames(0).dtype, shape=shape)
+    else:
+        out = preview.new_frames(min(CHUNK, frames))
+
+    start = time.perf_counter()
+    for first in range(0, frames, CHUNK):
+        count = min(CHUNK, frames - first)
+        if args.output is not None:
+            preview.render(count, delta_ms, out=out[first:first + count])
+        else:
+            preview.render(count, delta_ms, out=out[:count])
+    seconds = time.perf_counter() - start
+
+    if args.output is not None:
+        out.flush()
+    print(f"Rendered {frames} frames of {args.leds} LEDs in {seconds:.2f}s", file=sys.stderr)
+    return 0
+
+
+sys.exit(main(parser.parse_args()))
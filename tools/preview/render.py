@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: 2026 Christopher Parrott for Pimoroni Ltd
+#
+# SPDX-License-Identifier: MIT
+
+"""
+A NumPy renderer for previewing shows of thousands of LEDs on the host. A
+Preview takes the same list of effects that a player's `effects` does, and
+renders many frames of it at once, as the frames that player would show.
+
+The cycling effects (waveforms, pulses, blinks, flashes and rainbows) are
+rendered with array operations over every LED and every frame together,
+taking their phases from `Cycling.phase_after()` and their colours from
+`rgb_from_hsv_into()`, so that each value matches what the board would show
+exactly. Any other effect is still ticked and called once per frame, as a
+player would.
+
+This imports picofx, so needs a `machine` module to be importable first.
+"""
+
+import numpy as np
+
+from picofx import PHASE_BITS, PHASE_MASK, PHASE_ONE, CyclingAction, parse_entry, rgb_from_hsv_into
+from picofx.colour import RainbowFX, RainbowWaveFX
+from picofx.mono import BlinkFX, BlinkWaveFX, FlashFX, FlashSequenceFX, WaveformFX, WaveformWaveFX
+from picofx.mono.waveform import LEVEL_TO_BRIGHTNESS
+
+DELTA_MS = 10
+
+# The colour of every hue, for each saturation and value that has been rendered
+_hue_tables = {}
+
+
+def phases(effect, delta_ms):
+    """
+    Returns the phase a cycling effect has after each of a number of ticks, starting from its current phase,
+    for ticks of the given milliseconds. `delta_ms` is an array of the time of each tick, and the effect is
+    left as it was.
+    """
+    return effect.phase_after(np.cumsum(np.asarray(delta_ms, dtype=np.int64)))
+
+
+def position_phases(wave, positions):
+    # The phase of each position along a wave, as a player binds them to render()
+    return np.trunc(np.asarray(positions, dtype=np.float64) * PHASE_ONE / wave.length).astype(np.int64)
+
+
+def sample(table, phase):
+    # Look up the levels at an array of integer phases, as wavetable.sample() does for one
+    table = np.asarray(table, dtype=np.int64)
+    size = len(table)
+    pos = (phase & PHASE_MASK) * size
+    i = pos >> PHASE_BITS
+    frac = (pos & PHASE_MASK) >> 8
+    a = table[i]
+    return a + (((table[(i + 1) % size] - a) * frac) >> 8)
+
+
+def rgb_from_hsv(h, s, v):
+    # Convert an array of 16-bit hues, with an 8-bit saturation and value, to the colours rgb_from_hsv_into() gives.
+    # Every hue is converted once into a table, which is then indexed. The result has an extra last axis of red,
+    # green and blue
+    table = _hue_tables.get((s, v))
+    if table is None:
+        buffer = bytearray(PHASE_ONE * 3)
+        for hue in range(PHASE_ONE):
+            rgb_from_hsv_into(buffer, hue * 3, hue, s, v)
+        table = np.frombuffer(buffer, dtype=np.uint8).reshape(PHASE_ONE, 3)
+        _hue_tables[(s, v)] = table
+    return table[np.asarray(h) & PHASE_MASK]
+
+
+# How each cycling effect turns its phases into values. Waves are given their phases either as a player's batched
+# render() gives them (`batched`), or as their at() does, which for some effects rounds slightly differently
+
+def _waveform(effect, phase, _batched):
+    return sample(effect.shape, phase) * LEVEL_TO_BRIGHTNESS
+
+
+def _blink(effect, phase, _batched):
+    return np.where((phase & PHASE_MASK) < effect.duty * PHASE_ONE, 1.0, 0.0)
+
+
+def _flash(effect, phase, batched):
+    offset = phase & PHASE_MASK
+    window = effect.window * PHASE_ONE
+    if window <= 0:
+        return np.zeros(np.shape(offset))
+    if batched:
+        percent = (offset * (effect.flashes / window)) % 1.0
+    else:
+        percent = ((offset * effect.flashes) / window) % 1.0
+    return np.where((offset < window) & (percent < effect.duty), 1.0, 0.0)
+
+
+def _rainbow(effect, phase, _batched):
+    return rgb_from_hsv(phase, int(effect.sat * 255), int(effect.val * 255))
+
+
+# The effects that can be rendered as arrays, with whether they have a `phase` of their own to offset by
+EFFECTS = {
+    WaveformFX: (_waveform, True),
+    WaveformWaveFX: (_waveform, True),
+    BlinkFX: (_blink, True),
+    BlinkWaveFX: (_blink, True),
+    FlashFX: (_flash, True),
+    FlashSequenceFX: (_flash, True),
+    RainbowFX: (_rainbow, False),
+    RainbowWaveFX: (_rainbow, False),
+}
+
+
+def _renderer(effect):
+    if isinstance(effect, CyclingAction):
+        return None
+    for cls in type(effect).__mro__:
+        if cls in EFFECTS:
+            return EFFECTS[cls]
+    return None
+
+
+class Preview:
+    """
+    Renders frames of a list of effects, as a MonoPlayer (or with `colour`, a ColourPlayer) given the same list would.
+
+    Like a player, rendering ticks the effects on, so each call to `render()` carries on from where the last left off.
+    """
+    def __init__(self, effect_list, colour=False):
+        self.colour = colour
+        self.num_leds = len(effect_list)
+        self.__plan(effect_list)
+
+    def __plan(self, effect_list):
+        slots = []
+        updateables = []
+        for i, item in enumerate(effect_list):
+            effect, data, updateable = parse_entry(item)
+            if updateable is not None and updateable not in updateables:
+                updateables.append(updateable)
+            if effect is not None:
+                slots.append((i, effect, data, updateable))
+
+        # Collect the runs of positions along the same wave that the player would render in batches
+        runs = []
+        for i, effect, data, updateable in slots:
+            if updateable is not None and len(data) == 1 and effect == getattr(updateable, "at", None):
+                run = runs[-1] if runs else None
+                if run is not None and run[0] is updateable and run[1] + len(run[2]) == i:
+                    run[2].append(data[0])
+                    continue
+                if getattr(updateable, "render_rgb" if self.colour else "render", None) is not None:
+                    runs.append((updateable, i, [data[0]]))
+                    continue
+            runs.append((None, i, (effect, data, updateable)))
+
+        # Each slot is rendered as an array when its effect can be, and nothing else uses the effect in a way that cannot
+        singles, positions, batches, calls = [], {}, [], []
+        for wave, start, rest in runs:
+            if wave is not None:
+                batches.append((wave, start, rest))
+                continue
+            effect, data, updateable = rest
+            if updateable is not None and _renderer(updateable) is not None:
+                if effect is updateable and not data:
+                    singles.append((updateable, start))
+                    continue
+                if len(data) == 1 and effect == updateable.at:
+                    positions.setdefault(updateable, []).append((start, data[0]))
+                    continue
+            calls.append((start, effect, data, updateable))
+
+        looped = {updateable for _, effect, data, updateable in calls if updateable is not None}
+        looped.update(u for u in updateables if _renderer(u) is None)
+
+        self.__singles = [(effect, start) for effect, start in singles if effect not in looped]
+        self.__positions = {wave: entries for wave, entries in positions.items() if wave not in looped}
+        self.__batches = [(wave, start, pos) for wave, start, pos in batches if wave not in looped]
+        self.__arrayed = [u for u in updateables if u not in looped]
+        self.__ticked = [u for u in updateables if u in looped]
+
+        # Anything left is called every frame, with slots that share a function and data only calling it once
+        self.__calls = {}
+        for start, effect, data, _ in calls:
+            self.__calls.setdefault((effect, data), []).append(start)
+        for effect, start in singles:
+            if effect in looped:
+                self.__calls.setdefault((effect, ()), []).append(start)
+        for wave, entries in positions.items():
+            if wave in looped:
+                for start, pos in entries:
+                    self.__calls.setdefault((wave.at, (pos,)), []).append(start)
+        self.__renders = []
+        for wave, start, pos in batches:
+            if wave in looped:
+                buffer = bytearray(len(pos) * 3) if self.colour else [0.0] * len(pos)
+                render = wave.render_rgb if self.colour else wave.render
+                self.__renders.append((render, wave.bind(pos), buffer, start))
+
+    def new_frames(self, frames):
+        # Return an array to hold the given number of frames, of brightnesses for mono, or of R, G, B bytes for colour
+        if self.colour:
+            return np.zeros((frames, self.num_leds, 3), dtype=np.uint8)
+        return np.zeros((frames, self.num_leds), dtype=np.float64)
+
+    def render(self, frames, delta_ms=DELTA_MS, out=None):
+        """
+        Renders the given number of frames, each ticking the effects by `delta_ms`, which can also be an array of
+        the time before each frame. The frames are returned in `out` if given, or otherwise in a new array.
+        """
+        deltas = np.broadcast_to(np.asarray(delta_ms, dtype=np.int64), (frames,))
+        out = self.new_frames(frames) if out is None else out
+
+        # The effects that are not arrays are ticked first, as a player ticks before it shows anything
+        self.__loop(out, deltas)
+
+        for effect in self.__arrayed:
+            self.__render_arrays(out, effect, phases(effect, deltas)[:, np.newaxis])
+
+        # Leave the effects as the last tick would have, which for a cycling effect is the same as one tick of all the time
+        elapsed = int(deltas.sum())
+        for effect in self.__arrayed:
+            effect.tick(elapsed)
+        return out
+
+    def __render_arrays(self, out, effect, phase):
+        value, phased = _renderer(effect)
+        offset = int(effect.phase * PHASE_ONE) if phased else 0
+
+        for single, start in self.__singles:
+            if single is effect:
+                self.__put(out, [start], value(effect, phase + offset, False))
+
+        for wave, start, pos in self.__batches:
+            if wave is effect:
+                values = value(effect, phase + offset + position_phases(effect, pos), True)
+                self.__put(out, slice(start, start + len(pos)), values)
+
+        entries = self.__positions.get(effect)
+        if entries:
+            slots = [start for start, _ in entries]
+            pos = [pos for _, pos in entries]
+            if phased:
+                # A wave's at() adds its phase before converting to an integer, rather than after
+                at = np.trunc((np.asarray(pos, dtype=np.float64) / effect.length + effect.phase) * PHASE_ONE).astype(np.int64)
+            else:
+                at = position_phases(effect, pos)
+            self.__put(out, slots, value(effect, phase + at, False))
+
+    def __put(self, out, slots, values):
+        # Mono values shown by a colour player become greys, as they do with ColourPlayer
+        if self.colour and values.ndim == 2:
+            values = np.trunc(values * 255).astype(np.uint8)[..., np.newaxis]
+        out[:, slots] = values
+
+    def __loop(self, out, deltas):
+        if not self.__ticked and not self.__calls:
+            return
+
+        colour = self.colour
+        for frame, delta_ms in zip(out, deltas.tolist(), strict=True):
+            for effect in self.__ticked:
+                effect.tick(delta_ms)
+
+            for (effect, data), slots in self.__calls.items():
+                value = effect(*data)
+                if colour and not isinstance(value, tuple):
+                    value = int(value * 255)
+                frame[slots] = value
+
+            for render, binding, buffer, start in self.__renders:
+                render(buffer, binding)
+                if colour:
+                    frame[start:start + len(buffer) // 3] = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 3)
+                else:
+                    frame[start:start + len(buffer)] = buffer